@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for EasyJet Deal Scraper hot paths
+Times entry point startup, driver startup, navigation, card extraction, deal
+validation, sorting, CSV saving and the web results view against local
+fixtures, writes the results as JSON and fails when a benchmark regresses
+against a baseline:
+
+    python benchmarks.py --save-baseline          # record benchmark_baseline.json
+    python benchmarks.py --threshold 0.25         # exit 1 if anything is >25% slower
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from config import DEFAULT_CONFIG
+from fixture_server import FixtureServer
+from synthetic_data import iter_deals
+
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_CARD_COUNTS = [20, 100]
+
+
+class SkipBenchmark(Exception):
+    """Raised when a benchmark can't run here (missing browser or package)"""
+
+
+def make_deals(count: int, seed: int = 0) -> List[Dict]:
+    """Deals with the same fields the scraper produces"""
+    return list(iter_deals(count, seed, start_date=datetime(2025, 1, 1)))
+
+
+class BenchmarkRunner:
+    """Times benchmark functions and collects their results"""
+
+    def __init__(self, repeat: int = 5):
+        self.repeat = repeat
+        self.results = {}
+
+    def measure(self, name: str, fn: Callable, items: int = 1, repeat: Optional[int] = None,
+                setup: Optional[Callable] = None):
+        """Run fn repeat times (after setup each time) and record min/median seconds"""
+        try:
+            timings = []
+            for _ in range(repeat or self.repeat):
+                if setup:
+                    setup()
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+        except SkipBenchmark as e:
+            self.results[name] = {'status': 'skipped', 'reason': str(e)}
+            print(f"  ⏭️  {name}: skipped ({str(e)})")
+            return
+
+        median = statistics.median(timings)
+        self.results[name] = {
+            'status': 'ok',
+            'median_s': median,
+            'min_s': min(timings),
+            'runs': len(timings),
+            'items': items,
+            'per_item_us': median / items * 1e6
+        }
+        print(f"  ⏱️  {name}: {median * 1000:.2f} ms median ({median / items * 1e6:.2f} µs/item)")
+
+    def skip(self, name: str, reason: str):
+        self.results[name] = {'status': 'skipped', 'reason': reason}
+        print(f"  ⏭️  {name}: skipped ({reason})")
+
+
+def load_scraper_class():
+    try:
+        from easyjet_scraper import EasyJetScraper
+    except ImportError as e:
+        raise SkipBenchmark(f"scraper dependencies not installed: {e.name}")
+    return EasyJetScraper
+
+
+def new_scraper(config_overrides: Dict = None):
+    EasyJetScraper = load_scraper_class()
+    config = DEFAULT_CONFIG.copy()
+    config.update({'timings_file': None, 'price_threshold': 100000, 'min_price': 0})
+    config.update(config_overrides or {})
+    return EasyJetScraper(config)
+
+
+def bench_browser(runner: BenchmarkRunner, server: FixtureServer, card_counts: List[int]):
+    """Driver startup, navigation and card extraction (need selenium and Chrome)"""
+    names = ['driver_startup', 'page_navigation'] + [f"card_extraction[{n}]" for n in card_counts]
+    try:
+        scraper = new_scraper({'base_url': server.url})
+        scraper.driver = scraper.create_driver()
+    except SkipBenchmark as e:
+        for name in names:
+            runner.skip(name, str(e))
+        return
+    except Exception as e:
+        for name in names:
+            runner.skip(name, f"Chrome unavailable: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+        return
+
+    try:
+        def start_and_quit():
+            scraper.create_driver().quit()
+        runner.measure('driver_startup', start_and_quit, repeat=3)
+
+        def navigate():
+            scraper.driver.get(scraper.holidays_url)
+            scraper.selectors.find_all(scraper.driver, 'card')
+        runner.measure('page_navigation', navigate)
+
+        departure = datetime(2025, 6, 1)
+        for count in card_counts:
+            scraper.driver.get(f"{scraper.holidays_url}?cards={count}")
+            cards = scraper.selectors.find_all(scraper.driver, 'card')
+
+            def extract_all():
+                for card in cards:
+                    scraper.extract_deal_info(card, 'BRS', departure, departure, 7)
+            runner.measure(f"card_extraction[{count}]", extract_all, items=len(cards))
+    finally:
+        scraper.close_driver()
+
+
+def bench_deal_processing(runner: BenchmarkRunner, sizes: List[int], workdir: str):
+    """is_valid_deal, sort_deals_by_price and save_to_csv at each size"""
+    try:
+        scraper = new_scraper()
+    except SkipBenchmark as e:
+        for size in sizes:
+            for name in ('is_valid_deal', 'sort_deals_by_price', 'save_to_csv'):
+                runner.skip(f"{name}[{size}]", str(e))
+        return
+
+    for size in sizes:
+        deals = make_deals(size)
+        runner.measure(f"is_valid_deal[{size}]", lambda: [scraper.is_valid_deal(deal) for deal in deals], items=size)
+        runner.measure(f"sort_deals_by_price[{size}]", lambda: scraper.sort_deals_by_price(deals), items=size)
+        path = os.path.join(workdir, f"save_{size}.csv")
+        runner.measure(f"save_to_csv[{size}]", lambda: scraper.save_to_csv(deals, path), items=size,
+                       repeat=min(runner.repeat, 3))
+
+
+def write_results_file(deals: List[Dict], path: str):
+    from config import CSV_HEADERS
+    from results_summary import write_results_csv
+    write_results_csv(deals, path, CSV_HEADERS)
+
+
+def bench_results_view(runner: BenchmarkRunner, sizes: List[int], workdir: str):
+    """Loading and querying results, plus the Flask results view and API when available"""
+    from results_store import ResultsStore, query_deals
+
+    try:
+        import web_gui
+        from job_manager import ScrapeJob, COMPLETED
+        client = web_gui.app.test_client()
+    except ImportError as e:
+        web_gui = None
+        web_skip_reason = f"web GUI dependencies not installed: {e.name}"
+
+    for size in sizes:
+        path = os.path.join(workdir, f"results_{size}.csv")
+        write_results_file(make_deals(size), path)
+
+        def cold_load():
+            ResultsStore().get(path)
+        runner.measure(f"results_load[{size}]", cold_load, items=size, repeat=min(runner.repeat, 3))
+
+        dataset = ResultsStore().get(path)
+        filters = {'min_price': 500, 'max_price': 1500, 'board_type': 'Half Board'}
+        runner.measure(f"deals_query[{size}]",
+                       lambda: query_deals(dataset, filters, sort='departure_date', descending=True, limit=25),
+                       items=size)
+
+        if web_gui is None:
+            runner.skip(f"results_view[{size}]", web_skip_reason)
+            runner.skip(f"api_deals[{size}]", web_skip_reason)
+            continue
+
+        job = ScrapeJob({'output_file': path})
+        job.update(state=COMPLETED, last_result=path)
+        web_gui.job_manager.jobs[job.id] = job
+        client.get(f"/api/deals?job={job.id}")  # Warm the dataset cache
+
+        def view():
+            assert client.get(f"/view_results?job={job.id}").status_code == 200
+        runner.measure(f"results_view[{size}]", view)
+
+        def api():
+            assert client.get(f"/api/deals?job={job.id}&sort=total_price&order=desc"
+                              f"&min_price=300&limit=50&offset=100").status_code == 200
+        runner.measure(f"api_deals[{size}]", api)
+
+
+def bench_startup(runner: BenchmarkRunner):
+    """Startup time of each entry point in a fresh interpreter"""
+    from startup_benchmark import ENTRY_POINTS, run_entry_point
+
+    for name, args in ENTRY_POINTS.items():
+        def start():
+            result = run_entry_point(args)[1]
+            if result.returncode != 0:
+                raise SkipBenchmark((result.stderr.strip().splitlines() or ['failed'])[-1])
+        runner.measure(f"startup[{name}]", start)
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Benchmarks whose median is more than threshold slower than the baseline"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if result.get('status') != 'ok' or not base or base.get('status') != 'ok':
+            continue
+        ratio = result['median_s'] / base['median_s'] if base['median_s'] else 1.0
+        result['baseline_median_s'] = base['median_s']
+        result['change'] = ratio - 1
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {base['median_s'] * 1000:.2f} ms -> "
+                               f"{result['median_s'] * 1000:.2f} ms ({ratio - 1:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scraper hot paths')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                       help='Numbers of deals for the data benchmarks')
+    parser.add_argument('--cards', type=int, nargs='+', default=DEFAULT_CARD_COUNTS,
+                       help='Cards per page for the extraction benchmark')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark (the median is reported)')
+    parser.add_argument('--only', nargs='+', choices=['startup', 'browser', 'deals', 'results'],
+                       help='Run only these groups')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write the results JSON')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                       help='Allowed slowdown against the baseline before failing (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    # Keep log output from distorting the timings
+    logging.disable(logging.WARNING)
+    groups = args.only or ['startup', 'browser', 'deals', 'results']
+    runner = BenchmarkRunner(args.repeat)
+
+    with tempfile.TemporaryDirectory() as workdir, FixtureServer() as server:
+        if 'startup' in groups:
+            print("🚀 Startup")
+            bench_startup(runner)
+        if 'browser' in groups:
+            print("🌐 Browser")
+            bench_browser(runner, server, args.cards)
+        if 'deals' in groups:
+            print("🧮 Deal processing")
+            bench_deal_processing(runner, args.sizes, workdir)
+        if 'results' in groups:
+            print("📊 Results view")
+            bench_results_view(runner, args.sizes, workdir)
+
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(runner.results, json.load(f).get('results', {}), args.threshold)
+
+    report = {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': runner.results,
+        'regressions': regressions
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"📌 Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"   {line}")
+        sys.exit(1)
+    elif os.path.exists(args.baseline):
+        print(f"✅ No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
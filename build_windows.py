@@ -204,7 +204,7 @@ echo http://localhost:8000
 echo.
 echo Press Ctrl+C to stop the server
 echo.
-python web_gui.py
+python web_gui.py --production
 pause
 """
     
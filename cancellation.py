@@ -0,0 +1,62 @@
+"""
+Cooperative cancellation for EasyJet Deal Scraper
+A token shared between the GUI/web thread that requests a stop and the
+scraper thread that checks it between searches, cards and sleeps
+"""
+
+import threading
+from typing import Callable
+
+
+class ScrapeCancelled(BaseException):
+    """Raised inside the scraper when a stop has been requested
+
+    Derives from BaseException (like asyncio.CancelledError) so the scraper's
+    per-search and per-card ``except Exception`` handlers don't swallow it.
+    """
+
+
+class CancellationToken:
+    """Thread-safe stop flag with interruptible waits and cancel callbacks"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called"""
+        return self._event.is_set()
+
+    def cancel(self):
+        """Request a stop and run the registered callbacks once"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass  # A failing callback must not stop the others
+
+    def on_cancel(self, callback: Callable):
+        """Register a callback to run when the token is cancelled (immediately if it already is)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        """Raise ScrapeCancelled if a stop has been requested"""
+        if self._event.is_set():
+            raise ScrapeCancelled()
+
+    def sleep(self, seconds: float):
+        """Sleep for up to ``seconds``, raising ScrapeCancelled as soon as a stop is requested"""
+        if self._event.wait(max(0, seconds)):
+            raise ScrapeCancelled()
@@ -14,12 +14,114 @@ DEFAULT_CONFIG = {
     'sort_by_price': True,  # Sort deals by lowest price first
     'max_deals_per_search': 50,  # Maximum deals to collect per search
     'price_threshold': 2000,  # Maximum price in GBP to consider
-    'min_price': 100  # Minimum price to avoid invalid deals
+    'min_price': 100,  # Minimum price to avoid invalid deals
+    'date_step_days': 1,  # Spacing between candidate departure dates
+    'min_window_gap_days': 3,  # Skip windows this close to one already planned
+    'max_searches': None,  # Total search budget for a run (None = no limit)
+    'time_budget_minutes': None,  # Time budget for a run (None = no limit)
+    'seconds_per_search': 15,  # Estimated time per search until timings_file has measurements
+    'default_searches_per_airport': 5,  # Searches per airport when no budget is given
+    'history_file': None,  # Previous results used to prioritise searches (None = output_file)
+    'search_mode': 'planned',  # 'planned' (ranked date windows), 'sweep' (coarse-to-fine) or 'calendar'
+    # Calendar mode reads one month calendar per month and duration first: with no max_searches or
+    # time_budget_minutes that is 7 months x 8 durations = 56 loads per airport with the defaults
+    'calendar_drilldown_days': None,  # Cheapest calendar days to load in full (None = search budget)
+    'timings_file': 'scraper_timings.json',  # Task timings kept for ETA and time budget estimates
+    'trace_dir': None,  # Directory for a Chrome trace-event file per run (None = tracing off)
+    'base_url': None,  # Site to scrape instead of EASYJET_BASE_URL, e.g. a local fixture_server.py
+    'logging': None,  # Overrides for LOGGING_CONFIG, applied by the first scraper in a process
+    'parse_workers': 0,  # Processes parsing results page HTML with lxml ('auto' = cores - 1, 0 = read cards in the browser)
+    'snapshot_dir': None,  # Archive the HTML of every results page here (None = no archive)
+    'snapshot_quota_mb': 1024,  # Least recently used pages are evicted beyond this size
+    'skip_unchanged_pages': True,  # Reuse last run's deals for windows whose result cards are unchanged
+    'fingerprint_file': None,  # Window fingerprints kept between runs (None = <output>.fingerprints.json)
+    'selector_profile': None,  # Selectors for page elements and card fields (None = SELECTOR_PROFILE)
+    'max_result_pages': 5,  # Result pages or infinite-scroll loads read per search (1 = first render only)
+    'more_results_timeout': 5,  # Seconds to wait for more cards after 'load more' or a next page
+    'results_page_size': 20,  # Infinite scroll is only tried after a batch of at least this many cards
+    'scroll_timeout': 2  # Seconds to wait for infinite scroll to append cards
+}
+
+# Web GUI job manager settings
+JOB_MANAGER_CONFIG = {
+    'max_concurrent_jobs': 2,  # Worker threads running scrapes at the same time
+    'max_queued_jobs': 10,  # Further submissions are rejected until the queue drains
+    'driver_pool_size': 2,  # Chrome instances shared by running jobs
+    'job_history': 50  # Finished jobs kept for /jobs
+}
+
+# Logging: records are queued and written by a background thread (see logging_setup.py)
+LOGGING_CONFIG = {
+    'level': 'INFO',
+    'levels': {  # Per-module levels, e.g. 'search_planner': 'DEBUG'
+        'selenium': 'WARNING',
+        'urllib3': 'WARNING',
+        'WDM': 'WARNING'
+    },
+    'log_file': 'scraper.log',  # None = no log file
+    'json': True,  # JSON lines in the log file, plain text otherwise
+    'max_bytes': 10 * 1024 * 1024,  # Rotate the log file at this size
+    'backup_count': 5,  # Rotated files kept as scraper.log.1.gz ... scraper.log.5.gz
+    'compress': True,
+    'console': True,
+    'console_level': None,  # None = same as the logger levels
+    'text_format': '%(asctime)s - %(levelname)s - %(message)s'
+}
+
+# Web GUI server settings for --production (waitress when installed)
+WEB_SERVER_CONFIG = {
+    'host': '0.0.0.0',
+    'port': 8000,
+    'threads': 16,
+    'connection_limit': 200,
+    'channel_timeout': 120,  # Seconds before an idle connection is closed
+    # Each open /stream connection occupies a worker thread, so at most this many
+    # (and never more than half the threads) are served; others poll /status instead
+    'max_streams': 6,
+    'stream_seconds': 300  # Streams end after this long; the browser reconnects from its last log id
+}
+
+# Front-end libraries: served from static/vendor/ once fetch_static_assets.py
+# has downloaded them, otherwise loaded from these CDN URLs
+WEB_ASSETS = {
+    'bootstrap.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css',
+    'bootstrap.bundle.min.js': 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js',
+    'jquery.min.js': 'https://code.jquery.com/jquery-3.6.0.min.js',
+    'dataTables.bootstrap5.min.css': 'https://cdn.datatables.net/1.11.5/css/dataTables.bootstrap5.min.css',
+    'jquery.dataTables.min.js': 'https://cdn.datatables.net/1.11.5/js/jquery.dataTables.min.js',
+    'dataTables.bootstrap5.min.js': 'https://cdn.datatables.net/1.11.5/js/dataTables.bootstrap5.min.js'
 }
 
 # EasyJet URLs and selectors
 EASYJET_BASE_URL = "https://www.easyjet.com"
-EASYJET_HOLIDAYS_URL = "https://www.easyjet.com/en/holidays"
+EASYJET_HOLIDAYS_PATH = "/en/holidays"
+EASYJET_HOLIDAYS_URL = EASYJET_BASE_URL + EASYJET_HOLIDAYS_PATH
+
+# Selectors for page elements and card fields (see selector_profile.py).
+# Each entry is a list tried in order until one matches; CSS by default,
+# XPath with an 'xpath:' prefix. Card fields are looked up inside a card, and
+# read an attribute instead of the text when given as {'selectors', 'attribute'}.
+SELECTOR_PROFILE = {
+    'cookie_button': ['#ensCloseBanner'],
+    'departure_input': ['#departure-airport'],
+    'card': ['.holiday-card'],
+    'sort_button': [
+        'button[data-sort="price"]',
+        "xpath://button[contains(text(), 'Price') or contains(text(), 'Sort')]"
+    ],
+    'calendar_day': ['.calendar-day'],
+    'calendar_price': ['.calendar-price'],
+    'load_more': ['button.load-more', "xpath://button[contains(text(), 'Show more')]"],  # Appends more cards
+    'next_page': ['a[rel="next"]', '.pagination .next'],  # Replaces the cards with the next page
+    'fields': {
+        'hotel_name': ['.hotel-name'],
+        'destination': ['.destination'],
+        'total_price': ['.price'],
+        'board_type': ['.board-type'],
+        'room_type': ['.room-type'],
+        'deal_url': {'selectors': ['a[href]'], 'attribute': 'href'}
+    }
+}
 
 # Airport codes mapping
 AIRPORT_CODES = {
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Coarse-to-fine date sweep for EasyJet Deal Scraper
+Samples the date range sparsely, then bisects around the cheapest windows
+until the request budget is spent
+"""
+
+import argparse
+import heapq
+import json
+import math
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from search_planner import parse_price
+
+
+def cheapest_price(deals: List[Dict]) -> float:
+    """Lowest total price in a list of deals, or infinity if there is none"""
+    prices = [parse_price(deal.get('total_price')) for deal in deals or []]
+    prices = [price for price in prices if price is not None]
+    return min(prices) if prices else float('inf')
+
+
+class CoarseToFineSweep:
+    """Bisection-style search over departure dates for each trip duration"""
+
+    def __init__(self, search_fn: Callable, search_dates: List[tuple], budget: int,
+                 coarse_fraction: float = 0.4, logger=None):
+        """search_fn(departure_date, return_date, duration) must return a list of deals"""
+        self.search_fn = search_fn
+        self.budget = max(0, int(budget))
+        self.coarse_fraction = coarse_fraction
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.windows = {}
+        for departure_date, return_date, duration in search_dates:
+            self.windows.setdefault(duration, {})[departure_date] = return_date
+        self.dates = {duration: sorted(dates) for duration, dates in self.windows.items()}
+        self.index = {duration: {date: i for i, date in enumerate(dates)}
+                      for duration, dates in self.dates.items()}
+
+        self.prices = {}
+        self.deals = []
+        self.requests_used = 0
+
+    def probe(self, duration: int, index: int) -> float:
+        """Search one window and record its cheapest price"""
+        departure_date = self.dates[duration][index]
+        key = (duration, index)
+        if key in self.prices:
+            return self.prices[key]
+
+        self.requests_used += 1
+        try:
+            deals = self.search_fn(departure_date, self.windows[duration][departure_date], duration)
+        except Exception as e:
+            self.logger.error(f"Sweep search failed for {departure_date:%Y-%m-%d} ({duration} days): {str(e)}")
+            deals = []
+
+        self.deals.extend(deals or [])
+        self.prices[key] = cheapest_price(deals)
+        return self.prices[key]
+
+    def coarse_indices(self, count: int) -> List[int]:
+        """Evenly spaced sample indices for the coarse pass, always including both ends"""
+        coarse_budget = max(1, int(self.budget * self.coarse_fraction) // max(1, len(self.dates)))
+        if coarse_budget == 1 or count == 1:
+            return [count // 2]
+
+        step = max(1, math.ceil((count - 1) / (coarse_budget - 1)))
+        indices = list(range(0, count, step))
+        if indices[-1] != count - 1:
+            indices.append(count - 1)
+        return indices
+
+    def run(self) -> List[Dict]:
+        """Run the sweep and return every deal found along the way"""
+        # Coarse pass: sparse samples for every duration, interleaved so a small
+        # budget still covers all durations
+        coarse = {duration: self.coarse_indices(len(dates)) for duration, dates in self.dates.items()}
+        for position in range(max((len(indices) for indices in coarse.values()), default=0)):
+            for duration, indices in coarse.items():
+                if self.requests_used >= self.budget:
+                    break
+                if position < len(indices):
+                    self.probe(duration, indices[position])
+
+        # Fine pass: repeatedly bisect the gap next to the cheapest known window,
+        # and try neighbouring durations of cheap windows
+        candidates = []
+        for duration, indices in coarse.items():
+            sampled = [i for i in indices if (duration, i) in self.prices]
+            bounds = [-1] + sampled + [len(self.dates[duration])]
+            for left, right in zip(bounds, bounds[1:]):
+                self.push_gap(candidates, duration, left, right)
+            for index in sampled:
+                self.push_neighbours(candidates, duration, index)
+
+        while candidates and self.requests_used < self.budget:
+            _, duration, left, right = heapq.heappop(candidates)
+            middle = (left + right) // 2
+            if (duration, middle) not in self.prices:
+                self.probe(duration, middle)
+                self.push_neighbours(candidates, duration, middle)
+            # Split the gap even when its middle was already searched (e.g. as a
+            # neighbouring duration), or the windows either side would be dropped
+            self.push_gap(candidates, duration, left, middle)
+            self.push_gap(candidates, duration, middle, right)
+
+        self.logger.info(f"Sweep finished after {self.requests_used} searches, "
+                         f"cheapest price £{self.best_price():.0f}")
+        return self.deals
+
+    def push_gap(self, candidates: list, duration: int, left: int, right: int):
+        """Queue the unexplored gap between two sampled windows, cheapest neighbour first"""
+        if right - left < 2:
+            return
+        ends = [self.prices[(duration, i)] for i in (left, right) if (duration, i) in self.prices]
+        priority = min(ends, default=float('inf'))
+        # Wider gaps first among equally cheap neighbours
+        heapq.heappush(candidates, ((priority, left - right), duration, left, right))
+
+    def push_neighbours(self, candidates: list, duration: int, index: int):
+        """Queue the same departure date with one day shorter and longer trips"""
+        departure_date = self.dates[duration][index]
+        for other in (duration - 1, duration + 1):
+            other_index = self.index.get(other, {}).get(departure_date)
+            if other_index is not None and (other, other_index) not in self.prices:
+                # Encoded as a one-window gap so the main loop probes exactly other_index
+                heapq.heappush(candidates, ((self.prices[(duration, index)], -1), other,
+                                            other_index - 1, other_index + 1))
+
+    def best_price(self) -> float:
+        """Cheapest price seen so far"""
+        return min(self.prices.values(), default=float('inf'))
+
+    def best_window(self) -> Optional[tuple]:
+        """(departure_date, duration) of the cheapest window seen so far"""
+        if not self.prices:
+            return None
+        duration, index = min(self.prices, key=self.prices.get)
+        return self.dates[duration][index], duration
+
+
+def load_price_calendar(filename: str) -> Dict[tuple, float]:
+    """Load a fixture calendar of {"YYYY-MM-DD": {"duration": price}} into {(date, duration): price}"""
+    with open(filename, encoding='utf-8') as f:
+        data = json.load(f)
+
+    calendar = {}
+    for date_str, durations in data['prices'].items():
+        departure_date = datetime.strptime(date_str, "%Y-%m-%d")
+        for duration, price in durations.items():
+            calendar[(departure_date, int(duration))] = price
+    return calendar
+
+
+def compare_with_exhaustive(calendar: Dict[tuple, float], budget: int) -> Dict:
+    """Run the sweep against a fixture calendar and compare it with searching every window"""
+    search_dates = [(departure_date, departure_date + timedelta(days=duration), duration)
+                    for departure_date, duration in sorted(calendar)]
+
+    def search_fn(departure_date, return_date, duration):
+        price = calendar.get((departure_date, duration))
+        return [] if price is None else [{'total_price': price}]
+
+    sweep = CoarseToFineSweep(search_fn, search_dates, budget)
+    sweep.run()
+
+    exhaustive_key = min(calendar, key=calendar.get)
+    best = sweep.best_window()
+    sweep_price = sweep.best_price()
+    exhaustive_price = calendar[exhaustive_key]
+
+    return {
+        'windows': len(search_dates),
+        'sweep_requests': sweep.requests_used,
+        'exhaustive_requests': len(search_dates),
+        'sweep_price': sweep_price,
+        'exhaustive_price': exhaustive_price,
+        'price_gap_pct': (sweep_price - exhaustive_price) / exhaustive_price * 100,
+        'sweep_window': (best[0].strftime("%Y-%m-%d"), best[1]) if best else None,
+        'exhaustive_window': (exhaustive_key[0].strftime("%Y-%m-%d"), exhaustive_key[1])
+    }
+
+
+def main():
+    """Print a sweep vs exhaustive comparison for a fixture price calendar"""
+    parser = argparse.ArgumentParser(description='Compare the coarse-to-fine sweep with an exhaustive search')
+    parser.add_argument('--fixture', default='fixtures/price_calendar.json',
+                       help='Price calendar fixture (JSON)')
+    parser.add_argument('--budget', type=int, nargs='+', default=[40, 80, 160],
+                       help='Request budgets to evaluate')
+    args = parser.parse_args()
+    if min(args.budget) < 1:
+        parser.error('--budget values must be at least 1 (a sweep with no searches finds no window)')
+
+    calendar = load_price_calendar(args.fixture)
+
+    print(f"Fixture: {args.fixture} ({len(calendar)} windows)")
+    print(f"{'Budget':>8} {'Requests':>9} {'Sweep £':>9} {'Best £':>9} {'Gap':>7}  Sweep window")
+    for budget in args.budget:
+        report = compare_with_exhaustive(calendar, budget)
+        window = report['sweep_window']
+        print(f"{budget:>8} {report['sweep_requests']:>9} {report['sweep_price']:>9.0f} "
+              f"{report['exhaustive_price']:>9.0f} {report['price_gap_pct']:>6.1f}%  "
+              f"{window[0]} ({window[1]} days)")
+    print(f"Exhaustive sweep: {len(calendar)} requests, cheapest "
+          f"{report['exhaustive_window'][0]} ({report['exhaustive_window'][1]} days)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,83 +3,134 @@ EasyJet Holiday Deals Scraper
 Scrapes holiday packages (flights + hotels) from EasyJet website
 """
 
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
 import time
-import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional
 import json
+import logging
 import os
-from config import DEFAULT_CONFIG, AIRPORT_CODES, CSV_HEADERS, EASYJET_HOLIDAYS_URL
+from config import DEFAULT_CONFIG, AIRPORT_CODES, CSV_HEADERS, EASYJET_HOLIDAYS_URL, EASYJET_HOLIDAYS_PATH
+from search_planner import SearchPlanner, enumerate_search_dates, parse_price
+from date_sweep import CoarseToFineSweep
+from cancellation import CancellationToken, ScrapeCancelled
+from progress import ProgressTracker, DEFAULT_TIMINGS_FILE
+from results_summary import write_results_csv, summary_path, format_price
+import metrics
+from tracing import Tracer, traced
+from logging_setup import configure_logging, instance_logger
+from lazy_imports import lazy_import, is_available
+from html_parser import ParserPool, PriceCeiling, price_value, record_to_deal, validate_deal
+from snapshot_archive import SnapshotArchive
+from page_fingerprints import PageFingerprints, fingerprint, fingerprints_path, window_key
+from selector_profile import FIELDS, SelectorStats, compile_profile
+import threading
+
+# outerHTML of the card elements passed in, in one round trip
+CARDS_OUTER_HTML_SCRIPT = "return arguments[0].map(function (card) { return card.outerHTML; }).join('\\n');"
+
+# Selenium and webdriver-manager are only imported once a browser is needed
+webdriver = lazy_import('selenium.webdriver')
+WebDriverWait = lazy_import('selenium.webdriver.support.ui', 'WebDriverWait')
+Options = lazy_import('selenium.webdriver.chrome.options', 'Options')
+Service = lazy_import('selenium.webdriver.chrome.service', 'Service')
+ChromeDriverManager = lazy_import('webdriver_manager.chrome', 'ChromeDriverManager')
+
+# Paths tried for chromedriver before falling back to webdriver-manager
+CHROMEDRIVER_PATHS = [
+    '/usr/bin/chromedriver',
+    '/usr/lib/chromium-browser/chromedriver',
+    '/snap/bin/chromium.chromedriver'
+]
+
+
+def create_chrome_driver(logger=None):
+    """Create a headless Chrome WebDriver, shared by EasyJetScraper and the web GUI's driver pool"""
+    logger = logger or logging.getLogger(__name__)
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # Run in background
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-plugins')
+    chrome_options.add_argument('--disable-images')
+    chrome_options.add_argument('--disable-javascript')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    
+    for driver_path in CHROMEDRIVER_PATHS:
+        try:
+            service = Service(driver_path)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            logger.info(f"Chrome WebDriver initialized with {driver_path}")
+            return driver
+        except Exception as e:
+            logger.debug(f"Failed to use {driver_path}: {str(e)}")
+            continue
+    
+    # Fallback to webdriver manager
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    logger.info("Chrome WebDriver initialized with webdriver-manager")
+    return driver
+
 
 class EasyJetScraper:
-    def __init__(self, config: Dict = None):
-        """Initialize the scraper with configuration"""
+    def __init__(self, config: Dict = None, cancel_token: CancellationToken = None, driver_pool=None):
+        """Initialize the scraper with configuration, an optional cancellation token
+        and an optional shared DriverPool"""
         self.config = config or DEFAULT_CONFIG
         self.setup_logging()
+        # Page elements and card fields come from the selector profile, validated here at startup
+        self.selectors = compile_profile(self.config.get('selector_profile'))
+        self.selector_stats = SelectorStats()
+        # outerHTML of every result card in one round trip, for fingerprinting
+        self.cards_script = self.selectors.cards_script()
+        self.new_cards_script = self.selectors.new_cards_script()
+        self.card_count_script = self.selectors.card_count_script()
         self.driver = None
+        self.driver_pool = driver_pool
+        self.driver_lock = threading.Lock()
         self.deals = []
+        self.search_plan = {}
+        self.cancel_token = cancel_token or CancellationToken()
+        # base_url points the scraper at another site, e.g. a local fixture_server.py
+        base_url = self.config.get('base_url')
+        self.holidays_url = base_url.rstrip('/') + EASYJET_HOLIDAYS_PATH if base_url else EASYJET_HOLIDAYS_URL
+        # Subscribe to scraper.progress for structured progress events
+        self.progress = ProgressTracker(
+            self.config.get('timings_file', DEFAULT_TIMINGS_FILE),
+            self.config.get('seconds_per_search', 15) + self.config.get('delay_between_requests', 2)
+        )
+        # Spans for search_deals, searches, form filling and parsing when trace_dir is set
+        self.tracer = Tracer(enabled=bool(self.config.get('trace_dir')))
+        # With parse_workers, result pages are parsed from their HTML in worker processes
+        self.parser_pool = None
+        self.pending_parses = []
+        # With snapshot_dir, the HTML of every results page is archived for re-extraction
+        self.archive = None
+        self.run_id = None
+        # With skip_unchanged_pages, windows whose result cards match the last run reuse its deals
+        self.page_fingerprints = None
+        # Quit the browser straight away on stop so in-flight page loads are interrupted
+        self.cancel_token.on_cancel(
+            lambda: threading.Thread(target=self.close_driver, daemon=True).start()
+        )
         
     def setup_logging(self):
-        """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('scraper.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        """Setup queued logging once per process and a logger for this scraper"""
+        configure_logging(self.config.get('logging'))
+        self.logger = instance_logger(__name__, airports=','.join(self.config.get('departure_airports', [])))
         
     def setup_driver(self):
-        """Setup Chrome WebDriver with options"""
+        """Setup Chrome WebDriver, taking one from the shared pool if there is one"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')  # Run in background
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
-            chrome_options.add_argument('--disable-javascript')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-            
-            # Try different chromedriver paths
-            driver_paths = [
-                '/usr/bin/chromedriver',
-                '/usr/lib/chromium-browser/chromedriver',
-                '/snap/bin/chromium.chromedriver'
-            ]
-            
-            driver_initialized = False
-            for driver_path in driver_paths:
-                try:
-                    service = Service(driver_path)
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                    self.logger.info(f"Chrome WebDriver initialized with {driver_path}")
-                    driver_initialized = True
-                    break
-                except Exception as e:
-                    self.logger.debug(f"Failed to use {driver_path}: {str(e)}")
-                    continue
-            
-            if not driver_initialized:
-                # Fallback to webdriver manager
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                self.logger.info("Chrome WebDriver initialized with webdriver-manager")
+            with metrics.DRIVER_STARTUP_SECONDS.time(source='pool' if self.driver_pool else 'new'):
+                if self.driver_pool:
+                    self.driver = self.driver_pool.acquire(self.cancel_token)
+                    self.logger.info("Chrome WebDriver taken from the shared driver pool")
+                else:
+                    self.driver = self.create_driver()
             
         except Exception as e:
             self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
@@ -87,30 +138,82 @@ class EasyJetScraper:
             self.create_demo_csv()
             raise
             
+    def create_driver(self):
+        """Create a new Chrome WebDriver with options"""
+        return create_chrome_driver(self.logger)
+            
     def close_driver(self):
-        """Close the WebDriver"""
-        if self.driver:
-            self.driver.quit()
-            self.logger.info("WebDriver closed")
+        """Close the WebDriver (safe to call more than once and from another thread)"""
+        with self.driver_lock:
+            driver, self.driver = self.driver, None
+        if driver and self.driver_pool:
+            # A cancelled run may have left the browser mid-page, so don't reuse it
+            self.driver_pool.release(driver, reusable=not self.cancel_token.cancelled)
+            self.logger.info("WebDriver returned to the shared driver pool")
+        elif driver:
+            try:
+                driver.quit()
+                self.logger.info("WebDriver closed")
+            except Exception as e:
+                self.logger.debug(f"Error closing WebDriver: {str(e)}")
+            
+    def sleep(self, seconds: float):
+        """Sleep that ends early with ScrapeCancelled when a stop is requested"""
+        start = time.perf_counter()
+        try:
+            self.cancel_token.sleep(seconds)
+        finally:
+            metrics.SLEEP_SECONDS.inc(time.perf_counter() - start)
+        
+    def wait_for(self, condition, timeout: float, element: str = 'element'):
+        """WebDriverWait.until that gives up as soon as a stop is requested"""
+        def cancellable_condition(driver):
+            self.cancel_token.raise_if_cancelled()
+            return condition(driver)
+        
+        start = time.perf_counter()
+        outcome = 'timeout'
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(cancellable_condition)
+            outcome = 'found'
+            return result
+        except ScrapeCancelled:
+            outcome = 'cancelled'
+            raise
+        finally:
+            metrics.WAIT_SECONDS.observe(time.perf_counter() - start, element=element, outcome=outcome)
+            
+    def element_present(self, name: str):
+        """Wait condition: the first element matching the profile's selectors for name"""
+        return lambda driver: self.selectors.find(driver, name)
+        
+    def element_clickable(self, name: str):
+        """Wait condition: the profile element, once it is visible and enabled"""
+        def condition(driver):
+            element = self.selectors.find(driver, name)
+            return element if element is not None and element.is_displayed() and element.is_enabled() else None
+        return condition
+        
+    def require_element(self, name: str):
+        """The profile element name on the current page, recording which selector matched"""
+        element = self.selectors.find(self.driver, name, self.selector_stats)
+        if element is None:
+            raise ValueError(f"No {name} on the page (selectors: "
+                             f"{', '.join(s.text for s in self.selectors.group(name).selectors)})")
+        return element
             
     def get_search_dates(self) -> List[tuple]:
-        """Generate search date ranges for the next few months"""
-        search_dates = []
-        today = datetime.now()
-        
-        for month_offset in range(self.config['search_months_ahead']):
-            # Start from next month
-            search_date = today + timedelta(days=30 * (month_offset + 1))
-            
-            # Generate date ranges for 7-14 day trips
-            for duration in range(self.config['min_duration'], self.config['max_duration'] + 1):
-                departure_date = search_date
-                return_date = departure_date + timedelta(days=duration)
-                search_dates.append((departure_date, return_date, duration))
-                
-        return search_dates
+        """Generate every search date range in the configured months ahead"""
+        return enumerate_search_dates(self.config)
+        
+    def plan_searches(self) -> Dict[str, List[tuple]]:
+        """Prioritise the search space and fit it to the configured budget"""
+        planner = SearchPlanner(self.config, self.logger)
+        self.search_plan = planner.plan(self.get_search_dates())
+        return self.search_plan
         
-    def search_deals(self, departure_airport: str) -> List[Dict]:
+    @traced('search_deals', 'departure_airport')
+    def search_deals(self, departure_airport: str, search_dates: List[tuple] = None) -> List[Dict]:
         """Search for holiday deals from a specific departure airport"""
         deals = []
         airport_code = AIRPORT_CODES.get(departure_airport)
@@ -123,41 +226,223 @@ class EasyJetScraper:
         
         try:
             # Navigate to EasyJet holidays page
-            self.driver.get(EASYJET_HOLIDAYS_URL)
-            time.sleep(3)
+            with self.tracer.span('navigate', url=self.holidays_url):
+                with metrics.PAGE_LOAD_SECONDS.time(page='holidays'):
+                    self.driver.get(self.holidays_url)
+                self.sleep(3)
             
             # Accept cookies if present
-            try:
-                cookie_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "ensCloseBanner"))
-                )
-                cookie_button.click()
-                time.sleep(1)
-            except:
-                pass  # Cookie banner might not be present
+            with self.tracer.span('cookie_banner') as span:
+                try:
+                    cookie_button = self.wait_for(self.element_clickable('cookie_button'), 5,
+                                                  element='cookie_banner')
+                    cookie_button.click()
+                    self.sleep(1)
+                    span['accepted'] = True
+                except Exception:
+                    span['accepted'] = False  # Cookie banner might not be present
                 
-            search_dates = self.get_search_dates()
+            if self.config.get('search_mode') == 'sweep':
+                deals.extend(self.sweep_search_dates(airport_code))
+                return deals
             
-            for departure_date, return_date, duration in search_dates[:5]:  # Limit for demo
-                try:
-                    deal_data = self.search_specific_dates(
-                        airport_code, departure_date, return_date, duration
-                    )
-                    if deal_data:
-                        deals.extend(deal_data)
-                        
-                    # Add delay between searches
-                    time.sleep(self.config['delay_between_requests'])
-                    
-                except Exception as e:
-                    self.logger.error(f"Error searching dates {departure_date} - {return_date}: {str(e)}")
-                    continue
+            if self.config.get('search_mode') == 'calendar':
+                deals.extend(self.calendar_search_dates(airport_code))
+                return deals
+            
+            if search_dates is None:
+                search_dates = self.search_plan.get(departure_airport)
+            if search_dates is None:
+                search_dates = self.plan_searches().get(departure_airport, [])
+            
+            for departure_date, return_date, duration in search_dates:
+                deals.extend(self.run_date_search(airport_code, departure_date, return_date, duration))
                     
         except Exception as e:
             self.logger.error(f"Error searching deals from {departure_airport}: {str(e)}")
+            metrics.ERRORS.inc(airport=airport_code, stage='navigate')
             
         return deals
         
+    def run_date_search(self, airport_code: str, departure_date: datetime,
+                        return_date: datetime, duration: int) -> List[Dict]:
+        """Run one date search followed by the polite delay between requests"""
+        self.cancel_token.raise_if_cancelled()
+        with self.progress.task(kind='search', airport_code=airport_code,
+                                departure_date=departure_date.strftime("%Y-%m-%d"),
+                                duration=duration) as task:
+            try:
+                deal_data = self.search_specific_dates(
+                    airport_code, departure_date, return_date, duration
+                ) or []
+                # Keep a running total so a cancelled run can still save what it found
+                self.deals.extend(deal_data)
+                task['deals'] = len(deal_data)
+                metrics.SEARCHES.inc(airport=airport_code, outcome='failed' if task['error'] else 'ok')
+                
+                # Add delay between searches
+                self.sleep(self.config['delay_between_requests'])
+                return deal_data
+                
+            except Exception as e:
+                self.logger.error(f"Error searching dates {departure_date} - {return_date}: {str(e)}")
+                task['error'] = str(e)
+                metrics.SEARCHES.inc(airport=airport_code, outcome='failed')
+                metrics.ERRORS.inc(airport=airport_code, stage='search')
+                return []
+            
+    def sweep_budget(self) -> int:
+        """Number of searches per airport for the coarse-to-fine sweep"""
+        airports = max(1, len(self.config['departure_airports']))
+        budget = SearchPlanner(self.config, self.logger).request_budget(airports)
+        if budget is None:
+            return len(self.get_search_dates())
+        return max(1, budget // airports)
+        
+    def sweep_search_dates(self, airport_code: str) -> List[Dict]:
+        """Sample the date range sparsely, then refine around the cheapest windows"""
+        sweep = CoarseToFineSweep(
+            lambda departure_date, return_date, duration: self.run_date_search(
+                airport_code, departure_date, return_date, duration),
+            self.get_search_dates(),
+            self.sweep_budget(),
+            logger=self.logger
+        )
+        return sweep.run()
+        
+    def calendar_plan(self) -> tuple:
+        """(month calendars to read, number of cheapest days to load in full) per airport
+        
+        Month calendar loads count against max_searches and time_budget_minutes
+        like any other search, so the drilldowns get whatever they leave over.
+        A budget too small for every calendar reads fewer months, keeping up to
+        half of it (and always at least one search) for drilldowns. Without a
+        budget every month calendar is read: months x durations loads per airport.
+        """
+        months = self.calendar_months()
+        drilldowns = self.config.get('calendar_drilldown_days')
+        if not (self.config.get('max_searches') or self.config.get('time_budget_minutes')):
+            return months, drilldowns or self.config.get('default_searches_per_airport') or 5
+        
+        airports = max(1, len(self.config['departure_airports']))
+        budget = max(1, SearchPlanner(self.config, self.logger).request_budget(airports) // airports)
+        reserved = max(1, min(drilldowns or self.config.get('default_searches_per_airport') or 5, budget // 2))
+        months = months[:budget - reserved]
+        remaining = budget - len(months)
+        return months, min(drilldowns, remaining) if drilldowns else remaining
+        
+    def calendar_months(self) -> List[tuple]:
+        """(month_start, duration) pairs covering the search period for calendar mode"""
+        search_dates = self.get_search_dates()
+        months = sorted({departure_date.replace(day=1) for departure_date, _, _ in search_dates})
+        durations = sorted({duration for _, _, duration in search_dates})
+        return [(month_start, duration) for month_start in months for duration in durations]
+        
+    def estimate_task_count(self, departure_airport: str) -> int:
+        """Number of page loads expected for an airport in the configured search mode"""
+        if departure_airport not in AIRPORT_CODES:
+            return 0
+        mode = self.config.get('search_mode', 'planned')
+        if mode == 'sweep':
+            return self.sweep_budget()
+        if mode == 'calendar':
+            months, drilldowns = self.calendar_plan()
+            return len(months) + drilldowns
+        return len(self.search_plan.get(departure_airport, []))
+        
+    def calendar_search_dates(self, airport_code: str) -> List[Dict]:
+        """Read month calendars for cheap days, then load full results only for the cheapest"""
+        windows = {(departure_date, duration): return_date
+                   for departure_date, return_date, duration in self.get_search_dates()}
+        
+        months, drilldowns = self.calendar_plan()
+        skipped = len(self.calendar_months()) - len(months)
+        if skipped:
+            self.logger.warning(f"Search budget only covers {len(months)} month calendars, skipping the last {skipped}")
+        
+        # One page load per month and duration gives the lowest price for every day
+        day_prices = []
+        for month_start, duration in months:
+            self.cancel_token.raise_if_cancelled()
+            with self.progress.task(kind='calendar', airport_code=airport_code,
+                                    month=month_start.strftime("%Y-%m"), duration=duration):
+                calendar = self.search_month_calendar(airport_code, month_start, duration)
+                for departure_date, price in calendar.items():
+                    if (departure_date, duration) in windows:
+                        day_prices.append((price, departure_date, duration))
+                self.sleep(self.config['delay_between_requests'])
+        
+        planner = SearchPlanner(self.config, self.logger)
+        
+        candidates = [(departure_date, duration) for _, departure_date, duration in sorted(day_prices)]
+        if not candidates and drilldowns:
+            # No calendar was read (a budget of one search) or none had prices
+            self.logger.warning("No calendar prices, loading full results for the earliest windows instead")
+            candidates = [(departure_date, duration) for departure_date, _, duration in self.get_search_dates()]
+        
+        cheapest = []
+        for departure_date, duration in candidates:
+            if len(cheapest) >= drilldowns:
+                break
+            task = (departure_date, windows[(departure_date, duration)], duration)
+            if not planner.is_overlapping(task, cheapest):
+                cheapest.append(task)
+        
+        self.logger.info(f"Calendar found prices for {len(day_prices)} days, "
+                         f"loading full results for the cheapest {len(cheapest)}")
+        
+        deals = []
+        for departure_date, return_date, duration in cheapest:
+            deals.extend(self.run_date_search(airport_code, departure_date, return_date, duration))
+        return deals
+        
+    @traced('search_month_calendar', 'airport_code', 'month_start', 'duration')
+    def search_month_calendar(self, airport_code: str, month_start: datetime, duration: int) -> Dict[datetime, float]:
+        """Collect the lowest price for each departure day of a month from the flexible-date view"""
+        day_prices = {}
+        
+        try:
+            self.fill_calendar_form(airport_code, month_start, duration)
+            
+            self.wait_for(self.element_present('calendar_day'), 10, element='calendar_day')
+            
+            for day in self.selectors.find_all(self.driver, 'calendar_day', self.selector_stats):
+                try:
+                    departure_date = datetime.strptime(day.get_attribute("data-date"), "%Y-%m-%d")
+                    price_element = self.selectors.find(day, 'calendar_price', self.selector_stats)
+                    price = parse_price(price_element.text) if price_element is not None else None
+                    if price is not None:
+                        day_prices[departure_date] = price
+                except Exception:
+                    continue  # Days without availability have no price
+                    
+            self.logger.info(f"Calendar {month_start.strftime('%b %Y')} ({duration} days): "
+                             f"{len(day_prices)} days with prices")
+            
+        except Exception as e:
+            self.logger.error(f"Error reading month calendar: {str(e)}")
+            self.progress.fail_current(str(e))
+            metrics.ERRORS.inc(airport=airport_code, stage='calendar')
+            
+        return day_prices
+        
+    def fill_calendar_form(self, airport_code: str, month_start: datetime, duration: int):
+        """Fill in the search form for a flexible-date month search"""
+        try:
+            departure_input = self.require_element('departure_input')
+            departure_input.clear()
+            departure_input.send_keys(airport_code)
+            self.sleep(1)
+            
+            # Note: Actual implementation would need to switch EasyJet's date picker
+            # to its flexible dates / whole month view
+            self.logger.info(f"Searching month calendar: {month_start.strftime('%B %Y')}, {duration} days")
+            
+        except Exception as e:
+            self.logger.error(f"Error filling calendar form: {str(e)}")
+            raise
+            
+    @traced('search_specific_dates', 'airport_code', 'departure_date', 'return_date', 'duration')
     def search_specific_dates(self, airport_code: str, departure_date: datetime, 
                             return_date: datetime, duration: int) -> List[Dict]:
         """Search for deals on specific dates"""
@@ -168,26 +453,28 @@ class EasyJetScraper:
             self.fill_search_form(airport_code, departure_date, return_date)
             
             # Wait for results to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "holiday-card"))
-            )
+            with self.tracer.span('wait_for_results'):
+                self.wait_for(self.element_present('card'), 10, element='holiday_card')
             
             # Parse results
             deals = self.parse_search_results(airport_code, departure_date, return_date, duration)
             
         except Exception as e:
             self.logger.error(f"Error in specific date search: {str(e)}")
+            self.progress.fail_current(str(e))
+            metrics.ERRORS.inc(airport=airport_code, stage='results')
             
         return deals
         
+    @traced('fill_search_form', 'airport_code', 'departure_date', 'return_date')
     def fill_search_form(self, airport_code: str, departure_date: datetime, return_date: datetime):
         """Fill in the search form with specified parameters"""
         try:
             # Select departure airport
-            departure_input = self.driver.find_element(By.ID, "departure-airport")
+            departure_input = self.require_element('departure_input')
             departure_input.clear()
             departure_input.send_keys(airport_code)
-            time.sleep(1)
+            self.sleep(1)
             
             # Select dates (this would need to be adapted based on actual EasyJet form structure)
             departure_date_str = departure_date.strftime("%d/%m/%Y")
@@ -200,70 +487,322 @@ class EasyJetScraper:
             self.logger.error(f"Error filling search form: {str(e)}")
             raise
             
+    def fingerprint_window(self, airport_code: str, departure_date: datetime,
+                           return_date: datetime, duration: int) -> Optional[tuple]:
+        """(window key, fingerprint of the result cards), or None when fingerprinting is off or fails"""
+        if not self.page_fingerprints:
+            return None
+        try:
+            with self.tracer.span('fingerprint'):
+                cards_html = self.driver.execute_script(self.cards_script)
+        except Exception as e:
+            self.logger.debug(f"Could not fingerprint results: {str(e)}")
+            return None
+        if not cards_html:
+            return None
+        return window_key(airport_code, departure_date, return_date, duration), fingerprint(cards_html)
+        
+    def remember_window(self, window: Optional[tuple], deals: List[Dict]):
+        if window and self.page_fingerprints:
+            self.page_fingerprints.remember(*window, deals)
+            
+    @traced('parse_search_results', 'airport_code', 'departure_date', 'duration')
     def parse_search_results(self, airport_code: str, departure_date: datetime, 
                            return_date: datetime, duration: int) -> List[Dict]:
-        """Parse search results and extract deal information"""
+        """Parse search results and extract deal information
+        
+        With skip_unchanged_pages, the sorted first render is fingerprinted and the
+        previous run's deals are reused when it hasn't changed.
+        """
         deals = []
+        window = None
         
         try:
             # Try to sort by price first
-            try:
-                sort_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Price') or contains(text(), 'Sort')]")
-                sort_button.click()
-                time.sleep(2)
-                self.logger.info("Sorted results by price")
-            except:
-                self.logger.debug("Could not find price sort button")
+            with self.tracer.span('sort_results') as span:
+                sort_button = self.selectors.find(self.driver, 'sort_button', self.selector_stats)
+                span['sorted'] = False
+                if sort_button is None:
+                    self.logger.debug("Could not find price sort button")
+                else:
+                    try:
+                        sort_button.click()
+                        self.sleep(2)
+                        span['sorted'] = True
+                        self.logger.info("Sorted results by price")
+                    except ScrapeCancelled:
+                        raise
+                    except Exception as e:
+                        self.logger.debug(f"Could not sort results by price: {str(e)}")
             
-            # Find all holiday cards/results
-            holiday_cards = self.driver.find_elements(By.CLASS_NAME, "holiday-card")
-            max_deals = min(len(holiday_cards), self.config.get('max_deals_per_search', 50))
+            # Reuse the previous run's deals if the sorted result cards haven't changed
+            window = self.fingerprint_window(airport_code, departure_date, return_date, duration)
+            if window:
+                reused = self.page_fingerprints.lookup(*window)
+                metrics.PAGE_FINGERPRINTS.inc(outcome='changed' if reused is None else 'unchanged')
+                if reused is not None:
+                    self.logger.info(f"Results unchanged since the last run, reusing {len(reused)} deals")
+                    if self.archive:
+                        # This run's archive still needs the page, or --reparse would miss the window
+                        self.archive_page(airport_code, departure_date, return_date, duration)
+                    return reused
             
-            self.logger.info(f"Found {len(holiday_cards)} deals, processing {max_deals}")
+            # Results are read a batch at a time: the first render, then each further
+            # page or infinite-scroll load, stopping once enough cards have been read
+            max_deals = self.config.get('max_deals_per_search', 50)
+            # Sorted by price, every card after one above the price threshold is too
+            ceiling = PriceCeiling(self.config.get('price_threshold', 2000)) if span['sorted'] else None
+            archive_current_page = None
+            if self.archive:
+                def archive_current_page():
+                    self.archive_page(airport_code, departure_date, return_date, duration)
             
-            for i, card in enumerate(holiday_cards[:max_deals]):
-                try:
-                    deal = self.extract_deal_info(card, airport_code, departure_date, return_date, duration)
-                    if deal and self.is_valid_deal(deal):
-                        deals.append(deal)
-                        if i % 10 == 0:  # Log progress every 10 deals
-                            self.logger.info(f"Processed {i+1}/{max_deals} deals")
-                except Exception as e:
-                    self.logger.error(f"Error extracting deal info from card {i+1}: {str(e)}")
-                    continue
+            cards_html = []
+            processed = loads = 0
+            stop_reason = 'no_more_results'
+            for cards in self.result_batches(archive_current_page):
+                loads += 1
+                cards = cards[:max_deals - processed]
+                if not cards:
+                    stop_reason = 'max_deals'
+                    break
+                processed += len(cards)
+                if self.parser_pool:
+                    # Only the new cards' HTML leaves the browser; workers parse them all at once below
+                    with self.tracer.span('cards_html'):
+                        cards_html.append(self.driver.execute_script(CARDS_OUTER_HTML_SCRIPT, cards))
+                    reached_ceiling = ceiling is not None and any(
+                        [ceiling.reached(self.card_price(card)) for card in (cards[0], cards[-1])])
+                else:
+                    metrics.CARDS_FOUND.inc(len(cards), airport=airport_code)
+                    reached_ceiling = self.read_cards(cards, processed - len(cards), deals, ceiling,
+                                                      airport_code, departure_date, return_date, duration)
+                if reached_ceiling:
+                    stop_reason = 'price_ceiling'
+                    break
+                if processed >= max_deals:
+                    stop_reason = 'max_deals'
+                    break
+            
+            self.logger.info(f"Read {processed} cards from {loads} result loads (stopped: {stop_reason})")
+            self.tracer.annotate(cards=processed, loads=loads, stopped=stop_reason)
+            if loads > 1:
+                window = None  # The fingerprint only covers the first load's cards
+            if archive_current_page:
+                archive_current_page()
+            if self.parser_pool and cards_html:
+                return self.parse_page_source('\n'.join(cards_html), airport_code, departure_date,
+                                              return_date, duration, window)
                     
         except Exception as e:
             self.logger.error(f"Error parsing search results: {str(e)}")
+            metrics.ERRORS.inc(airport=airport_code, stage='parse')
+            window = None  # Partial results are not reused
             
+        self.tracer.annotate(deals=len(deals))
+        
         # Sort deals by price if enabled
         if self.config.get('sort_by_price', True) and deals:
             deals = self.sort_deals_by_price(deals)
             self.logger.info(f"Sorted {len(deals)} deals by price (lowest first)")
             
+        self.remember_window(window, deals)
+        return deals
+        
+    def read_cards(self, cards: List, offset: int, deals: List[Dict], ceiling: Optional[PriceCeiling],
+                   airport_code: str, departure_date: datetime, return_date: datetime, duration: int) -> bool:
+        """Extract and validate cards into deals; True once the price ceiling is reached"""
+        for i, card in enumerate(cards, offset):
+            self.cancel_token.raise_if_cancelled()
+            try:
+                with metrics.CARD_EXTRACTION_SECONDS.time():
+                    deal = self.extract_deal_info(card, airport_code, departure_date, return_date, duration)
+                if deal and self.is_valid_deal(deal):
+                    metrics.DEALS.inc(airport=airport_code, outcome='validated')
+                    deals.append(deal)
+                    if i % 10 == 0:  # Log progress every 10 deals
+                        self.logger.debug(f"Processed {i+1} deals")
+                elif deal:
+                    metrics.DEALS.inc(airport=airport_code, outcome='rejected')
+                if deal and ceiling is not None and ceiling.reached(price_value(deal['total_price'])):
+                    return True
+            except Exception as e:
+                self.logger.error(f"Error extracting deal info from card {i+1}: {str(e)}")
+                metrics.ERRORS.inc(airport=airport_code, stage='extract')
+        return False
+        
+    def card_price(self, card) -> Optional[float]:
+        return price_value(self.selectors.field_value(card, 'total_price'))
+        
+    def result_batches(self, before_next_page=None):
+        """Cards added to the results since the previous batch, loading more between batches
+        
+        Yields the first render's cards, then the cards each infinite-scroll load or
+        'load more' click appended, or each next page's cards, up to max_result_pages
+        batches. Cards already read are never fetched from the browser again.
+        before_next_page is called before a next-page click replaces the cards.
+        Scrolling is only tried after a batch of at least results_page_size cards,
+        since a shorter batch means the results have run out.
+        """
+        max_loads = max(1, self.config.get('max_result_pages') or 1)
+        page_size = self.config.get('results_page_size') or 1
+        card_group = self.selectors.group('card')
+        read = batch = 0
+        for load in range(max_loads):
+            if load:
+                appended = self.load_more_results(read, before_next_page, scroll=batch >= page_size)
+                if appended is None:
+                    return
+                if not appended:
+                    read = 0  # A new page: its cards start from the top
+            with self.tracer.span('new_cards'):
+                matched, total, cards = self.driver.execute_script(self.new_cards_script, read)
+            self.selector_stats.record(card_group, matched if matched >= 0 else None)
+            read = total
+            if not cards:
+                return
+            batch = len(cards)
+            yield cards
+            
+    def load_more_results(self, read: int, before_next_page=None, scroll: bool = True) -> Optional[bool]:
+        """Load further results: click 'load more', else follow the next page, else scroll down
+        
+        Returns True when cards were appended after the read ones, False when the
+        next page replaced them, and None when no more results appeared in time
+        (or there was nothing to click and scroll is False).
+        """
+        # load_more and next_page are optional on a page, so their misses aren't counted
+        button = self.selectors.find(self.driver, 'load_more')
+        next_link = None if button is not None else self.selectors.find(self.driver, 'next_page')
+        if button is None and next_link is None and not scroll:
+            return None
+        
+        with self.tracer.span('load_more_results') as span:
+            if next_link is not None:
+                span['action'] = 'next_page'
+                if before_next_page:
+                    before_next_page()
+                first_card = self.selectors.find(self.driver, 'card')
+                next_link.click()
+                
+                def loaded(driver):
+                    card = self.selectors.find(driver, 'card')
+                    return card is not None and card != first_card
+            else:
+                if button is not None:
+                    span['action'] = 'load_more'
+                    button.click()
+                else:
+                    span['action'] = 'scroll'
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    
+                def loaded(driver):
+                    return driver.execute_script(self.card_count_script) > read
+                
+            # Infinite scroll appends quickly or not at all, so it gets a shorter wait
+            timeout = self.config.get('scroll_timeout', 2) if span['action'] == 'scroll' else \
+                self.config.get('more_results_timeout', 5)
+            try:
+                self.wait_for(loaded, timeout, element='more_results')
+                outcome = 'loaded'
+            except ScrapeCancelled:
+                raise
+            except Exception:
+                outcome = 'none'
+            span['outcome'] = outcome
+            metrics.RESULT_LOADS.inc(action=span['action'], outcome=outcome)
+            
+        if outcome == 'none':
+            return None
+        return span['action'] != 'next_page'
+        
+    def archive_page(self, airport_code: str, departure_date: datetime, return_date: datetime, duration: int):
+        """Store the current results page in the snapshot archive (failures are logged, not raised)"""
+        try:
+            with self.tracer.span('page_source'):
+                page_html = self.driver.page_source
+            with self.tracer.span('archive_page'):
+                self.archive.store(page_html, airport_code, departure_date, return_date, duration,
+                                   url=self.driver.current_url, run_id=self.run_id)
+        except Exception as e:
+            self.logger.warning(f"Could not archive results page: {str(e)}")
+            metrics.ERRORS.inc(airport=airport_code, stage='archive')
+        
+    def parse_page_source(self, page_html: str, airport_code: str, departure_date: datetime,
+                          return_date: datetime, duration: int, window: tuple = None) -> List[Dict]:
+        """Hand results HTML (a page, or the result cards read from it) to the parser pool
+        
+        Sweep mode needs each search's prices to choose the next one, so it
+        waits for the result; otherwise parsing continues in the background
+        while the browser moves on, and collect_parsed_deals gathers the deals.
+        """
+        context = {
+            'departure_airport': [k for k, v in AIRPORT_CODES.items() if v == airport_code][0],
+            'departure_date': departure_date.strftime("%Y-%m-%d"),
+            'return_date': return_date.strftime("%Y-%m-%d"),
+            'duration': duration,
+            'scraped_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'page_url': self.driver.current_url,
+            'max_deals': self.config.get('max_deals_per_search', 50),
+            'min_price': self.config.get('min_price', 100),
+            'max_price': self.config.get('price_threshold', 2000),
+            'sort_by_price': self.config.get('sort_by_price', True)
+        }
+        future = self.parser_pool.submit(page_html, context)
+        
+        if self.config.get('search_mode') == 'sweep':
+            deals = self.parsed_deals(future.result(), airport_code)
+            self.remember_window(window, deals)
+            return deals
+        # The search's task finishes before its deals are parsed; they are credited to it later
+        self.pending_parses.append((future, airport_code, window, self.progress.defer_current()))
+        return []
+        
+    def parsed_deals(self, result: Dict, airport_code: str) -> List[Dict]:
+        """Deal dicts from a parser pool result, recording its metrics"""
+        metrics.CARDS_FOUND.inc(result['cards'], airport=airport_code)
+        self.selector_stats.merge(self.selectors, result['selector_hits'])
+        metrics.DEALS.inc(len(result['records']), airport=airport_code, outcome='validated')
+        metrics.DEALS.inc(result['rejected'], airport=airport_code, outcome='rejected')
+        if result['errors']:
+            metrics.ERRORS.inc(result['errors'], airport=airport_code, stage='extract')
+        self.logger.info(f"Parsed {result['cards']} deals, kept {len(result['records'])} "
+                         f"({result['parse_seconds'] * 1000:.0f} ms)")
+        return [record_to_deal(record) for record in result['records']]
+        
+    def collect_parsed_deals(self) -> List[Dict]:
+        """Wait for pages still being parsed and return their deals"""
+        deals = []
+        pending, self.pending_parses = self.pending_parses, []
+        for future, airport_code, window, task in pending:
+            try:
+                page_deals = self.parsed_deals(future.result(), airport_code)
+                self.remember_window(window, page_deals)
+                deals.extend(page_deals)
+                self.progress.add_deals(len(page_deals), task=task)
+            except Exception as e:
+                self.logger.error(f"Error parsing results page: {str(e)}")
+                metrics.ERRORS.inc(airport=airport_code, stage='parse')
+        self.deals.extend(deals)
         return deals
         
+    @traced('extract_deal_info', 'airport_code')
     def extract_deal_info(self, card_element, airport_code: str, departure_date: datetime, 
                          return_date: datetime, duration: int) -> Optional[Dict]:
         """Extract deal information from a holiday card element"""
         try:
-            # Extract hotel name
-            hotel_name = card_element.find_element(By.CLASS_NAME, "hotel-name").text
-            
-            # Extract destination
-            destination = card_element.find_element(By.CLASS_NAME, "destination").text
-            
-            # Extract price
-            price_element = card_element.find_element(By.CLASS_NAME, "price")
-            total_price = price_element.text.replace('£', '').replace(',', '')
-            
-            # Extract board type
-            board_type = card_element.find_element(By.CLASS_NAME, "board-type").text
-            
-            # Extract room type
-            room_type = card_element.find_element(By.CLASS_NAME, "room-type").text
-            
-            # Get deal URL
-            deal_url = card_element.find_element(By.TAG_NAME, "a").get_attribute("href")
+            # Read each field with the first profile selector that matches
+            fields = {}
+            for name in FIELDS:
+                fields[name] = self.selectors.field_value(card_element, name, self.selector_stats)
+                if fields[name] is None:
+                    raise ValueError(f"card has no {name}")
+            hotel_name = fields['hotel_name']
+            destination = fields['destination']
+            total_price = fields['total_price'].replace('£', '').replace(',', '')
+            board_type = fields['board_type']
+            room_type = fields['room_type']
+            deal_url = fields['deal_url']
             
             # Calculate price per person (assuming 2 people)
             try:
@@ -290,16 +829,29 @@ class EasyJetScraper:
             
         except Exception as e:
             self.logger.error(f"Error extracting deal info: {str(e)}")
+            metrics.ERRORS.inc(airport=airport_code, stage='extract')
             return None
             
     def scrape_all_airports(self) -> List[Dict]:
         """Scrape deals from all configured departure airports"""
         all_deals = []
+        if self.config.get('search_mode', 'planned') == 'planned':
+            self.plan_searches()
+        
+        planned = {airport: self.estimate_task_count(airport) for airport in self.config['departure_airports']}
+        for airport, count in planned.items():
+            self.progress.plan(count, airport=airport)
         
         for airport in self.config['departure_airports']:
+            self.cancel_token.raise_if_cancelled()
             self.logger.info(f"Starting scrape for {airport}")
-            airport_deals = self.search_deals(airport)
+            tasks_before = self.progress.completed + self.progress.failed
+            airport_deals = self.search_deals(airport, self.search_plan.get(airport, []))
+            airport_deals.extend(self.collect_parsed_deals())
             all_deals.extend(airport_deals)
+            # Unused sweep budget, fewer calendar drilldowns or an airport that failed early
+            tasks_run = self.progress.completed + self.progress.failed - tasks_before
+            self.progress.skip(planned[airport] - tasks_run, airport=airport)
             self.logger.info(f"Found {len(airport_deals)} deals from {airport}")
             
         return all_deals
@@ -436,8 +988,7 @@ class EasyJetScraper:
         
         filename = self.config['output_file']
         try:
-            df = pd.DataFrame(filtered_deals)
-            df.to_csv(filename, index=False)
+            write_results_csv(filtered_deals, filename, CSV_HEADERS)
             self.logger.info(f"Created demo CSV with {len(filtered_deals)} sample deals (filtered from {len(demo_deals)} total): {filename}")
             self.logger.info(f"Price range applied: £{min_price}-£{max_price}")
             self.logger.info("Note: This is demo data since web scraping failed. Real scraping requires proper browser setup.")
@@ -446,32 +997,7 @@ class EasyJetScraper:
 
     def is_valid_deal(self, deal: Dict) -> bool:
         """Check if a deal meets the criteria"""
-        try:
-            # Extract numeric price from string
-            price_str = str(deal.get('total_price', '0')).replace('£', '').replace(',', '')
-            try:
-                price = float(price_str)
-            except:
-                return False
-                
-            min_price = self.config.get('min_price', 100)
-            max_price = self.config.get('price_threshold', 2000)
-            
-            # Check price range
-            if price < min_price or price > max_price:
-                return False
-                
-            # Check required fields
-            required_fields = ['hotel_name', 'destination', 'departure_date']
-            for field in required_fields:
-                if not deal.get(field):
-                    return False
-                    
-            return True
-            
-        except Exception as e:
-            self.logger.debug(f"Error validating deal: {str(e)}")
-            return False
+        return validate_deal(deal, self.config.get('min_price', 100), self.config.get('price_threshold', 2000))
     
     def sort_deals_by_price(self, deals: List[Dict]) -> List[Dict]:
         """Sort deals by price (lowest first)"""
@@ -493,17 +1019,27 @@ class EasyJetScraper:
         filename = filename or self.config['output_file']
         
         try:
-            df = pd.DataFrame(deals)
-            df.to_csv(filename, index=False)
+            summary = write_results_csv(deals, filename, CSV_HEADERS)
             self.logger.info(f"Saved {len(deals)} deals to {filename}")
+            self.logger.info(f"Summary: {summary['destination_count']} destinations, "
+                             f"{format_price(summary['min_price'])} - {format_price(summary['max_price'])} "
+                             f"({summary_path(filename)})")
             
         except Exception as e:
             self.logger.error(f"Error saving to CSV: {str(e)}")
             
     def run(self):
         """Main method to run the scraper"""
+        self.deals = []
+        self.progress.reset()
+        self.selector_stats = SelectorStats()
+        self.tracer.reset()
         try:
             self.logger.info("Starting EasyJet Deal Scraper")
+            self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.setup_parser_pool()
+            self.setup_snapshot_archive()
+            self.setup_page_fingerprints()
             self.setup_driver()
             
             # Scrape deals from all airports
@@ -516,11 +1052,104 @@ class EasyJetScraper:
             else:
                 self.logger.warning("No deals found")
                 
+        except (ScrapeCancelled, KeyboardInterrupt):
+            self.cancel_token.cancel()
+            # Pages already loaded are still worth parsing
+            self.collect_parsed_deals()
+            self.logger.warning(f"Scraping stopped by user after finding {len(self.deals)} deals")
+            # Flush whatever was found before the stop
+            if self.deals:
+                self.save_to_csv(self.deals)
+                
         except Exception as e:
             self.logger.error(f"Error in main scraper run: {str(e)}")
             
         finally:
             self.close_driver()
+            self.close_parser_pool()
+            self.close_snapshot_archive()
+            self.save_page_fingerprints()
+            self.log_selector_stats()
+            self.progress.finish(deals=len(self.deals), cancelled=self.cancel_token.cancelled)
+            self.save_trace()
+            
+    def setup_parser_pool(self):
+        """Start the parser processes when parse_workers is set"""
+        workers = self.config.get('parse_workers')
+        if not workers or self.parser_pool:
+            return
+        if not is_available('lxml'):
+            self.logger.warning("parse_workers needs lxml; reading result cards through the browser instead")
+            return
+        self.parser_pool = ParserPool(None if workers == 'auto' else int(workers),
+                                      self.config.get('selector_profile'))
+        self.pending_parses = []
+        self.logger.info(f"Parsing results pages in {self.parser_pool.workers} worker processes")
+        
+    def close_parser_pool(self):
+        if self.parser_pool:
+            self.parser_pool.close(wait=False)
+            self.parser_pool = None
+            
+    def setup_snapshot_archive(self):
+        """Open the results-page archive when snapshot_dir is set"""
+        if not self.config.get('snapshot_dir') or self.archive:
+            return
+        quota_mb = self.config.get('snapshot_quota_mb')
+        self.archive = SnapshotArchive(self.config['snapshot_dir'],
+                                       int(quota_mb * 1024 * 1024) if quota_mb else None)
+        self.logger.info(f"Archiving results pages to {self.config['snapshot_dir']} ({self.archive.encoding})")
+        
+    def close_snapshot_archive(self):
+        if self.archive:
+            self.archive.close()
+            self.archive = None
+            
+    def setup_page_fingerprints(self):
+        """Load the previous run's window fingerprints when skip_unchanged_pages is on"""
+        if not self.config.get('skip_unchanged_pages'):
+            self.page_fingerprints = None
+            return
+        settings = {
+            'max_deals_per_search': self.config.get('max_deals_per_search', 50),
+            'min_price': self.config.get('min_price', 100),
+            'price_threshold': self.config.get('price_threshold', 2000),
+            'sort_by_price': self.config.get('sort_by_price', True),
+            'max_result_pages': self.config.get('max_result_pages', 1),
+            'selector_profile': self.selectors.digest
+        }
+        filename = self.config.get('fingerprint_file') or fingerprints_path(self.config['output_file'])
+        self.page_fingerprints = PageFingerprints(filename, settings)
+        
+    def save_page_fingerprints(self):
+        if not self.page_fingerprints:
+            return
+        fingerprints = self.page_fingerprints
+        if fingerprints.hits or fingerprints.misses:
+            self.logger.info(f"Unchanged result pages reused: {fingerprints.hits} of "
+                             f"{fingerprints.hits + fingerprints.misses}")
+        try:
+            fingerprints.save()
+        except OSError as e:
+            self.logger.error(f"Error saving page fingerprints: {str(e)}")
+            
+    def log_selector_stats(self):
+        """Log profile entries that needed fallback selectors, warning about ones that matched nothing"""
+        for line, matched_nothing in self.selector_stats.report(self.selectors):
+            if matched_nothing:
+                self.logger.warning(f"No selector matched - {line}")
+            else:
+                self.logger.info(f"Selector hit rates - {line}")
+            
+    def save_trace(self):
+        """Write this run's spans to trace_dir as a Chrome trace-event file"""
+        if not self.tracer.enabled:
+            return
+        try:
+            trace_file = self.tracer.save(self.config['trace_dir'])
+            self.logger.info(f"Trace written to {trace_file} (open in chrome://tracing or ui.perfetto.dev)")
+        except OSError as e:
+            self.logger.error(f"Error writing trace: {str(e)}")
 
 def main():
     """Main function to run the scraper"""
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Download the web GUI's front-end libraries into static/vendor/
+Once present they are served locally instead of from the CDNs, so the web
+interface works offline and doesn't depend on third-party hosts
+"""
+
+import argparse
+import os
+import sys
+import urllib.request
+
+from config import WEB_ASSETS
+
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'vendor')
+
+
+def fetch_assets(force: bool = False) -> bool:
+    """Download every asset in WEB_ASSETS that isn't already present"""
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    ok = True
+
+    for name, url in WEB_ASSETS.items():
+        target = os.path.join(VENDOR_DIR, name)
+        if os.path.exists(target) and not force:
+            print(f"✓ {name} (already present)")
+            continue
+
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                data = response.read()
+            with open(target + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(target + '.tmp', target)
+            print(f"✅ {name} ({len(data) // 1024} KB)")
+        except Exception as e:
+            print(f"❌ {name}: {str(e)}")
+            ok = False
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Download web GUI assets for local serving')
+    parser.add_argument('--force', action='store_true', help='Download again even if already present')
+    args = parser.parse_args()
+
+    print(f"📦 Fetching web assets into {VENDOR_DIR}")
+    if not fetch_assets(args.force):
+        print("Some assets could not be downloaded; the web GUI will use the CDN for those")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
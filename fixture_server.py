@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the EasyJet holidays site
+Serves recorded pages, or generates holiday search pages with the markup the
+scraper expects, with configurable latency and failure rates so the scraper
+can be tested and benchmarked offline:
+
+    python fixture_server.py --port 8765 --latency-ms 200 --failure-rate 0.05
+    python run_scraper.py --base-url http://localhost:8765 --max-searches 5
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from synthetic_data import DealGenerator, render_results_page
+
+
+def render_search_page(seed: str, cards: int, today: Optional[datetime] = None, next_url: str = None) -> str:
+    """Generated search page; deal links point back at this server"""
+    today = today or datetime.now()
+    generator = iter(DealGenerator(seed, start_date=today + timedelta(days=1), days_ahead=180, base_url=''))
+    deals = [next(generator) for _ in range(cards)]
+    return render_results_page(deals, random.Random(seed), today + timedelta(days=1), next_url)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves recorded pages from pages_dir, else generated search pages"""
+
+    server_version = 'EasyJetFixture/1.0'
+
+    def do_GET(self):
+        settings = self.server.settings
+        if settings['latency_ms'] or settings['jitter_ms']:
+            time.sleep(max(0.0, settings['latency_ms'] + random.uniform(-1, 1) * settings['jitter_ms']) / 1000)
+
+        if random.random() < settings['failure_rate']:
+            self.send_page(503, '<html><body><h1>Service temporarily unavailable</h1></body></html>')
+            return
+
+        url = urlsplit(self.path)
+        path = url.path
+        recorded = self.recorded_page(path)
+        if recorded is not None:
+            self.send_page(200, recorded)
+        elif path.rstrip('/') in ('', '/en/holidays', '/holidays/search') or path.startswith('/holidays/deal/'):
+            # Same URL and seed give the same page, so runs are repeatable; ?cards=N overrides the card count
+            query = parse_qs(url.query)
+            cards = query.get('cards', [settings['cards']])[0]
+            try:
+                cards = max(0, int(cards))
+            except ValueError:
+                cards = settings['cards']
+            # Results are split over result_pages pages, linked with ?page=N
+            try:
+                page = max(1, int(query.get('page', ['1'])[0]))
+            except ValueError:
+                page = 1
+            next_url = None
+            if page < settings['result_pages']:
+                next_url = f"{path}?{urlencode(dict(query, page=[str(page + 1)]), doseq=True)}"
+            self.send_page(200, render_search_page(f"{settings['seed']}:{self.path}", cards, next_url=next_url))
+        else:
+            self.send_page(404, '<html><body><h1>Not found</h1></body></html>')
+
+    def recorded_page(self, path: str) -> Optional[str]:
+        """Recorded HTML for a path: pages_dir/<path>.html or pages_dir/<path>/index.html"""
+        pages_dir = self.server.settings['pages_dir']
+        if not pages_dir:
+            return None
+        relative = os.path.normpath(path.strip('/') or 'index')
+        if relative.startswith('..'):
+            return None
+        for candidate in (os.path.join(pages_dir, relative + '.html'), os.path.join(pages_dir, relative, 'index.html')):
+            if os.path.isfile(candidate):
+                with open(candidate, encoding='utf-8') as f:
+                    return f.read()
+        return None
+
+    def send_page(self, status: int, body: str):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.settings['verbose']:
+            super().log_message(format, *args)
+
+
+class FixtureServer:
+    """Fixture site running on a background thread (port 0 picks a free port)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, cards: int = 20, latency_ms: float = 0,
+                 jitter_ms: float = 0, failure_rate: float = 0.0, pages_dir: str = None,
+                 seed: int = 0, verbose: bool = False, result_pages: int = 1):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.settings = {
+            'cards': cards,
+            'latency_ms': latency_ms,
+            'jitter_ms': jitter_ms,
+            'failure_rate': failure_rate,
+            'pages_dir': pages_dir,
+            'seed': seed,
+            'verbose': verbose,
+            'result_pages': result_pages
+        }
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FixtureServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True, name='fixture-server')
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve offline EasyJet holiday pages for testing and benchmarks')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--cards', type=int, default=20, help='Holiday cards per generated results page')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random +/- variation of the delay')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--pages-dir', default=None,
+                       help='Directory of recorded pages to replay (e.g. en/holidays.html)')
+    parser.add_argument('--result-pages', type=int, default=1,
+                       help='Pages each search spreads its results over, linked by a next-page link')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for generated pages')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    server = FixtureServer(args.host, args.port, args.cards, args.latency_ms, args.jitter_ms,
+                           args.failure_rate, args.pages_dir, args.seed, args.verbose, args.result_pages)
+    print(f"🧪 Fixture site on {server.url}/en/holidays "
+          f"({args.cards} cards, {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, {args.failure_rate:.0%} failures)")
+    print(f"   Run the scraper with: python run_scraper.py --base-url {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,14 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import os
-import pandas as pd
 from datetime import datetime
 import queue
 import sys
 
 from easyjet_scraper import EasyJetScraper
+from cancellation import CancellationToken
+from progress import format_eta
+from results_summary import load_summary, format_price
 from config import DEFAULT_CONFIG, AIRPORT_CODES
 
 class ScraperGUI:
@@ -33,6 +35,7 @@ class ScraperGUI:
         # Variables
         self.scraper_thread = None
         self.is_running = False
+        self.cancel_token = None
         
         self.setup_ui()
         self.load_defaults()
@@ -130,7 +133,7 @@ class ScraperGUI:
         self.progress_var = tk.StringVar(value="Ready")
         ttk.Label(main_frame, textvariable=self.progress_var).grid(row=6, column=0, columnspan=3, sticky=tk.W)
         
-        self.progress_bar = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(main_frame, mode='determinate', maximum=100)
         self.progress_bar.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 15))
         
         # Log area
@@ -249,7 +252,7 @@ class ScraperGUI:
         self.is_running = True
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
-        self.progress_bar.start()
+        self.progress_bar['value'] = 0
         self.progress_var.set("Starting scraper...")
         
         # Clear log
@@ -269,15 +272,16 @@ class ScraperGUI:
         self.log_message("")
         
         # Start scraper in separate thread
-        self.scraper_thread = threading.Thread(target=self.run_scraper, args=(config,))
+        self.cancel_token = CancellationToken()
+        self.scraper_thread = threading.Thread(target=self.run_scraper, args=(config, self.cancel_token))
         self.scraper_thread.daemon = True
         self.scraper_thread.start()
     
-    def run_scraper(self, config):
+    def run_scraper(self, config, cancel_token):
         """Run the scraper in a separate thread"""
         try:
             # Create custom scraper with GUI logging
-            scraper = EasyJetScraper(config)
+            scraper = EasyJetScraper(config, cancel_token)
             
             # Override logger to send messages to GUI
             original_info = scraper.logger.info
@@ -300,10 +304,20 @@ class ScraperGUI:
             scraper.logger.error = gui_error
             scraper.logger.warning = gui_warning
             
+            # Forward structured progress to the GUI thread
+            def gui_progress(event):
+                if event['type'] != 'task_started':
+                    self.log_queue.put(('PROGRESS', event['progress']))
+            
+            scraper.progress.subscribe(gui_progress)
+            
             # Run scraper
             scraper.run()
             
-            self.log_queue.put(('SUCCESS', f"Scraping completed! Results saved to: {config['output_file']}"))
+            if cancel_token.cancelled:
+                self.log_queue.put(('STOPPED', f"Scraping stopped. Partial results: {len(scraper.deals)} deals"))
+            else:
+                self.log_queue.put(('SUCCESS', f"Scraping completed! Results saved to: {config['output_file']}"))
             
         except Exception as e:
             self.log_queue.put(('ERROR', f"Scraping failed: {str(e)}"))
@@ -313,15 +327,13 @@ class ScraperGUI:
     
     def stop_scraping(self):
         """Stop the scraping process"""
-        self.is_running = False
-        self.progress_bar.stop()
+        if self.cancel_token:
+            self.cancel_token.cancel()
         self.progress_var.set("Stopping...")
         self.log_message("Stop requested by user")
         
-        # Reset UI state
-        self.start_button.config(state=tk.NORMAL)
+        # UI state is reset when the scraper thread reports FINISHED
         self.stop_button.config(state=tk.DISABLED)
-        self.progress_var.set("Stopped")
     
     def check_log_queue(self):
         """Check for log messages from scraper thread"""
@@ -334,7 +346,11 @@ class ScraperGUI:
                     self.progress_bar.stop()
                     self.start_button.config(state=tk.NORMAL)
                     self.stop_button.config(state=tk.DISABLED)
-                    self.progress_var.set("Completed")
+                    self.progress_var.set("Stopped" if self.cancel_token and self.cancel_token.cancelled else "Completed")
+                elif level == 'STOPPED':
+                    self.log_message(message, 'warning')
+                elif level == 'PROGRESS':
+                    self.update_progress(message)
                 elif level == 'SUCCESS':
                     self.log_message(message, 'success')
                     self.progress_var.set("Completed successfully!")
@@ -351,6 +367,15 @@ class ScraperGUI:
         # Schedule next check
         self.root.after(100, self.check_log_queue)
     
+    def update_progress(self, progress):
+        """Show a progress snapshot from the scraper in the progress bar"""
+        self.progress_bar['value'] = progress['percent']
+        done = progress['completed'] + progress['failed']
+        status = f"Searching: {done}/{progress['planned']} searches, {progress['deals_found']} deals found"
+        if progress['remaining']:
+            status += f", about {format_eta(progress['eta_seconds'])} left"
+        self.progress_var.set(status)
+    
     def log_message(self, message, level='info'):
         """Add message to log area"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -403,15 +428,16 @@ class ScraperGUI:
             self.log_message(f"Opened results file: {output_file}")
             
         except Exception as e:
-            # Fallback: show file info
+            # Fallback: show the precomputed summary
             try:
-                df = pd.read_csv(output_file)
+                summary = load_summary(output_file)
+                destinations = list(summary['destinations'])
                 info = f"Results file: {output_file}\n"
-                info += f"Total deals: {len(df)}\n"
-                info += f"Price range: £{df['total_price'].str.replace('£', '').str.replace(',', '').astype(float).min():.0f} - £{df['total_price'].str.replace('£', '').str.replace(',', '').astype(float).max():.0f}\n"
-                info += f"Destinations: {', '.join(df['destination'].unique()[:5])}"
-                if len(df['destination'].unique()) > 5:
-                    info += f" and {len(df['destination'].unique()) - 5} more"
+                info += f"Total deals: {summary['deals']}\n"
+                info += f"Price range: {format_price(summary['min_price'])} - {format_price(summary['max_price'])}\n"
+                info += f"Destinations: {', '.join(destinations[:5])}"
+                if len(destinations) > 5:
+                    info += f" and {len(destinations) - 5} more"
                 
                 messagebox.showinfo("Results Summary", info)
                 
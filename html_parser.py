@@ -0,0 +1,182 @@
+"""
+Results-page parsing for EasyJet Deal Scraper
+Parses a results page's HTML with lxml, extracts and validates its holiday
+cards and returns compact records. A ParserPool runs this in worker
+processes so parsing scales with cores while the browser keeps navigating.
+Cards and fields are found with the selector profile (selector_profile.py).
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urljoin
+
+from config import CSV_HEADERS
+from selector_profile import FIELDS, SelectorProfile, SelectorStats, compile_profile
+
+# Profile used by parse_results_page in this process (set by ParserPool workers)
+_profile = None
+
+
+def price_value(price) -> Optional[float]:
+    """'£1,234' / '1234' / 1234.0 -> 1234.0 (None if not a number)"""
+    try:
+        return float(str(price).replace('£', '').replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def validate_deal(deal: Dict, min_price: float, max_price: float) -> bool:
+    """A deal is valid when its price is within range and it has a hotel, destination and date"""
+    price = price_value(deal.get('total_price', '0'))
+    if price is None or price < min_price or price > max_price:
+        return False
+    return all(deal.get(field) for field in ('hotel_name', 'destination', 'departure_date'))
+
+
+class PriceCeiling:
+    """Early stop for price-sorted results: reached once a price is above the ceiling,
+    as long as the prices seen so far really are in ascending order"""
+
+    def __init__(self, ceiling: float):
+        self.ceiling = ceiling
+        self.last = None
+        self.ascending = True
+
+    def reached(self, price: Optional[float]) -> bool:
+        if price is None or not self.ascending:
+            return False
+        if self.last is not None and price < self.last:
+            self.ascending = False  # The sort didn't take, so every card has to be read
+            return False
+        self.last = price
+        return price > self.ceiling
+
+
+def extract_card(card, context: Dict, profile: SelectorProfile, stats: SelectorStats = None) -> Dict:
+    """Deal dict from a holiday-card element, matching EasyJetScraper.extract_deal_info"""
+    fields = {}
+    for name in FIELDS:
+        fields[name] = profile.lxml_field_value(card, name, stats)
+        if fields[name] is None:
+            raise ValueError(f"card has no {name}")
+    total_price = fields['total_price'].replace('£', '').replace(',', '')
+    href = fields['deal_url']
+
+    try:
+        price_per_person = float(total_price) / 2
+    except ValueError:
+        price_per_person = total_price
+
+    return {
+        'departure_airport': context['departure_airport'],
+        'destination': fields['destination'],
+        'departure_date': context['departure_date'],
+        'return_date': context['return_date'],
+        'duration_days': context['duration'],
+        'hotel_name': fields['hotel_name'],
+        'board_type': fields['board_type'],
+        'room_type': fields['room_type'],
+        'total_price': total_price,
+        'price_per_person': price_per_person,
+        'deal_url': urljoin(context.get('page_url') or '', href) if href else None,
+        'scraped_date': context['scraped_date']
+    }
+
+
+def init_worker(profile: Optional[Dict] = None):
+    """ParserPool worker initializer: compile the selector profile once per process"""
+    global _profile
+    _profile = compile_profile(profile)
+
+
+def parse_results_page(page_html: str, context: Dict) -> Dict:
+    """Parse one results page into compact deal records
+
+    context holds departure_airport, departure_date, return_date, duration,
+    scraped_date, page_url, max_deals, min_price, max_price and sort_by_price.
+    Deals come back as tuples in CSV_HEADERS order (see record_to_deal),
+    which are much cheaper to send between processes than dicts, along with
+    per-selector hit counts for SelectorStats.merge.
+    """
+    from lxml import html as lxml_html
+
+    start = time.perf_counter()
+    profile = _profile or compile_profile()
+    stats = SelectorStats()
+    document = lxml_html.document_fromstring(page_html)
+    cards = profile.lxml_all(document, 'card', stats)
+    max_deals = min(len(cards), context.get('max_deals', 50))
+
+    deals = []
+    rejected = errors = 0
+    for card in cards[:max_deals]:
+        try:
+            deal = extract_card(card, context, profile, stats)
+        except Exception:
+            errors += 1
+            continue
+        if validate_deal(deal, context['min_price'], context['max_price']):
+            deals.append(deal)
+        else:
+            rejected += 1
+
+    if context.get('sort_by_price', True):
+        deals.sort(key=lambda deal: price_value(deal['total_price']) or float('inf'))
+
+    return {
+        'cards': len(cards),
+        'processed': max_deals,
+        'rejected': rejected,
+        'errors': errors,
+        'records': [tuple(deal[column] for column in CSV_HEADERS) for deal in deals],
+        'selector_hits': stats.counts,
+        'parse_seconds': time.perf_counter() - start
+    }
+
+
+def record_to_deal(record) -> Dict:
+    return dict(zip(CSV_HEADERS, record))
+
+
+class ParserPool:
+    """Process pool that parses results pages off the browser thread"""
+
+    def __init__(self, workers: Optional[int] = None, profile: Optional[Dict] = None):
+        """profile is a selector profile dict (None = SELECTOR_PROFILE), compiled in each worker"""
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                            initargs=(profile,))
+
+    def submit(self, page_html: str, context: Dict) -> Future:
+        """Queue a page for parsing; the future's result is parse_results_page's dict"""
+        return self.executor.submit(parse_results_page, page_html, context)
+
+    def close(self, wait: bool = True):
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parse_pages(pages: Iterable[Tuple[str, Dict]], workers: Optional[int] = None,
+                window: Optional[int] = None, profile: Optional[Dict] = None) -> Iterator[Dict]:
+    """Parse (html, context) pairs across worker processes, yielding results in order
+
+    At most window pages are in flight at once, so pages can be streamed
+    from disk without loading a whole archive into memory.
+    """
+    with ParserPool(workers, profile) as pool:
+        window = window or pool.workers * 4
+        in_flight = deque()
+        for page_html, context in pages:
+            in_flight.append(pool.submit(page_html, context))
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
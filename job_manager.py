@@ -0,0 +1,273 @@
+"""
+Scrape job manager for the EasyJet Deal Scraper web GUI
+Queues scrape jobs, runs them on a bounded set of worker threads that share
+a pool of Chrome drivers, and keeps per-job status, logs and results
+"""
+
+import queue
+import threading
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from cancellation import CancellationToken, ScrapeCancelled
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# Status fields pushed to streaming clients as deltas
+STATUS_FIELDS = ('job_id', 'state', 'running', 'progress', 'progress_info', 'last_result')
+
+
+class JobQueueFull(Exception):
+    """Raised when no more jobs can be queued"""
+
+
+class DriverPool:
+    """Bounded pool of WebDriver instances shared by concurrent jobs"""
+
+    def __init__(self, size: int, factory: Callable):
+        self.size = max(1, size)
+        self.factory = factory
+        self.idle = []
+        self.in_use = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, cancel_token: CancellationToken = None):
+        """Take an idle driver or create one, waiting while the pool is exhausted"""
+        with self.condition:
+            while not self.idle and self.in_use >= self.size:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                self.condition.wait(timeout=0.5)
+            self.in_use += 1
+            driver = self.idle.pop() if self.idle else None
+
+        if driver is not None:
+            return driver
+
+        try:
+            return self.factory()
+        except BaseException:
+            with self.condition:
+                self.in_use -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, driver, reusable: bool = True):
+        """Return a driver to the pool, quitting it if it should not be reused"""
+        if not reusable:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+        with self.condition:
+            self.in_use -= 1
+            if reusable:
+                self.idle.append(driver)
+            self.condition.notify()
+
+    def close_all(self):
+        """Quit every idle driver"""
+        with self.condition:
+            drivers, self.idle = self.idle, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+class ScrapeJob:
+    """A single scrape request with its own status, logs and result file"""
+
+    MAX_LOGS = 100
+
+    def __init__(self, config: Dict):
+        self.id = uuid.uuid4().hex[:8]
+        self.config = config
+        self.cancel_token = CancellationToken()
+        self.changed = threading.Condition()
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self.status = {
+            'job_id': self.id,
+            'state': QUEUED,
+            'running': False,
+            'progress': 'Queued',
+            'progress_info': None,
+            'last_result': None,
+            'deals': 0,
+            'logs': [],
+            'cursor': 0  # id of the newest log entry
+        }
+
+    @property
+    def state(self) -> str:
+        return self.status['state']
+
+    def update(self, **fields):
+        """Update the job status and wake anyone waiting for changes"""
+        with self.changed:
+            self.status.update(fields)
+            self.changed.notify_all()
+
+    def add_log(self, level: str, message: str):
+        """Append a log entry with an increasing id"""
+        with self.changed:
+            self.status['cursor'] += 1
+            self.status['logs'].append({
+                'id': self.status['cursor'],
+                'timestamp': datetime.now().strftime("%H:%M:%S"),
+                'level': level,
+                'message': message
+            })
+            # Keep only the most recent messages
+            if len(self.status['logs']) > self.MAX_LOGS:
+                self.status['logs'] = self.status['logs'][-self.MAX_LOGS:]
+            self.changed.notify_all()
+
+    def to_dict(self, since: Optional[int] = None, include_logs: bool = True) -> Dict:
+        """Snapshot of the job; with since=N only log entries newer than id N are included"""
+        with self.changed:
+            data = dict(self.status)
+            if include_logs:
+                data['logs'] = [log for log in self.status['logs'] if since is None or log['id'] > since]
+            else:
+                del data['logs']
+        data.update({
+            'airports': self.config.get('departure_airports', []),
+            'output_file': self.config.get('output_file'),
+            'created_at': self.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            'started_at': self.started_at.strftime("%Y-%m-%d %H:%M:%S") if self.started_at else None,
+            'finished_at': self.finished_at.strftime("%Y-%m-%d %H:%M:%S") if self.finished_at else None
+        })
+        return data
+
+    def wait_for_change(self, cursor: int, sent: Dict, timeout: float = 15):
+        """Block until there are logs newer than cursor or status fields differ from sent
+
+        Returns (new_logs, status_delta); both are empty if the timeout expired.
+        """
+        with self.changed:
+            if self.status['cursor'] <= cursor and all(
+                    field in sent and sent[field] == self.status[field] for field in STATUS_FIELDS):
+                self.changed.wait(timeout=timeout)
+            logs = [log for log in self.status['logs'] if log['id'] > cursor]
+            delta = {field: self.status[field] for field in STATUS_FIELDS
+                     if field not in sent or sent[field] != self.status[field]}
+        return logs, delta
+
+
+class JobManager:
+    """Runs scrape jobs from a bounded queue on a fixed number of worker threads"""
+
+    def __init__(self, runner: Callable, max_workers: int = 2, max_queued: int = 10,
+                 history_size: int = 50):
+        """runner(job) performs the scrape; it is called on a worker thread"""
+        self.runner = runner
+        self.max_workers = max(1, max_workers)
+        self.history_size = history_size
+        self.queue = queue.Queue(maxsize=max(1, max_queued))
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.workers = []
+
+    def start_workers(self):
+        """Start the worker threads on first use"""
+        with self.lock:
+            while len(self.workers) < self.max_workers:
+                worker = threading.Thread(target=self.worker_loop, daemon=True,
+                                          name=f"scrape-worker-{len(self.workers) + 1}")
+                worker.start()
+                self.workers.append(worker)
+
+    def submit(self, config: Dict) -> ScrapeJob:
+        """Queue a new job, raising JobQueueFull if the queue is at capacity"""
+        job = ScrapeJob(config)
+        try:
+            self.queue.put_nowait(job)
+        except queue.Full:
+            raise JobQueueFull(f"Too many queued jobs (limit {self.queue.maxsize}), try again later")
+
+        with self.lock:
+            self.jobs[job.id] = job
+            self.prune_history()
+        self.start_workers()
+        return job
+
+    def worker_loop(self):
+        """Take jobs off the queue and run them until the process exits"""
+        while True:
+            job = self.queue.get()
+            try:
+                if job.cancel_token.cancelled:
+                    continue
+                job.started_at = datetime.now()
+                job.update(state=RUNNING, running=True, progress='Starting...')
+                self.runner(job)
+                if job.state == RUNNING:
+                    job.update(state=CANCELLED if job.cancel_token.cancelled else COMPLETED)
+            except (Exception, ScrapeCancelled) as e:
+                if job.cancel_token.cancelled:
+                    job.update(state=CANCELLED, progress='Stopped by user')
+                else:
+                    job.add_log('ERROR', f"Scraping failed: {str(e)}")
+                    job.update(state=FAILED, progress=f'Error: {str(e)}')
+            finally:
+                job.finished_at = job.finished_at or datetime.now()
+                job.update(running=False)
+                self.queue.task_done()
+
+    def get(self, job_id: str) -> Optional[ScrapeJob]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self) -> List[ScrapeJob]:
+        """All known jobs, newest first"""
+        with self.lock:
+            return sorted(self.jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def latest(self) -> Optional[ScrapeJob]:
+        """The most recently submitted job"""
+        jobs = self.list_jobs()
+        return jobs[0] if jobs else None
+
+    def latest_result(self) -> Optional[str]:
+        """Result file of the most recent job that produced one"""
+        for job in self.list_jobs():
+            if job.status['last_result']:
+                return job.status['last_result']
+        return None
+
+    def active_output_files(self) -> List[str]:
+        """Output files of jobs that are queued or running"""
+        return [job.config.get('output_file') for job in self.list_jobs() if job.state not in FINISHED_STATES]
+
+    def cancel(self, job_id: str) -> Optional[ScrapeJob]:
+        """Cancel a queued or running job"""
+        job = self.get(job_id)
+        if job is None or job.state in FINISHED_STATES:
+            return job
+
+        job.cancel_token.cancel()
+        if job.state == QUEUED:
+            job.finished_at = datetime.now()
+            job.update(state=CANCELLED, progress='Cancelled before starting')
+        else:
+            job.update(progress='Stopping...')
+        return job
+
+    def prune_history(self):
+        """Forget the oldest finished jobs beyond history_size (caller holds the lock)"""
+        finished = sorted((job for job in self.jobs.values() if job.state in FINISHED_STATES),
+                          key=lambda job: job.created_at)
+        for job in finished[:max(0, len(self.jobs) - self.history_size)]:
+            del self.jobs[job.id]
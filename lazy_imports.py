@@ -0,0 +1,57 @@
+"""
+Deferred imports for EasyJet Deal Scraper
+Heavy dependencies (selenium, webdriver-manager, pyarrow, ...) are only
+imported the first time they are used, so entry points that never scrape
+or convert files start quickly
+"""
+
+import importlib
+import importlib.util
+import threading
+
+
+class LazyImport:
+    """Stand-in for a module or module attribute that is imported on first use
+
+        By = lazy_import('selenium.webdriver.common.by', 'By')
+        By.ID  # selenium is imported here
+    """
+
+    def __init__(self, module_name: str, attribute: str = None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    target = importlib.import_module(self._module_name)
+                    if self._attribute:
+                        target = getattr(target, self._attribute)
+                    self._target = target
+        return self._target
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        name = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        state = 'loaded' if self._target is not None else 'not loaded'
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: str = None) -> LazyImport:
+    return LazyImport(module_name, attribute)
+
+
+def is_available(module_name: str) -> bool:
+    """Whether a module is installed, without importing it"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Load test for the EasyJet Deal Scraper web GUI
+Hammers read-only endpoints from concurrent clients and reports
+requests/sec and latency percentiles per endpoint
+"""
+
+import argparse
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from typing import Dict, List
+
+DEFAULT_ENDPOINTS = [
+    '/status',
+    '/jobs',
+    '/api/deals?limit=25',
+    '/api/deals?limit=25&sort=departure_date&order=desc&min_price=300'
+]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LoadTest:
+    """Runs concurrent clients against a list of endpoints for a fixed time"""
+
+    def __init__(self, base_url: str, endpoints: List[str], concurrency: int, duration: float):
+        self.base_url = base_url.rstrip('/')
+        self.endpoints = endpoints
+        self.concurrency = concurrency
+        self.duration = duration
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def client(self, offset: int, deadline: float):
+        """Request the endpoints round-robin until the deadline"""
+        index = offset
+        while time.time() < deadline:
+            endpoint = self.endpoints[index % len(self.endpoints)]
+            index += 1
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(self.base_url + endpoint, timeout=30) as response:
+                    response.read()
+                failed = False
+            except urllib.error.HTTPError as e:
+                # A 404 (no results yet) still exercises the server
+                failed = e.code >= 500
+            except Exception:
+                failed = True
+            elapsed = time.perf_counter() - start
+
+            with self.lock:
+                if failed:
+                    self.errors[endpoint] += 1
+                else:
+                    self.latencies[endpoint].append(elapsed)
+
+    def run(self) -> Dict:
+        deadline = time.time() + self.duration
+        threads = [threading.Thread(target=self.client, args=(i, deadline), daemon=True)
+                   for i in range(self.concurrency)]
+        started = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.time() - started
+
+        report = {}
+        for endpoint in self.endpoints:
+            latencies = self.latencies[endpoint]
+            report[endpoint] = {
+                'requests': len(latencies),
+                'errors': self.errors[endpoint],
+                'rps': len(latencies) / elapsed,
+                'p50_ms': percentile(latencies, 0.50) * 1000,
+                'p95_ms': percentile(latencies, 0.95) * 1000,
+                'p99_ms': percentile(latencies, 0.99) * 1000
+            }
+        return report
+
+
+def print_report(report: Dict, duration: float, concurrency: int):
+    print(f"\n📈 {concurrency} clients for {duration:.0f}s")
+    print(f"{'Endpoint':<70} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    total_rps = 0.0
+    for endpoint, stats in report.items():
+        total_rps += stats['rps']
+        print(f"{endpoint:<70} {stats['rps']:>8.1f} {stats['p50_ms']:>8.1f} "
+              f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['errors']:>7}")
+    print(f"{'Total':<70} {total_rps:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the web GUI endpoints')
+    parser.add_argument('--url', default='http://localhost:8000', help='Base URL of a running web GUI')
+    parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent clients')
+    parser.add_argument('--duration', type=float, default=15, help='Seconds to run')
+    parser.add_argument('--endpoint', action='append', dest='endpoints',
+                       help='Endpoint to request (repeatable; defaults to /status, /jobs and /api/deals)')
+    args = parser.parse_args()
+
+    endpoints = args.endpoints or DEFAULT_ENDPOINTS
+    print(f"🚀 Load testing {args.url} ({', '.join(endpoints)})")
+    report = LoadTest(args.url, endpoints, args.concurrency, args.duration).run()
+    print_report(report, args.duration, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
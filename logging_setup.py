@@ -0,0 +1,173 @@
+"""
+Logging setup for EasyJet Deal Scraper
+Routes all log records through a queue so scraping threads never wait on
+file or console I/O. A background listener writes JSON lines to a
+size-rotated, gzip-compressed log file and plain text to the console.
+"""
+
+import atexit
+import copy
+import gzip
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import LOGGING_CONFIG
+
+# Attributes every LogRecord has; anything else was passed as extra= and goes into the JSON
+STANDARD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_lock = threading.Lock()
+_listener = None
+_instance_ids = itertools.count(1)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the time, level, logger, thread, message and extras"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in STANDARD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps tracebacks in exc_text instead of appending them to the message"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that gzips rotated files (scraper.log.1.gz, scraper.log.2.gz, ...)"""
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, compress: bool = True):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        if compress:
+            self.namer = lambda name: name + '.gz'
+            self.rotator = self.compress_rotated
+
+    @staticmethod
+    def compress_rotated(source: str, dest: str):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+def build_handlers(settings: Dict):
+    handlers = []
+    if settings.get('log_file'):
+        file_handler = CompressedRotatingFileHandler(settings['log_file'], settings['max_bytes'],
+                                                     settings['backup_count'], settings['compress'])
+        if settings.get('json', True):
+            file_handler.setFormatter(JsonFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter(settings['text_format']))
+        handlers.append(file_handler)
+    if settings.get('console'):
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(settings.get('console_level') or logging.NOTSET)
+        console_handler.setFormatter(logging.Formatter(settings['text_format']))
+        handlers.append(console_handler)
+    return handlers
+
+
+def configure_logging(overrides: Optional[Dict] = None, force: bool = False) -> bool:
+    """Install the queue handler and start the listener once per process
+
+    overrides update LOGGING_CONFIG (e.g. {'level': 'DEBUG', 'levels': {'selenium': 'INFO'}}).
+    Later calls do nothing unless force is set, so creating many scrapers
+    never stacks handlers. Returns True when logging was (re)configured.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None and not force:
+            return False
+
+        settings = {**LOGGING_CONFIG, **(overrides or {})}
+        settings['levels'] = {**(LOGGING_CONFIG.get('levels') or {}), **((overrides or {}).get('levels') or {})}
+
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+        root = logging.getLogger()
+        for handler in [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+            root.removeHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        root.addHandler(StructuredQueueHandler(log_queue))
+        root.setLevel(settings['level'])
+        for name, level in settings['levels'].items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = logging.handlers.QueueListener(log_queue, *build_handlers(settings), respect_handler_level=True)
+        _listener.start()
+        return True
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener"""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def instance_logger(name: str, **context) -> logging.LoggerAdapter:
+    """Logger for one object (e.g. one scraper) whose records carry an instance id and context
+
+    All instances share the module logger and its handlers; the instance id
+    and context appear as fields in the JSON log.
+    """
+    return logging.LoggerAdapter(logging.getLogger(name), {'instance': next(_instance_ids), **context})
+
+
+def log_level(value: str) -> str:
+    """Upper-cased level name (ValueError if logging doesn't know it); usable as an argparse type"""
+    level = str(value).strip().upper()
+    if not isinstance(logging.getLevelName(level), int):
+        raise ValueError(f"Unknown log level '{value}'")
+    return level
+
+
+def parse_levels(values) -> Dict[str, str]:
+    """Parse ['selenium=WARNING', 'search_planner=DEBUG'] into a levels dict"""
+    levels = {}
+    for value in values or []:
+        name, _, level = value.partition('=')
+        if not name or not level:
+            raise ValueError(f"Expected MODULE=LEVEL, got '{value}'")
+        levels[name] = log_level(level)
+    return levels
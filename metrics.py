@@ -0,0 +1,182 @@
+"""
+Scraper metrics for EasyJet Deal Scraper
+Thread-safe counters, gauges and histograms rendered in the Prometheus text
+exposition format, so /metrics can be scraped without extra dependencies
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Sequence, Tuple
+
+# Seconds; covers element lookups through to slow page loads and driver startup
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+
+def escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names: Sequence[str], values: Sequence, extra: str = '') -> str:
+    parts = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric:
+    """Base class: a named family of samples keyed by label values"""
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def key(self, labels: Dict) -> Tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        with self.lock:
+            items = sorted(self.values.items())
+        for key, value in items:
+            lines.extend(self.render_sample(key, value))
+        return lines
+
+    def render_sample(self, key: Tuple, value) -> List[str]:
+        return [f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}"]
+
+
+class Counter(Metric):
+    """Monotonically increasing total"""
+
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self.key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels):
+        with self.lock:
+            self.values[self.key(labels)] = value
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value: float, **labels):
+        key = self.key(labels)
+        with self.lock:
+            counts, total = self.values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self.values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a block (including blocks that raise)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render_sample(self, key: Tuple, value) -> List[str]:
+        counts, total = value
+        lines = []
+        for bound, count in zip(self.buckets, counts):
+            labels = format_labels(self.labelnames, key, 'le="%s"' % format_value(bound))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+        lines.append(f"{self.name}_sum{format_labels(self.labelnames, key)} {format_value(round(total, 6))}")
+        lines.append(f"{self.name}_count{format_labels(self.labelnames, key)} {counts[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self.metrics = []
+        self.lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self.lock:
+            self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self.lock:
+            metrics = list(self.metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+# Scraper internals (airport labels are EasyJet airport codes)
+DRIVER_STARTUP_SECONDS = REGISTRY.histogram(
+    'scraper_driver_startup_seconds', 'Time to obtain a Chrome WebDriver', ['source'])
+PAGE_LOAD_SECONDS = REGISTRY.histogram(
+    'scraper_page_load_seconds', 'Latency of driver.get page loads', ['page'])
+WAIT_SECONDS = REGISTRY.histogram(
+    'scraper_wait_seconds', 'Time spent waiting for page elements to appear', ['element', 'outcome'])
+CARD_EXTRACTION_SECONDS = REGISTRY.histogram(
+    'scraper_card_extraction_seconds', 'Time to extract one deal from a result card',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5))
+SLEEP_SECONDS = REGISTRY.counter(
+    'scraper_sleep_seconds_total', 'Seconds spent in polite delays between actions')
+SEARCHES = REGISTRY.counter(
+    'scraper_searches_total', 'Date searches run, by outcome', ['airport', 'outcome'])
+CARDS_FOUND = REGISTRY.counter(
+    'scraper_cards_found_total', 'Result cards found on search result pages', ['airport'])
+DEALS = REGISTRY.counter(
+    'scraper_deals_total', 'Deals extracted from result cards, by outcome (validated/rejected)',
+    ['airport', 'outcome'])
+ERRORS = REGISTRY.counter(
+    'scraper_errors_total', 'Errors handled by the scraper, by stage', ['airport', 'stage'])
+PAGE_FINGERPRINTS = REGISTRY.counter(
+    'scraper_page_fingerprints_total', 'Result pages checked against the last run (changed/unchanged)', ['outcome'])
+RESULT_LOADS = REGISTRY.counter(
+    'scraper_result_loads_total', 'Further results requested after the first render, by action and outcome',
+    ['action', 'outcome'])
+SELECTOR_MATCHES = REGISTRY.counter(
+    'scraper_selector_matches_total', 'Lookups answered by each profile selector (selector="none" = no match)',
+    ['element', 'selector'])
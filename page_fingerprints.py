@@ -0,0 +1,85 @@
+"""
+Results-page fingerprints for EasyJet Deal Scraper
+Remembers a hash of each search window's result cards and the deals they
+produced, so a window whose results haven't changed since the previous run
+can reuse those deals instead of extracting every card again
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config import CSV_HEADERS
+
+FINGERPRINTS_VERSION = 1
+
+
+def fingerprints_path(results_file: str) -> str:
+    """Sidecar file for a results CSV, e.g. easyjet_deals.fingerprints.json"""
+    return os.path.splitext(results_file)[0] + '.fingerprints.json'
+
+
+def fingerprint(content: str) -> str:
+    """Hash of page content, ignoring whitespace differences"""
+    return hashlib.sha256(' '.join(content.split()).encode('utf-8')).hexdigest()
+
+
+def window_key(airport_code: str, departure_date: datetime, return_date: datetime, duration: int) -> str:
+    return f"{airport_code}|{departure_date.strftime('%Y-%m-%d')}|{return_date.strftime('%Y-%m-%d')}|{duration}"
+
+
+class PageFingerprints:
+    """Fingerprint and deals per search window, kept in a JSON sidecar between runs
+
+    Deals depend on the extraction settings as well as the page, so stored
+    windows are only reused while max deals, price range and sorting match.
+    """
+
+    def __init__(self, filename: str, settings: Dict):
+        self.filename = filename
+        self.settings = settings
+        self.windows = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.filename, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == FINGERPRINTS_VERSION and data.get('settings') == self.settings:
+            self.windows = data.get('windows', {})
+
+    def lookup(self, key: str, page_fingerprint: str) -> Optional[List[Dict]]:
+        """The window's previous deals, with a new scraped_date, if its page is unchanged; else None"""
+        window = self.windows.get(key)
+        if not window or window['fingerprint'] != page_fingerprint:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        window['last_seen'] = now
+        return [dict(zip(CSV_HEADERS, record), scraped_date=now) for record in window['deals']]
+
+    def remember(self, key: str, page_fingerprint: str, deals: List[Dict]):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.windows[key] = {
+            'fingerprint': page_fingerprint,
+            'deals': [[deal.get(column) for column in CSV_HEADERS] for deal in deals],
+            'first_seen': now,
+            'last_seen': now
+        }
+
+    def save(self):
+        """Write the sidecar, dropping windows whose departure date has passed"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        windows = {key: window for key, window in self.windows.items() if key.split('|')[1] >= today}
+        temp = f"{self.filename}.tmp"
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump({'version': FINGERPRINTS_VERSION, 'settings': self.settings, 'windows': windows}, f)
+        os.replace(temp, self.filename)
@@ -148,7 +148,7 @@ class PortableLauncher:
         try:
             # Start web server in background
             def start_web_server():
-                subprocess.run([sys.executable, 'web_gui.py'])
+                subprocess.run([sys.executable, 'web_gui.py', '--production'])
             
             thread = threading.Thread(target=start_web_server, daemon=True)
             thread.start()
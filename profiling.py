@@ -0,0 +1,159 @@
+"""
+Run profiling for EasyJet Deal Scraper
+cProfile CPU statistics and tracemalloc allocation reports for a whole
+scraper run, optionally broken down by phase, written to one directory per run
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List
+
+from config import AIRPORT_CODES
+
+# Scraper methods profiled as separate phases with --profile-phases
+PHASE_METHODS = ('setup_driver', 'plan_searches', 'search_deals', 'save_to_csv')
+
+
+def run_name(config: Dict) -> str:
+    """Directory name for a run, e.g. 20250801_101500_BRS-LGW_planned"""
+    airports = '-'.join(AIRPORT_CODES.get(airport, airport) for airport in config.get('departure_airports', []))
+    name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{airports}_{config.get('search_mode', 'planned')}"
+    return re.sub(r'[^\w.-]+', '_', name)
+
+
+def stats_report(stats: pstats.Stats, sort: str, top: int) -> str:
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats(sort).print_stats(top)
+    return out.getvalue()
+
+
+def memory_report(statistics: List, top: int) -> str:
+    lines = []
+    for stat in statistics[:top]:
+        frame = stat.traceback[0]
+        size_diff = getattr(stat, 'size_diff', None)
+        change = f" ({size_diff / 1024:+.1f} KiB)" if size_diff is not None else ''
+        lines.append(f"{stat.size / 1024:10.1f} KiB{change} in {stat.count} blocks  "
+                     f"{frame.filename}:{frame.lineno}")
+    return '\n'.join(lines) + '\n'
+
+
+class RunProfiler:
+    """Profiles CPU time with cProfile and allocations with tracemalloc for one run"""
+
+    def __init__(self, output_dir: str, per_phase: bool = False, top: int = 25, memory_frames: int = 1):
+        self.output_dir = output_dir
+        self.per_phase = per_phase
+        self.top = top
+        self.memory_frames = memory_frames
+        self.profile = None
+        self.phases = []
+        self.active_phase = None
+        self.started = None
+
+    def instrument(self, scraper):
+        """Wrap the scraper's phase methods so each runs in its own profiling phase"""
+        for method_name in PHASE_METHODS:
+            method = getattr(scraper, method_name)
+
+            @functools.wraps(method)
+            def wrapper(*args, _method=method, _name=method_name, **kwargs):
+                # search_deals phases are named after the airport
+                name = f"{_name}:{args[0]}" if _name == 'search_deals' and args else _name
+                with self.phase(name):
+                    return _method(*args, **kwargs)
+
+            setattr(scraper, method_name, wrapper)
+
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.memory_frames)
+        self.started = time.perf_counter()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Profile a block separately (only with per_phase, and not inside another phase)"""
+        if not self.per_phase or self.active_phase is not None or self.profile is None:
+            yield
+            return
+
+        # Only one profiler can be active, so the run profile pauses during the phase
+        self.profile.disable()
+        self.active_phase = name
+        before = tracemalloc.take_snapshot()
+        phase_profile = cProfile.Profile()
+        start = time.perf_counter()
+        phase_profile.enable()
+        try:
+            yield
+        finally:
+            phase_profile.disable()
+            elapsed = time.perf_counter() - start
+            after = tracemalloc.take_snapshot()
+            self.record_phase(name, phase_profile, elapsed, after.compare_to(before, 'lineno'))
+            self.active_phase = None
+            self.profile.enable()
+
+    def record_phase(self, name: str, profile: cProfile.Profile, elapsed: float, memory_diff: List):
+        index = len(self.phases) + 1
+        safe_name = re.sub(r'[^\w.-]+', '_', name)
+        base = os.path.join(self.output_dir, 'phases', f"{index:02d}_{safe_name}")
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        profile.dump_stats(base + '.prof')
+
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(f"Phase: {name}\nWall time: {elapsed:.2f}s\n\n")
+            f.write("== CPU (cumulative) ==\n")
+            f.write(stats_report(pstats.Stats(profile), 'cumulative', self.top))
+            f.write("\n== Allocations during phase (by line) ==\n")
+            f.write(memory_report(memory_diff, self.top))
+
+        self.phases.append({
+            'name': name,
+            'seconds': elapsed,
+            'allocated_kib': sum(stat.size_diff for stat in memory_diff) / 1024,
+            'profile': profile
+        })
+
+    def stop(self) -> str:
+        """Stop profiling and write the run reports; returns the summary file path"""
+        self.profile.disable()
+        elapsed = time.perf_counter() - self.started
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # The run profile excludes phases while they ran, so add them back in
+        stats = pstats.Stats(self.profile)
+        for phase in self.phases:
+            stats.add(phase['profile'])
+        stats.dump_stats(os.path.join(self.output_dir, 'run.prof'))
+
+        summary_file = os.path.join(self.output_dir, 'summary.txt')
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write(f"Run time: {elapsed:.2f}s\n")
+            f.write(f"Traced memory: {current / 1024 / 1024:.1f} MiB at end, {peak / 1024 / 1024:.1f} MiB peak\n\n")
+            if self.phases:
+                f.write("== Phases ==\n")
+                for phase in self.phases:
+                    f.write(f"{phase['seconds']:9.2f}s {phase['allocated_kib']:+10.1f} KiB  {phase['name']}\n")
+                f.write("\n")
+            f.write("== CPU (cumulative) ==\n")
+            f.write(stats_report(stats, 'cumulative', self.top))
+            f.write("\n== CPU (own time) ==\n")
+            f.write(stats_report(stats, 'tottime', self.top))
+            f.write("\n== Live allocations at end of run (by line) ==\n")
+            f.write(memory_report(snapshot.statistics('lineno'), self.top))
+        return summary_file
@@ -0,0 +1,193 @@
+"""
+Structured progress events for EasyJet Deal Scraper
+Publishes task planned/completed/failed events to subscribers and estimates
+the time remaining from historical task timings
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_TIMINGS_FILE = 'scraper_timings.json'
+TIMINGS_HISTORY_SIZE = 200
+
+
+def load_task_timings(filename: str = DEFAULT_TIMINGS_FILE) -> List[float]:
+    """Load recent task durations (seconds) saved by previous runs"""
+    try:
+        with open(filename, encoding='utf-8') as f:
+            return [float(seconds) for seconds in json.load(f).get('task_seconds', [])]
+    except (OSError, ValueError, TypeError, AttributeError):
+        return []
+
+
+def average_task_seconds(filename: str = DEFAULT_TIMINGS_FILE) -> Optional[float]:
+    """Average duration of a search task over previous runs, or None without history"""
+    timings = load_task_timings(filename)
+    return sum(timings) / len(timings) if timings else None
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Format a number of seconds as e.g. '1h 05m', '4m 12s' or '35s'"""
+    if seconds is None:
+        return 'unknown'
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressTracker:
+    """Counts scraper tasks and publishes progress events to subscribers
+
+    Every event is a dict with a 'type' ('tasks_planned', 'task_started',
+    'task_completed', 'task_failed', 'tasks_skipped', 'deals_added' or 'finished') and a
+    'progress' snapshot, so consumers never need to parse log lines.
+    """
+
+    def __init__(self, timings_file: str = DEFAULT_TIMINGS_FILE, default_task_seconds: float = 17):
+        self.timings_file = timings_file
+        self.default_task_seconds = default_task_seconds
+        self.history = load_task_timings(timings_file) if timings_file else []
+        self.subscribers = []
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear the counters for a new run"""
+        self.planned = 0
+        self.completed = 0
+        self.failed = 0
+        self.deals_found = 0
+        self.durations = []
+        self.started_at = time.time()
+        self.current_task = None
+        self.current_fields = None
+
+    def subscribe(self, callback: Callable[[Dict], None]) -> Callable[[], None]:
+        """Register callback(event) for every progress event; returns an unsubscribe function"""
+        with self.lock:
+            self.subscribers.append(callback)
+
+        def unsubscribe():
+            with self.lock:
+                if callback in self.subscribers:
+                    self.subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, event_type: str, **fields):
+        """Send an event with the current progress snapshot to every subscriber"""
+        event = {'type': event_type, 'time': time.time(), **fields, 'progress': self.snapshot()}
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                pass  # A broken consumer must not break the scrape
+
+    def estimated_task_seconds(self) -> float:
+        """Expected duration of one task: this run's average once known, else history"""
+        if len(self.durations) >= 3:
+            return sum(self.durations) / len(self.durations)
+        samples = self.history[-TIMINGS_HISTORY_SIZE:] + self.durations
+        if samples:
+            return sum(samples) / len(samples)
+        return self.default_task_seconds
+
+    def snapshot(self) -> Dict:
+        """Current counters, percentage and ETA"""
+        done = self.completed + self.failed
+        remaining = max(0, self.planned - done)
+        return {
+            'planned': self.planned,
+            'completed': self.completed,
+            'failed': self.failed,
+            'remaining': remaining,
+            'deals_found': self.deals_found,
+            'percent': round(100.0 * done / self.planned, 1) if self.planned else 0.0,
+            'elapsed_seconds': round(time.time() - self.started_at, 1),
+            'eta_seconds': round(remaining * self.estimated_task_seconds(), 1)
+        }
+
+    def plan(self, count: int, **fields):
+        """Add planned tasks"""
+        self.planned += max(0, count)
+        self.publish('tasks_planned', count=count, **fields)
+
+    def skip(self, count: int, **fields):
+        """Drop planned tasks that will not run (budget unused, airport failed...)"""
+        count = min(max(0, count), self.planned - self.completed - self.failed)
+        if count:
+            self.planned -= count
+            self.publish('tasks_skipped', count=count, **fields)
+
+    @contextmanager
+    def task(self, **fields):
+        """Time a task; set task['deals'] inside the block to report deals found
+        (or call defer_current when they are counted later with add_deals)"""
+        task = dict(fields, deals=0, error=None, deferred=False)
+        self.current_task = task
+        self.current_fields = fields
+        start = time.time()
+        self.publish('task_started', task=fields)
+
+        try:
+            yield task
+        except Exception as e:
+            task['error'] = task['error'] or str(e)
+            self.record(fields, task, time.time() - start)
+            raise
+        except BaseException:
+            # Cancelled tasks are not counted as completed or failed
+            self.current_task = None
+            raise
+        self.record(fields, task, time.time() - start)
+
+    def record(self, fields: Dict, task: Dict, duration: float):
+        """Count a finished task and publish its completed/failed event"""
+        self.current_task = None
+        self.durations.append(duration)
+        self.deals_found += task['deals']
+        if task['error']:
+            self.failed += 1
+            self.publish('task_failed', task=fields, duration=round(duration, 2), error=task['error'])
+        else:
+            self.completed += 1
+            # Deferred tasks report their deals in a later deals_added event
+            self.publish('task_completed', task=fields, duration=round(duration, 2),
+                         deals=None if task['deferred'] else task['deals'])
+
+    def add_deals(self, count: int, **fields):
+        """Count deals found outside a task (e.g. parsed after the search finished)"""
+        if count:
+            self.deals_found += count
+            self.publish('deals_added', count=count, **fields)
+
+    def defer_current(self) -> Optional[Dict]:
+        """Mark the running task's deals as counted later with add_deals; returns its fields"""
+        if self.current_task is None:
+            return None
+        self.current_task['deferred'] = True
+        return self.current_fields
+
+    def fail_current(self, error: str):
+        """Mark the running task as failed (for code that handles its own exceptions)"""
+        if self.current_task is not None:
+            self.current_task['error'] = error
+
+    def finish(self, **fields):
+        """Publish the final event and store this run's task timings"""
+        self.publish('finished', **fields)
+        if self.timings_file and self.durations:
+            self.history = (self.history + self.durations)[-TIMINGS_HISTORY_SIZE:]
+            try:
+                with open(self.timings_file, 'w', encoding='utf-8') as f:
+                    json.dump({'task_seconds': [round(s, 2) for s in self.history]}, f)
+            except OSError:
+                pass
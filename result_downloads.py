@@ -0,0 +1,213 @@
+"""
+Result downloads for the EasyJet Deal Scraper web GUI
+Content-encoding negotiation, cached compressed copies of results files and
+streamed conversion of results to JSON Lines and Parquet
+"""
+
+import csv
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from lazy_imports import lazy_import, is_available
+
+# Optional, and only imported when a zstd or Parquet download is made
+ZSTD_AVAILABLE = is_available('zstandard')
+PARQUET_AVAILABLE = is_available('pyarrow')
+zstandard = lazy_import('zstandard')
+pyarrow = lazy_import('pyarrow')
+pyarrow_csv = lazy_import('pyarrow.csv')
+pyarrow_parquet = lazy_import('pyarrow.parquet')
+
+# format -> (mimetype, file extension)
+DOWNLOAD_FORMATS = {
+    'csv': ('text/csv', '.csv'),
+    'jsonl': ('application/x-ndjson', '.jsonl'),
+    'parquet': ('application/vnd.apache.parquet', '.parquet')
+}
+
+# Preferred first; zstd compresses CSV better and faster than gzip
+COMPRESSED_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz'}
+
+CHUNK_SIZE = 64 * 1024
+PARQUET_BLOCK_SIZE = 1 << 20  # Bytes of CSV per Parquet row group
+
+
+def available_encodings() -> list:
+    """Content encodings this server can produce, most preferred first"""
+    return [encoding for encoding in COMPRESSED_SUFFIXES if encoding != 'zstd' or ZSTD_AVAILABLE]
+
+
+def available_formats() -> list:
+    """Download formats this server can produce"""
+    return [name for name in DOWNLOAD_FORMATS if name != 'parquet' or PARQUET_AVAILABLE]
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Pick the best content encoding the client accepts ('identity' if none)"""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        fields = part.strip().split(';')
+        name = fields[0].strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in fields[1:]:
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+
+    best, best_quality = 'identity', 0.0
+    for encoding in available_encodings():
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compressed_copy(path: str, encoding: str) -> str:
+    """Path of a compressed copy of path, (re)creating it if the source is newer
+
+    The copy lives next to the results file so it is compressed once per
+    scrape, not once per download, and can be served with ETag/Range support.
+    """
+    target = path + COMPRESSED_SUFFIXES[encoding]
+    try:
+        if os.path.getmtime(target) >= os.path.getmtime(path):
+            return target
+    except OSError:
+        pass
+
+    # Unique per call, so concurrent requests in one process never share a temp file
+    fd, temp = tempfile.mkstemp(prefix=os.path.basename(target) + '.', suffix='.tmp',
+                                dir=os.path.dirname(target) or '.')
+    try:
+        # Wrap the descriptor first so it is closed even if the source has gone
+        with os.fdopen(fd, 'wb') as raw, open(path, 'rb') as source:
+            if encoding == 'zstd':
+                zstandard.ZstdCompressor(level=10).copy_stream(source, raw)
+            else:
+                with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as out:
+                    shutil.copyfileobj(source, out, CHUNK_SIZE)
+        os.replace(temp, target)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress a byte stream on the fly"""
+    if encoding == 'identity':
+        yield from chunks
+        return
+
+    if encoding == 'zstd':
+        compressor = zstandard.ZstdCompressor(level=3).compressobj()
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_jsonl(path: str, rows_per_chunk: int = 500) -> Iterator[bytes]:
+    """Stream a results CSV as JSON Lines, a few hundred rows at a time"""
+    with open(path, newline='', encoding='utf-8') as f:
+        lines = []
+        for row in csv.DictReader(f):
+            lines.append(json.dumps(row, ensure_ascii=False))
+            if len(lines) >= rows_per_chunk:
+                yield ('\n'.join(lines) + '\n').encode('utf-8')
+                lines = []
+        if lines:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+class ChunkSink:
+    """Write-only file object that collects bytes for a streaming response"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data, self.chunks = b''.join(self.chunks), []
+        return data
+
+
+def iter_parquet(path: str) -> Iterator[bytes]:
+    """Stream a results CSV as Parquet, one row group per CSV block"""
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet downloads require pyarrow")
+
+    with open(path, newline='', encoding='utf-8') as f:
+        columns = next(csv.reader(f), [])
+
+    # Every column is read as text so all row groups share one schema
+    reader = pyarrow_csv.open_csv(
+        path,
+        read_options=pyarrow_csv.ReadOptions(block_size=PARQUET_BLOCK_SIZE),
+        convert_options=pyarrow_csv.ConvertOptions(column_types={name: pyarrow.string() for name in columns})
+    )
+    sink = ChunkSink()
+    writer = pyarrow_parquet.ParquetWriter(pyarrow.PythonFile(sink, mode='w'), reader.schema)
+    try:
+        for batch in reader:
+            writer.write_table(pyarrow.Table.from_batches([batch]))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_formatted(path: str, format_name: str) -> Iterator[bytes]:
+    """Byte stream of a results file converted to format_name"""
+    if format_name == 'jsonl':
+        return iter_jsonl(path)
+    if format_name == 'parquet':
+        return iter_parquet(path)
+    raise ValueError(f"Unsupported download format: {format_name}")
+
+
+def stream_etag(path: str, format_name: str, encoding: str) -> str:
+    """Entity tag for a converted download: changes with the file, format and encoding"""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}-{format_name}-{encoding}"
+
+
+def download_name(path: str, format_name: str) -> Optional[str]:
+    """File name offered to the browser for a download"""
+    return os.path.splitext(os.path.basename(path))[0] + DOWNLOAD_FORMATS[format_name][1]
@@ -0,0 +1,154 @@
+"""
+Cached results dataset for the EasyJet Deal Scraper web GUI
+Parses a results CSV once, keeps it in memory until the file changes and
+answers paginated, sorted and filtered queries against it
+"""
+
+import csv
+import os
+import threading
+from typing import Dict, List, Optional
+
+from search_planner import parse_price
+
+# Columns that sort numerically rather than as text
+NUMERIC_COLUMNS = {
+    'duration_days': 'duration_value',
+    'total_price': 'price_value',
+    'price_per_person': 'price_per_person_value'
+}
+
+MAX_PAGE_SIZE = 500
+
+
+def parse_int(value) -> Optional[int]:
+    """Parse an integer column, or None if it is not numeric"""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class DealsDataset:
+    """Parsed rows of one results file plus memoised sort orders"""
+
+    def __init__(self, filename: str, signature: tuple):
+        self.filename = filename
+        self.signature = signature
+        self.columns = []
+        self.rows = []
+        self.sort_orders = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Read the CSV and precompute the numeric values used for sorting and filtering"""
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            self.columns = list(reader.fieldnames or [])
+            for row in reader:
+                row['price_value'] = parse_price(row.get('total_price'))
+                row['price_per_person_value'] = parse_price(row.get('price_per_person'))
+                row['duration_value'] = parse_int(row.get('duration_days'))
+                self.rows.append(row)
+
+    def sorted_rows(self, column: str, descending: bool = False) -> List[Dict]:
+        """Rows ordered by column; each ordering is computed once per dataset"""
+        key = (column, descending)
+        with self.lock:
+            if key not in self.sort_orders:
+                value_field = NUMERIC_COLUMNS.get(column)
+                if value_field:
+                    # Rows without a number go last whichever way we sort
+                    present = [row for row in self.rows if row[value_field] is not None]
+                    missing = [row for row in self.rows if row[value_field] is None]
+                    present.sort(key=lambda row: row[value_field], reverse=descending)
+                    ordered = present + missing
+                else:
+                    ordered = sorted(self.rows, key=lambda row: (row.get(column) or '').lower(),
+                                     reverse=descending)
+                self.sort_orders[key] = ordered
+            return self.sort_orders[key]
+
+
+class ResultsStore:
+    """Keeps one parsed dataset per results file, reloading when its mtime or size changes"""
+
+    def __init__(self, max_files: int = 5):
+        self.max_files = max_files
+        self.datasets = {}
+        self.lock = threading.Lock()
+
+    def get(self, filename: str) -> DealsDataset:
+        """Parsed dataset for filename, re-reading it only if the file has changed"""
+        stat = os.stat(filename)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        path = os.path.abspath(filename)
+
+        with self.lock:
+            dataset = self.datasets.get(path)
+            if dataset is not None and dataset.signature == signature:
+                return dataset
+
+        # Parse outside the lock so a large file doesn't block other results
+        dataset = DealsDataset(filename, signature)
+        with self.lock:
+            self.datasets.pop(path, None)
+            self.datasets[path] = dataset
+            while len(self.datasets) > self.max_files:
+                del self.datasets[next(iter(self.datasets))]
+        return dataset
+
+
+def matches(row: Dict, filters: Dict) -> bool:
+    """True if the row passes every filter that is set"""
+    if filters.get('airport') and row.get('departure_airport') != filters['airport']:
+        return False
+    if filters.get('board_type') and row.get('board_type') != filters['board_type']:
+        return False
+    if filters.get('destination') and filters['destination'].lower() not in (row.get('destination') or '').lower():
+        return False
+    if filters.get('date_from') and (row.get('departure_date') or '') < filters['date_from']:
+        return False
+    if filters.get('date_to') and (row.get('departure_date') or '') > filters['date_to']:
+        return False
+    if filters.get('min_price') is not None or filters.get('max_price') is not None:
+        price = row['price_value']
+        if price is None:
+            return False
+        if filters.get('min_price') is not None and price < filters['min_price']:
+            return False
+        if filters.get('max_price') is not None and price > filters['max_price']:
+            return False
+    if filters.get('search'):
+        text = filters['search'].lower()
+        if not any(text in (row.get(column) or '').lower()
+                   for column in ('destination', 'hotel_name', 'departure_airport', 'board_type', 'room_type')):
+            return False
+    return True
+
+
+def query_deals(dataset: DealsDataset, filters: Dict = None, sort: str = 'total_price',
+                descending: bool = False, offset: int = 0, limit: int = 25) -> Dict:
+    """One page of deals matching filters, ordered by sort"""
+    filters = filters or {}
+    if sort not in dataset.columns:
+        sort = 'total_price' if 'total_price' in dataset.columns else (dataset.columns or [''])[0]
+    offset = max(0, offset)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    rows = dataset.sorted_rows(sort, descending)
+    if any(value not in (None, '') for value in filters.values()):
+        rows = [row for row in rows if matches(row, filters)]
+
+    return {
+        'total': len(dataset.rows),
+        'filtered': len(rows),
+        'offset': offset,
+        'limit': limit,
+        'sort': sort,
+        'order': 'desc' if descending else 'asc',
+        'columns': dataset.columns,
+        'deals': [{column: row.get(column) for column in dataset.columns}
+                  for row in rows[offset:offset + limit]]
+    }
@@ -0,0 +1,142 @@
+"""
+Precomputed result summaries for EasyJet Deal Scraper
+Aggregates deals while the results CSV is written and stores them in a
+sidecar JSON file, so the GUIs can show summaries without re-reading results
+"""
+
+import csv
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from search_planner import parse_price
+
+SUMMARY_VERSION = 1
+
+
+def summary_path(results_file: str) -> str:
+    """Sidecar file for a results CSV, e.g. easyjet_deals.summary.json"""
+    return os.path.splitext(results_file)[0] + '.summary.json'
+
+
+class PriceStats:
+    """Running count, min, max and total of deal prices"""
+
+    def __init__(self):
+        self.deals = 0
+        self.priced = 0
+        self.min_price = None
+        self.max_price = None
+        self.price_sum = 0.0
+
+    def add(self, price: Optional[float]):
+        self.deals += 1
+        if price is None:
+            return
+        self.priced += 1
+        self.price_sum += price
+        self.min_price = price if self.min_price is None else min(self.min_price, price)
+        self.max_price = price if self.max_price is None else max(self.max_price, price)
+
+    def to_dict(self) -> Dict:
+        return {
+            'deals': self.deals,
+            'min_price': self.min_price,
+            'max_price': self.max_price,
+            'avg_price': round(self.price_sum / self.priced, 2) if self.priced else None
+        }
+
+
+class SummaryBuilder:
+    """Updates totals and per-destination/airport/board breakdowns one deal at a time"""
+
+    def __init__(self):
+        self.overall = PriceStats()
+        self.destinations = {}
+        self.airports = {}
+        self.board_types = {}
+
+    def add(self, deal: Dict):
+        price = parse_price(deal.get('total_price'))
+        self.overall.add(price)
+        for breakdown, key in ((self.destinations, 'destination'), (self.airports, 'departure_airport'),
+                               (self.board_types, 'board_type')):
+            value = deal.get(key)
+            if value:
+                breakdown.setdefault(value, PriceStats()).add(price)
+
+    def to_dict(self, results_file: str) -> Dict:
+        """Summary document stamped with the results file's size and mtime"""
+        stat = os.stat(results_file)
+        return {
+            'version': SUMMARY_VERSION,
+            'results_file': os.path.basename(results_file),
+            'file_size': stat.st_size,
+            'file_mtime_ns': stat.st_mtime_ns,
+            'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            **self.overall.to_dict(),
+            'destination_count': len(self.destinations),
+            'destinations': {name: stats.to_dict() for name, stats in sorted(self.destinations.items())},
+            'airports': {name: stats.to_dict() for name, stats in sorted(self.airports.items())},
+            'board_types': {name: stats.to_dict() for name, stats in sorted(self.board_types.items())}
+        }
+
+    def save(self, results_file: str) -> Dict:
+        """Write the sidecar for results_file and return the summary"""
+        summary = self.to_dict(results_file)
+        with open(summary_path(results_file), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+
+def write_results_csv(deals: Iterable[Dict], filename: str, headers: List[str]) -> Dict:
+    """Write deals to a CSV and its sidecar summary in a single pass; returns the summary"""
+    deals = list(deals)
+    # Keep the configured column order, then any extra fields in first-seen order
+    fieldnames = list(headers)
+    for deal in deals:
+        fieldnames.extend(key for key in deal if key not in fieldnames)
+
+    builder = SummaryBuilder()
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for deal in deals:
+            writer.writerow(deal)
+            builder.add(deal)
+    return builder.save(filename)
+
+
+def summarize_file(results_file: str) -> Dict:
+    """Build (and store) the summary of an existing results CSV"""
+    builder = SummaryBuilder()
+    with open(results_file, newline='', encoding='utf-8') as f:
+        for deal in csv.DictReader(f):
+            builder.add(deal)
+    try:
+        return builder.save(results_file)
+    except OSError:
+        return builder.to_dict(results_file)
+
+
+def load_summary(results_file: str, rebuild: bool = True) -> Optional[Dict]:
+    """Summary of a results CSV from its sidecar
+
+    A missing, unreadable or stale sidecar (the CSV changed since it was
+    written) is rebuilt from the CSV when rebuild is True, else None is returned.
+    """
+    try:
+        with open(summary_path(results_file), encoding='utf-8') as f:
+            summary = json.load(f)
+        stat = os.stat(results_file)
+        if (summary.get('version') == SUMMARY_VERSION and summary.get('file_size') == stat.st_size
+                and summary.get('file_mtime_ns') == stat.st_mtime_ns):
+            return summary
+    except (OSError, ValueError, AttributeError):
+        pass
+    return summarize_file(results_file) if rebuild else None
+
+
+def format_price(value: Optional[float]) -> str:
+    return f"£{value:.0f}" if value is not None else 'N/A'
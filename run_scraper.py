@@ -5,8 +5,116 @@ Simple script to run the EasyJet scraper with custom settings
 
 import argparse
 import json
+import os
+import time
 from easyjet_scraper import EasyJetScraper
-from config import DEFAULT_CONFIG, AIRPORT_CODES
+from config import DEFAULT_CONFIG, AIRPORT_CODES, CSV_HEADERS
+from progress import format_eta
+from profiling import RunProfiler, run_name
+from logging_setup import log_level, parse_levels
+from lazy_imports import is_available
+from html_parser import parse_pages, record_to_deal
+from snapshot_archive import SnapshotArchive
+from results_summary import write_results_csv
+from selector_profile import SelectorStats, compile_profile
+
+def print_progress(event):
+    """Print a one-line progress summary after each finished task"""
+    if event['type'] not in ('task_completed', 'task_failed'):
+        return
+    progress = event['progress']
+    done = progress['completed'] + progress['failed']
+    print(f"[{done}/{progress['planned']}] {progress['percent']:.0f}% - "
+          f"{progress['deals_found']} deals - ETA {format_eta(progress['eta_seconds'])}")
+
+def logging_overrides(level, module_levels, log_file):
+    """LOGGING_CONFIG overrides from the command line, or None"""
+    overrides = {}
+    if level:
+        overrides['level'] = level.upper()
+    if module_levels:
+        overrides['levels'] = module_levels
+    if log_file:
+        overrides['log_file'] = log_file
+    return overrides or None
+
+def workers_arg(value):
+    """Worker process count: a non-negative number or 'auto'"""
+    if value == 'auto':
+        return value
+    if not value.isdigit():
+        raise argparse.ArgumentTypeError(f"expected a number or 'auto', got '{value}'")
+    return int(value)
+
+def load_selector_profile(filename):
+    """Selector profile from a JSON file (same shape as config.SELECTOR_PROFILE), checked up front"""
+    if not filename:
+        return None
+    with open(filename, encoding='utf-8') as f:
+        profile = json.load(f)
+    compile_profile(profile)
+    return profile
+
+def reparse_archive(args, selector_profile=None):
+    """Re-extract deals from archived results pages across CPU cores, without a browser or network"""
+    if not is_available('lxml'):
+        print("❌ Re-parsing archived pages needs lxml (pip install lxml)")
+        return
+    if not os.path.exists(os.path.join(args.reparse, 'index.sqlite3')):
+        print(f"❌ No page archive in {args.reparse}")
+        return
+    
+    archive = SnapshotArchive(args.reparse)
+    run_id = None if args.all_runs else args.run_id or archive.latest_run_id()
+    airport_names = {code: name for name, code in AIRPORT_CODES.items()}
+    settings = {
+        'max_deals': args.max_deals,
+        'min_price': args.min_price,
+        'max_price': args.max_price,
+        'sort_by_price': args.sort_by_price
+    }
+    
+    def pages():
+        for entry, page_html in archive.iter_pages(run_id=run_id):
+            yield page_html, dict(settings,
+                                  departure_airport=airport_names.get(entry['airport'], entry['airport']),
+                                  departure_date=entry['departure_date'],
+                                  return_date=entry['return_date'],
+                                  duration=entry['duration'],
+                                  scraped_date=entry['scraped_at'],
+                                  page_url=entry['url'])
+    
+    workers = None if args.parse_workers in (0, 'auto') else args.parse_workers
+    print(f"🔁 Re-parsing archived pages from {args.reparse} "
+          f"({'all runs' if run_id is None else 'run ' + run_id})")
+    
+    deals = []
+    page_count = cards = rejected = errors = 0
+    profile = compile_profile(selector_profile)
+    selector_stats = SelectorStats()
+    start = time.perf_counter()
+    try:
+        for result in parse_pages(pages(), workers, profile=selector_profile):
+            page_count += 1
+            selector_stats.merge(profile, result['selector_hits'])
+            cards += result['cards']
+            rejected += result['rejected']
+            errors += result['errors']
+            deals.extend(record_to_deal(record) for record in result['records'])
+    finally:
+        archive.close()
+    elapsed = time.perf_counter() - start
+    
+    rate = page_count / elapsed if elapsed else 0.0
+    print(f"⏱️  {page_count} pages in {elapsed:.2f}s ({rate:.1f} pages/sec): "
+          f"{cards} cards, {len(deals)} deals kept, {rejected} rejected, {errors} unreadable")
+    for line, matched_nothing in selector_stats.report(profile):
+        print(f"{'⚠️ ' if matched_nothing else '🔎'} {line}")
+    if deals:
+        write_results_csv(deals, args.output, CSV_HEADERS)
+        print(f"💾 Saved {len(deals)} deals to {args.output}")
+    else:
+        print("No deals found in the archived pages")
 
 def main():
     parser = argparse.ArgumentParser(description='EasyJet Holiday Deal Scraper')
@@ -28,17 +136,77 @@ def main():
                        help='Minimum price threshold in GBP')
     parser.add_argument('--sort-by-price', action='store_true', default=True,
                        help='Sort deals by lowest price first (default: True)')
+    parser.add_argument('--max-searches', type=int, default=None,
+                       help='Total number of date searches to run (default: 5 per airport)')
+    parser.add_argument('--time-budget', type=float, default=None,
+                       help='Time budget for the run in minutes')
+    parser.add_argument('--history-file', default=None,
+                       help='Previous results CSV used to prioritise searches (default: output file)')
+    parser.add_argument('--search-mode', choices=['planned', 'sweep', 'calendar'], default='planned',
+                       help='planned: ranked date windows; sweep: sample sparsely then refine around cheap dates; '
+                            'calendar: read month price calendars, then search only the cheapest days')
+    parser.add_argument('--drilldown-days', type=int, default=None,
+                       help='Cheapest calendar days to load full results for in calendar mode')
+    parser.add_argument('--trace', nargs='?', const='traces', default=None, metavar='DIR',
+                       help='Write a Chrome trace-event file of search spans to DIR (default: traces)')
+    parser.add_argument('--base-url', default=None,
+                       help='Scrape this site instead of easyjet.com, e.g. http://localhost:8765 from fixture_server.py')
+    parser.add_argument('--profile', nargs='?', const='profiles', default=None, metavar='DIR',
+                       help='Profile the run with cProfile and tracemalloc; reports go to DIR/<run name> (default: profiles)')
+    parser.add_argument('--profile-phases', action='store_true',
+                       help='With --profile, also report driver setup, planning, each airport and saving separately')
+    parser.add_argument('--profile-top', type=int, default=25,
+                       help='Functions and allocation sites listed in profile reports')
+    parser.add_argument('--max-result-pages', type=int, default=DEFAULT_CONFIG['max_result_pages'],
+                       help='Result pages or infinite-scroll loads read per search, stopping early at --max-deals '
+                            'or, once sorted by price, at --max-price')
+    parser.add_argument('--parse-workers', type=workers_arg, default=0, metavar='N|auto',
+                       help='Parse results pages from their HTML in N worker processes (needs lxml)')
+    parser.add_argument('--snapshot-dir', nargs='?', const='snapshots', default=None, metavar='DIR',
+                       help='Archive the HTML of every results page (default directory: snapshots)')
+    parser.add_argument('--snapshot-quota-mb', type=float, default=DEFAULT_CONFIG['snapshot_quota_mb'],
+                       help='Disk quota for the page archive; least recently used pages are evicted')
+    parser.add_argument('--rescan-unchanged', action='store_true',
+                       help="Extract every results page, even when its cards match the last run's")
+    parser.add_argument('--reparse', nargs='?', const='snapshots', default=None, metavar='DIR',
+                       help='Instead of scraping, re-extract deals from the page archive in DIR into --output')
+    parser.add_argument('--run-id', default=None,
+                       help='Run to re-parse (default: the most recent run in the archive)')
+    parser.add_argument('--all-runs', action='store_true',
+                       help='Re-parse every archived run')
+    parser.add_argument('--selector-profile', default=None, metavar='FILE',
+                       help='JSON selector profile to use instead of SELECTOR_PROFILE in config.py')
+    parser.add_argument('--log-level', type=log_level, default=None,
+                       help='Log level for scraper.log and the console (default: INFO)')
+    parser.add_argument('--module-log-level', nargs='+', default=None, metavar='MODULE=LEVEL',
+                       help='Per-module log levels, e.g. search_planner=DEBUG selenium=INFO')
+    parser.add_argument('--log-file', default=None,
+                       help='Log file (default: scraper.log; rotated and gzip-compressed)')
     parser.add_argument('--list-airports', action='store_true',
                        help='List available airports and exit')
     
     args = parser.parse_args()
     
+    try:
+        module_levels = parse_levels(args.module_log_level)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    try:
+        selector_profile = load_selector_profile(args.selector_profile)
+    except (OSError, ValueError) as e:
+        parser.error(f"invalid selector profile {args.selector_profile}: {e}")
+    
     if args.list_airports:
         print("Available airports:")
         for name, code in AIRPORT_CODES.items():
             print(f"  {name} ({code})")
         return
     
+    if args.reparse:
+        reparse_archive(args, selector_profile)
+        return
+    
     # Validate airports
     invalid_airports = [airport for airport in args.airports if airport not in AIRPORT_CODES]
     if invalid_airports:
@@ -55,24 +223,69 @@ def main():
         'output_file': args.output,
         'search_months_ahead': args.months_ahead,
         'max_deals_per_search': args.max_deals,
+        'max_result_pages': args.max_result_pages,
         'price_threshold': args.max_price,
         'min_price': args.min_price,
-        'sort_by_price': args.sort_by_price
+        'sort_by_price': args.sort_by_price,
+        'max_searches': args.max_searches,
+        'time_budget_minutes': args.time_budget,
+        'history_file': args.history_file,
+        'search_mode': args.search_mode,
+        'calendar_drilldown_days': args.drilldown_days,
+        'trace_dir': args.trace,
+        'base_url': args.base_url,
+        'parse_workers': args.parse_workers,
+        'snapshot_dir': args.snapshot_dir,
+        'snapshot_quota_mb': args.snapshot_quota_mb,
+        'skip_unchanged_pages': not args.rescan_unchanged,
+        'selector_profile': selector_profile,
+        'logging': logging_overrides(args.log_level, module_levels, args.log_file)
     })
     
     print(f"Starting scraper with configuration:")
     print(f"  Airports: {', '.join(args.airports)}")
     print(f"  Duration: {args.min_duration}-{args.max_duration} days")
     print(f"  Price range: £{args.min_price}-£{args.max_price}")
-    print(f"  Max deals per search: {args.max_deals}")
+    print(f"  Max deals per search: {args.max_deals} (up to {args.max_result_pages} result pages)")
     print(f"  Sort by price: {args.sort_by_price}")
     print(f"  Output: {args.output}")
     print(f"  Search period: {args.months_ahead} months ahead")
-    print()
+    print(f"  Search mode: {args.search_mode}")
+    if args.max_searches or args.time_budget:
+        print(f"  Search budget: {args.max_searches or 'any'} searches, {args.time_budget or 'any'} minutes")
+    if args.trace:
+        print(f"  Trace directory: {args.trace}")
+    if args.base_url:
+        print(f"  Site: {args.base_url}")
+    if args.parse_workers:
+        print(f"  Parse workers: {args.parse_workers}")
+    if args.selector_profile:
+        print(f"  Selector profile: {args.selector_profile}")
+    if args.snapshot_dir:
+        print(f"  Page archive: {args.snapshot_dir} ({args.snapshot_quota_mb:.0f} MB quota)")
     
     # Run scraper
     scraper = EasyJetScraper(config)
-    scraper.run()
+    scraper.progress.subscribe(print_progress)
+    
+    if not args.profile:
+        print()
+        scraper.run()
+        return
+    
+    profiler = RunProfiler(os.path.join(args.profile, run_name(config)),
+                           per_phase=args.profile_phases, top=args.profile_top)
+    print(f"  Profiling to: {profiler.output_dir}")
+    print()
+    if args.profile_phases:
+        profiler.instrument(scraper)
+    profiler.start()
+    try:
+        scraper.run()
+    finally:
+        summary_file = profiler.stop()
+        print(f"📊 Profile written to {profiler.output_dir} (summary: {summary_file}, "
+              f"open run.prof with snakeviz or pstats)")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,213 @@
+"""
+Search planner for EasyJet Deal Scraper
+Enumerates the (airport, departure date, duration) search space, ranks it by
+historical deal yield and price, and fits it to a request or time budget
+"""
+
+import csv
+import math
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+
+from config import AIRPORT_CODES
+from progress import average_task_seconds, DEFAULT_TIMINGS_FILE
+
+
+def parse_price(value) -> Optional[float]:
+    """Parse a price like '£1,299' into a float, or None if it is not numeric"""
+    try:
+        return float(str(value).replace('£', '').replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+def van_der_corput(index: int, base: int = 2) -> float:
+    """Low-discrepancy sequence used to spread unexplored dates across the range"""
+    value, denominator = 0.0, 1.0
+    while index:
+        index, remainder = divmod(index, base)
+        denominator *= base
+        value += remainder / denominator
+    return value
+
+
+def enumerate_search_dates(config: Dict, today: datetime = None) -> List[tuple]:
+    """Generate every (departure_date, return_date, duration) in the configured range"""
+    today = today or datetime.now()
+    today = today.replace(hour=0, minute=0, second=0, microsecond=0)
+    step = max(1, int(config.get('date_step_days', 1)))
+    horizon = 30 * config['search_months_ahead']
+
+    search_dates = []
+    for day_offset in range(1, horizon + 1, step):
+        departure_date = today + timedelta(days=day_offset)
+        for duration in range(config['min_duration'], config['max_duration'] + 1):
+            return_date = departure_date + timedelta(days=duration)
+            search_dates.append((departure_date, return_date, duration))
+
+    return search_dates
+
+
+class SearchPlanner:
+    """Builds a prioritised, budgeted search plan for each departure airport"""
+
+    def __init__(self, config: Dict, logger=None):
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.history = {}
+
+    def load_history(self, filename: str = None) -> Dict:
+        """Aggregate deal counts and lowest prices from a previous results CSV"""
+        filename = filename or self.config.get('history_file') or self.config.get('output_file')
+        self.history = {}
+
+        if not filename or not os.path.exists(filename):
+            return self.history
+
+        skipped = 0
+        try:
+            with open(filename, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    # Short or hand-edited rows have missing (None) fields; skip just those rows
+                    key = self.history_key(row.get('departure_airport'),
+                                           (row.get('departure_date') or '')[:7],
+                                           row.get('duration_days'))
+                    if key is None:
+                        skipped += 1
+                        continue
+                    stats = self.history.setdefault(key, {'deals': 0, 'min_price': None})
+                    stats['deals'] += 1
+                    price = parse_price(row.get('total_price'))
+                    if price is not None and (stats['min_price'] is None or price < stats['min_price']):
+                        stats['min_price'] = price
+            self.logger.info(f"Loaded search history for {len(self.history)} month/duration windows from {filename}"
+                             + (f" ({skipped} unusable rows skipped)" if skipped else ""))
+        except Exception as e:
+            self.logger.warning(f"Could not load search history from {filename}: {str(e)}")
+            self.history = {}
+
+        return self.history
+
+    @staticmethod
+    def history_key(airport: str, month: str, duration) -> Optional[tuple]:
+        """Key used to bucket history by airport, departure month and duration (None if any is missing)"""
+        if not airport or not month:
+            return None
+        try:
+            return (airport, month, int(duration))
+        except (TypeError, ValueError):
+            return None
+
+    def score(self, airport: str, departure_date: datetime, duration: int) -> float:
+        """Score a search: more historical deals and lower prices rank higher"""
+        stats = self.history.get(self.history_key(airport, departure_date.strftime("%Y-%m"), duration))
+        max_price = self.config.get('price_threshold', 2000) or 2000
+
+        if not stats:
+            # Unseen windows get a neutral price score so they are still explored
+            return 0.5
+
+        yield_score = math.log1p(stats['deals'])
+        if stats['min_price'] is None:
+            price_score = 0.5
+        else:
+            price_score = max(0.0, 1.0 - stats['min_price'] / max_price)
+
+        return yield_score + price_score
+
+    def request_budget(self, airport_count: int) -> Optional[int]:
+        """Total number of searches allowed for this run, or None if unbounded"""
+        budgets = []
+
+        if self.config.get('max_searches'):
+            budgets.append(int(self.config['max_searches']))
+
+        if self.config.get('time_budget_minutes'):
+            # Prefer measured task timings from previous runs over the configured estimate
+            per_search = (average_task_seconds(self.config.get('timings_file', DEFAULT_TIMINGS_FILE)) or
+                          self.config.get('seconds_per_search', 15) + self.config.get('delay_between_requests', 2))
+            budgets.append(int(self.config['time_budget_minutes'] * 60 // per_search))
+
+        if budgets:
+            return max(0, min(budgets))
+
+        per_airport = self.config.get('default_searches_per_airport')
+        if per_airport:
+            return per_airport * airport_count
+
+        return None
+
+    def is_overlapping(self, task: tuple, accepted: List[tuple]) -> bool:
+        """Check if a search window is too close to one already in the plan"""
+        gap = self.config.get('min_window_gap_days', 3)
+        departure_date, _, duration = task
+        for other_departure, _, other_duration in accepted:
+            if other_duration == duration and abs((other_departure - departure_date).days) < gap:
+                return True
+        return False
+
+    @staticmethod
+    def spread_order(search_dates: List[tuple]) -> Dict[tuple, tuple]:
+        """Tie-break order that samples equally scored windows evenly across dates and durations"""
+        departure_dates = sorted({task[0] for task in search_dates})
+        durations = sorted({task[2] for task in search_dates})
+        date_order = sorted(range(len(departure_dates)), key=van_der_corput)
+        date_rank = {departure_dates[index]: rank for rank, index in enumerate(date_order)}
+        duration_index = {duration: i for i, duration in enumerate(durations)}
+
+        # Each pass visits every date once, rotating through the durations
+        return {
+            (task[0], task[2]): ((duration_index[task[2]] - date_rank[task[0]]) % len(durations),
+                                 date_rank[task[0]])
+            for task in search_dates
+        }
+
+    def plan(self, search_dates: List[tuple] = None, airports: List[str] = None) -> Dict[str, List[tuple]]:
+        """Build the search plan as {airport: [(departure_date, return_date, duration), ...]}"""
+        airports = [a for a in (airports or self.config['departure_airports']) if a in AIRPORT_CODES]
+        search_dates = search_dates if search_dates is not None else enumerate_search_dates(self.config)
+
+        if not self.history:
+            self.load_history()
+
+        spread = self.spread_order(search_dates)
+
+        # Rank and dedupe each airport's candidates independently
+        ranked = {}
+        for airport in airports:
+            candidates = sorted(
+                search_dates,
+                key=lambda task: (-self.score(airport, task[0], task[2]), spread[(task[0], task[2])])
+            )
+            accepted = []
+            for task in candidates:
+                if not self.is_overlapping(task, accepted):
+                    accepted.append(task)
+            ranked[airport] = accepted
+
+        budget = self.request_budget(len(airports))
+        plan = {airport: [] for airport in airports}
+
+        # Share the budget round-robin so every airport gets its best windows first
+        remaining = budget
+        index = 0
+        while remaining is None or remaining > 0:
+            added = False
+            for airport in airports:
+                if index < len(ranked[airport]) and (remaining is None or remaining > 0):
+                    plan[airport].append(ranked[airport][index])
+                    added = True
+                    if remaining is not None:
+                        remaining -= 1
+            if not added:
+                break
+            index += 1
+
+        total_space = len(search_dates) * len(airports)
+        planned = sum(len(tasks) for tasks in plan.values())
+        self.logger.info(f"Planned {planned} searches out of {total_space} possible "
+                         f"(budget: {budget if budget is not None else 'unlimited'})")
+
+        return plan
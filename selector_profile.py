@@ -0,0 +1,295 @@
+"""
+Selector profiles for EasyJet Deal Scraper
+The page elements and card fields the scraper reads are declared in
+config.SELECTOR_PROFILE as ordered lists of CSS selectors (or XPath with an
+'xpath:' prefix). A profile is validated and compiled once; lookups try
+each selector in turn without raising and count which one matched, so
+markup changes can be handled by editing the profile.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import metrics
+from config import SELECTOR_PROFILE
+
+# Page elements every profile must define
+ELEMENTS = ('cookie_button', 'departure_input', 'card', 'sort_button', 'calendar_day', 'calendar_price',
+            'load_more', 'next_page')
+# Card fields every profile must define (read relative to a card)
+FIELDS = ('hotel_name', 'destination', 'total_price', 'board_type', 'room_type', 'deal_url')
+
+CSS_TOKEN = re.compile(r"""
+    (?P<combinator>\s*>\s*|\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<class>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[\^$*]?=)\s*(?P<value>"[^"]*"|'[^']*'|[\w-]+)\s*)?\]
+""", re.VERBOSE)
+
+
+def xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat('" + value.replace("'", "', \"'\", '") + "')"
+
+
+def css_to_xpath(selector: str, relative: bool = False) -> str:
+    """Translate a simple CSS selector to XPath for lxml
+
+    Supports tag, #id, .class, [attr], [attr=v], [attr^=v], [attr$=v] and
+    [attr*=v], combined with descendant and child (>) combinators. Anything
+    else raises ValueError, so a profile fails when it is loaded rather
+    than on every card. Relative selectors, like Selenium's lookups inside
+    an element, never match the element itself.
+    """
+    steps = []
+    axis = 'descendant::' if relative else 'descendant-or-self::'
+    tag, conditions = None, []
+    position = 0
+    selector = selector.strip()
+
+    def finish_step():
+        if tag is None and not conditions:
+            raise ValueError(f"Unsupported CSS selector '{selector}'")
+        steps.append(axis + (tag or '*') + ''.join(f'[{condition}]' for condition in conditions))
+
+    while position < len(selector):
+        match = CSS_TOKEN.match(selector, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unsupported CSS selector '{selector}' (at '{selector[position:]}')")
+        position = match.end()
+
+        if match.group('combinator') is not None:
+            finish_step()
+            axis = '/' if '>' in match.group('combinator') else '/descendant::'
+            tag, conditions = None, []
+        elif match.group('tag'):
+            if tag is not None or conditions:
+                raise ValueError(f"Unsupported CSS selector '{selector}'")
+            tag = match.group('tag')
+        elif match.group('id'):
+            conditions.append(f"@id={xpath_literal(match.group('id'))}")
+        elif match.group('class'):
+            conditions.append("contains(concat(' ', normalize-space(@class), ' '), "
+                              f"{xpath_literal(' ' + match.group('class') + ' ')})")
+        else:
+            attribute, op, value = match.group('attr'), match.group('op'), match.group('value')
+            if op is None:
+                conditions.append(f'@{attribute}')
+                continue
+            value = xpath_literal(value.strip('"\''))
+            if op == '=':
+                conditions.append(f'@{attribute}={value}')
+            elif op == '^=':
+                conditions.append(f'starts-with(@{attribute}, {value})')
+            elif op == '*=':
+                conditions.append(f'contains(@{attribute}, {value})')
+            else:  # $=, XPath 1.0 has no ends-with
+                conditions.append(f'substring(@{attribute}, string-length(@{attribute}) - '
+                                  f'string-length({value}) + 1) = {value}')
+    finish_step()
+    return ''.join(steps)
+
+
+class Selector:
+    """One CSS or XPath selector with its Selenium locator and lxml XPath"""
+
+    def __init__(self, text: str, relative: bool):
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError(f"Selectors must be non-empty strings, got {text!r}")
+        self.text = text.strip()
+        if self.text.startswith('xpath:'):
+            self.xpath = self.text[len('xpath:'):].strip()
+            if relative and not self.xpath.startswith('.'):
+                raise ValueError(f"Card field XPath must be relative (start with '.'): {self.text}")
+            self.locator = ('xpath', self.xpath)
+        else:
+            self.xpath = css_to_xpath(self.text, relative)
+            self.locator = ('css selector', self.text)
+        self.compiled = None
+
+    def lxml_xpath(self):
+        """lxml XPath object, compiled on first use in each process"""
+        if self.compiled is None:
+            from lxml import etree
+            self.compiled = etree.XPath(self.xpath)
+        return self.compiled
+
+
+class SelectorGroup:
+    """Fallback selectors for one element or field, tried in order"""
+
+    def __init__(self, name: str, spec, relative: bool = False):
+        attribute = None
+        if isinstance(spec, dict):
+            attribute = spec.get('attribute')
+            spec = spec.get('selectors')
+        if isinstance(spec, str):
+            spec = [spec]
+        if not isinstance(spec, list) or not spec:
+            raise ValueError(f"Selector profile entry '{name}' needs a list of selectors")
+        self.name = name
+        self.attribute = attribute
+        try:
+            self.selectors = [Selector(text, relative) for text in spec]
+        except ValueError as e:
+            raise ValueError(f"Selector profile entry '{name}': {e}")
+
+
+class SelectorStats:
+    """How often each selector of each group matched, plus misses"""
+
+    def __init__(self):
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def record(self, group: SelectorGroup, index: Optional[int], count: int = 1):
+        with self.lock:
+            counts = self.counts.setdefault(group.name, [0] * (len(group.selectors) + 1))
+            counts[-1 if index is None else index] += count
+        selector = 'none' if index is None else group.selectors[index].text
+        metrics.SELECTOR_MATCHES.inc(count, element=group.name, selector=selector)
+
+    def merge(self, profile: 'SelectorProfile', counts: Dict[str, List[int]]):
+        """Add counts gathered elsewhere, e.g. in a parser worker process"""
+        for name, group_counts in counts.items():
+            group = profile.group(name)
+            for index, count in enumerate(group_counts):
+                if count:
+                    self.record(group, None if index == len(group_counts) - 1 else index, count)
+
+    def report(self, profile: 'SelectorProfile') -> List[Tuple[str, bool]]:
+        """(line, matched nothing) per group that missed or needed a fallback, e.g.
+        'hotel_name: .hotel-name 80%, h3.name 15%, missing 5%'"""
+        lines = []
+        with self.lock:
+            counts = {name: list(values) for name, values in self.counts.items()}
+        for name, values in counts.items():
+            total = sum(values)
+            if not total or values[0] == total:
+                continue
+            group = profile.group(name)
+            parts = [f"{selector.text} {count / total:.0%}" for selector, count in zip(group.selectors, values)
+                     if count]
+            if values[-1]:
+                parts.append(f"missing {values[-1] / total:.0%}")
+            lines.append((f"{name}: {', '.join(parts)}", values[-1] == total))
+        return lines
+
+
+class SelectorProfile:
+    """Validated, compiled selector profile"""
+
+    def __init__(self, profile: Dict):
+        missing = [name for name in ELEMENTS if name not in profile]
+        fields = profile.get('fields') or {}
+        missing += [f"fields.{name}" for name in FIELDS if name not in fields]
+        if missing:
+            raise ValueError(f"Selector profile is missing: {', '.join(missing)}")
+        self.elements = {name: SelectorGroup(name, profile[name]) for name in ELEMENTS}
+        # Identifies the profile, e.g. so deals extracted with other selectors aren't reused
+        self.digest = hashlib.sha256(json.dumps(profile, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        self.fields = {name: SelectorGroup(name, spec, relative=True) for name, spec in fields.items()}
+
+    def group(self, name: str) -> SelectorGroup:
+        return self.elements.get(name) or self.fields[name]
+
+    # Selenium
+
+    def find_all(self, root, name: str, stats: SelectorStats = None) -> List:
+        """Elements matched by the first selector of the group that matches anything"""
+        group = self.group(name)
+        for index, selector in enumerate(group.selectors):
+            found = root.find_elements(*selector.locator)
+            if found:
+                if stats:
+                    stats.record(group, index)
+                return found
+        if stats:
+            stats.record(group, None)
+        return []
+
+    def find(self, root, name: str, stats: SelectorStats = None):
+        """First matching element, or None"""
+        found = self.find_all(root, name, stats)
+        return found[0] if found else None
+
+    def field_value(self, card, name: str, stats: SelectorStats = None) -> Optional[str]:
+        """Text (or configured attribute) of a card field, or None if no selector matches"""
+        element = self.find(card, name, stats)
+        if element is None:
+            return None
+        group = self.fields[name]
+        return element.get_attribute(group.attribute) if group.attribute else element.text
+
+    def find_cards_js(self) -> str:
+        """JavaScript setting `cards` (and `matched`, the selector index or -1) with the card selectors in order"""
+        selectors = [list(selector.locator) for selector in self.elements['card'].selectors]
+        return (
+            f"var selectors = {json.dumps(selectors)}, cards = [], matched = -1;"
+            "for (var i = 0; i < selectors.length && matched < 0; i++) {"
+            "  if (selectors[i][0] === 'xpath') {"
+            "    var result = document.evaluate(selectors[i][1], document, null,"
+            "                                   XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);"
+            "    for (var j = 0; j < result.snapshotLength; j++) { cards.push(result.snapshotItem(j)); }"
+            "  } else {"
+            "    cards = Array.from(document.querySelectorAll(selectors[i][1]));"
+            "  }"
+            "  if (cards.length) { matched = i; }"
+            "}"
+        )
+
+    def cards_script(self) -> str:
+        """JavaScript returning the outerHTML of every card"""
+        return self.find_cards_js() + "return cards.map(function (card) { return card.outerHTML; }).join('\\n');"
+
+    def new_cards_script(self) -> str:
+        """JavaScript returning [matched selector, total cards, cards from index arguments[0] on],
+        so cards already read are not sent back again"""
+        return self.find_cards_js() + "return [matched, cards.length, cards.slice(arguments[0])];"
+
+    def card_count_script(self) -> str:
+        return self.find_cards_js() + "return cards.length;"
+
+    # lxml
+
+    def lxml_all(self, root, name: str, stats: SelectorStats = None) -> List:
+        group = self.group(name)
+        for index, selector in enumerate(group.selectors):
+            found = selector.lxml_xpath()(root)
+            if found:
+                if stats:
+                    stats.record(group, index)
+                return found
+        if stats:
+            stats.record(group, None)
+        return []
+
+    def lxml_field_value(self, card, name: str, stats: SelectorStats = None) -> Optional[str]:
+        found = self.lxml_all(card, name, stats)
+        if not found:
+            return None
+        group = self.fields[name]
+        if group.attribute:
+            return found[0].get(group.attribute)
+        return ' '.join(found[0].text_content().split())
+
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_profile(profile: Dict = None) -> SelectorProfile:
+    """Compiled profile (SELECTOR_PROFILE by default), built once per distinct profile"""
+    profile = profile or SELECTOR_PROFILE
+    key = json.dumps(profile, sort_keys=True)
+    with _compiled_lock:
+        if key not in _compiled:
+            _compiled[key] = SelectorProfile(profile)
+        return _compiled[key]
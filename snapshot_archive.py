@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Raw results-page archive for EasyJet Deal Scraper
+Keeps the HTML of every results page so deals can be re-extracted after a
+markup change or an extractor bug. Pages are compressed (zstd when
+installed, else gzip) and stored once per content hash; a SQLite index
+records which airport, dates and run each page came from. A disk quota is
+enforced by evicting the least recently used pages.
+
+    python snapshot_archive.py snapshots stats
+    python snapshot_archive.py snapshots list --airport BRS
+    python snapshot_archive.py snapshots show <hash> > page.html
+"""
+
+import argparse
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from lazy_imports import lazy_import, is_available
+
+zstandard = lazy_import('zstandard')
+
+ENCODING_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz'}
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    encoding TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash TEXT NOT NULL REFERENCES blobs(hash),
+    airport TEXT,
+    departure_date TEXT,
+    return_date TEXT,
+    duration INTEGER,
+    url TEXT,
+    run_id TEXT,
+    scraped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_search ON snapshots (airport, departure_date, duration);
+CREATE INDEX IF NOT EXISTS snapshots_scraped_at ON snapshots (scraped_at);
+CREATE INDEX IF NOT EXISTS snapshots_hash ON snapshots (hash);
+CREATE INDEX IF NOT EXISTS blobs_last_access ON blobs (last_access);
+"""
+
+
+def default_encoding() -> str:
+    return 'zstd' if is_available('zstandard') else 'gzip'
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'zstd':
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotArchive:
+    """Content-addressed, quota-bounded store of results-page HTML with a SQLite index"""
+
+    def __init__(self, directory: str, quota_bytes: Optional[int] = None, encoding: Optional[str] = None):
+        self.directory = directory
+        self.quota_bytes = quota_bytes
+        self.encoding = encoding or default_encoding()
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(directory, 'index.sqlite3'), check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        # Running total of compressed bytes, so storing a page doesn't re-sum the index
+        self.total_bytes = self.db.execute('SELECT COALESCE(SUM(stored_size), 0) FROM blobs').fetchone()[0]
+
+    def blob_path(self, digest: str, encoding: str) -> str:
+        return os.path.join(self.directory, 'objects', digest[:2], digest[2:] + ENCODING_SUFFIXES[encoding])
+
+    def store(self, page_html: str, airport: str = None, departure_date=None, return_date=None,
+              duration: int = None, url: str = None, run_id: str = None,
+              scraped_at: str = None) -> Optional[str]:
+        """Archive a page and index it; returns its content hash (stored once however often it is seen),
+        or None if the page alone is bigger than the quota and was not archived"""
+        data = page_html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+
+        with self.lock:
+            row = self.db.execute('SELECT encoding, stored_size FROM blobs WHERE hash = ?', (digest,)).fetchone()
+            if row and os.path.exists(self.blob_path(digest, row['encoding'])):
+                self.db.execute('UPDATE blobs SET last_access = ? WHERE hash = ?', (now, digest))
+            else:
+                stored = compress(data, self.encoding)
+                if self.quota_bytes and len(stored) > self.quota_bytes:
+                    logger.warning(f"Not archiving a {len(stored)} byte page: larger than the "
+                                   f"{self.quota_bytes} byte quota")
+                    return None
+                path = self.blob_path(digest, self.encoding)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp = f"{path}.{os.getpid()}.tmp"
+                with open(temp, 'wb') as f:
+                    f.write(stored)
+                os.replace(temp, path)
+                self.db.execute(
+                    'INSERT OR REPLACE INTO blobs (hash, encoding, size, stored_size, created_at, last_access) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (digest, self.encoding, len(data), len(stored), now, now)
+                )
+                self.total_bytes += len(stored) - (row['stored_size'] if row else 0)
+
+            self.db.execute(
+                'INSERT INTO snapshots (hash, airport, departure_date, return_date, duration, url, run_id, scraped_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (digest, airport, format_date(departure_date), format_date(return_date), duration, url, run_id,
+                 scraped_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+            self.db.commit()
+            if self.quota_bytes:
+                self.enforce_quota(keep=digest)
+        return digest
+
+    def load(self, digest: str) -> str:
+        """HTML of an archived page (KeyError if it was never stored or has been evicted)"""
+        with self.lock:
+            row = self.db.execute('SELECT encoding FROM blobs WHERE hash = ?', (digest,)).fetchone()
+            if row is None:
+                raise KeyError(digest)
+            self.db.execute('UPDATE blobs SET last_access = ? WHERE hash = ?', (time.time(), digest))
+            self.db.commit()
+        try:
+            with open(self.blob_path(digest, row['encoding']), 'rb') as f:
+                return decompress(f.read(), row['encoding']).decode('utf-8')
+        except FileNotFoundError:
+            raise KeyError(digest)
+
+    def find(self, airport: str = None, departure_date=None, duration: int = None, run_id: str = None,
+             since: str = None, until: str = None, limit: int = None) -> List[Dict]:
+        """Index entries matching the filters, oldest scrape first"""
+        clauses, params = [], []
+        for column, value in (('airport', airport), ('departure_date', format_date(departure_date)),
+                              ('duration', duration), ('run_id', run_id)):
+            if value is not None:
+                clauses.append(f"s.{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append('s.scraped_at >= ?')
+            params.append(since)
+        if until:
+            clauses.append('s.scraped_at <= ?')
+            params.append(until)
+        query = ('SELECT s.*, b.size, b.stored_size, b.encoding FROM snapshots s JOIN blobs b ON b.hash = s.hash'
+                 + (' WHERE ' + ' AND '.join(clauses) if clauses else '') + ' ORDER BY s.scraped_at, s.id')
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        with self.lock:
+            return [dict(row) for row in self.db.execute(query, params)]
+
+    def iter_pages(self, **filters) -> Iterator[Tuple[Dict, str]]:
+        """(index entry, HTML) for each matching snapshot, skipping pages evicted meanwhile"""
+        for entry in self.find(**filters):
+            try:
+                yield entry, self.load(entry['hash'])
+            except KeyError:
+                continue
+
+    def latest_run_id(self) -> Optional[str]:
+        with self.lock:
+            row = self.db.execute('SELECT run_id FROM snapshots WHERE run_id IS NOT NULL '
+                                  'ORDER BY id DESC LIMIT 1').fetchone()
+        return row['run_id'] if row else None
+
+    def resolve(self, prefix: str) -> Optional[str]:
+        """Full content hash for a unique hash prefix"""
+        with self.lock:
+            rows = self.db.execute('SELECT hash FROM blobs WHERE hash LIKE ? LIMIT 2', (prefix + '%',)).fetchall()
+        return rows[0]['hash'] if len(rows) == 1 else None
+
+    def stats(self) -> Dict:
+        with self.lock:
+            blobs = self.db.execute(
+                'SELECT COUNT(*) AS pages, COALESCE(SUM(size), 0) AS size, '
+                'COALESCE(SUM(stored_size), 0) AS stored_size FROM blobs').fetchone()
+            snapshots = self.db.execute('SELECT COUNT(*) AS snapshots FROM snapshots').fetchone()
+        return {
+            'snapshots': snapshots['snapshots'],
+            'unique_pages': blobs['pages'],
+            'html_bytes': blobs['size'],
+            'stored_bytes': blobs['stored_size'],
+            'quota_bytes': self.quota_bytes,
+            'encoding': self.encoding
+        }
+
+    def stored_bytes(self) -> int:
+        return self.total_bytes
+
+    def enforce_quota(self, keep: str = None) -> int:
+        """Evict least recently used pages (and their index entries) until under quota; call with lock held
+
+        keep is a page that is never evicted, e.g. the one just stored.
+        """
+        total = self.total_bytes
+        evicted = 0
+        if total <= self.quota_bytes:
+            return 0
+        with closing(self.db.execute('SELECT hash, encoding, stored_size FROM blobs WHERE hash != ? '
+                                     'ORDER BY last_access', (keep or '',))) as rows:
+            victims = []
+            for row in rows:
+                if total <= self.quota_bytes:
+                    break
+                victims.append(row)
+                total -= row['stored_size']
+        for row in victims:
+            try:
+                os.remove(self.blob_path(row['hash'], row['encoding']))
+            except FileNotFoundError:
+                pass
+            self.db.execute('DELETE FROM snapshots WHERE hash = ?', (row['hash'],))
+            self.db.execute('DELETE FROM blobs WHERE hash = ?', (row['hash'],))
+            self.total_bytes -= row['stored_size']
+            evicted += 1
+        self.db.commit()
+        return evicted
+
+    def evict(self, quota_bytes: int) -> int:
+        """Shrink the archive to quota_bytes now; returns the number of pages evicted"""
+        with self.lock:
+            previous, self.quota_bytes = self.quota_bytes, quota_bytes
+            try:
+                return self.enforce_quota()
+            finally:
+                self.quota_bytes = previous
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+def format_date(value) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return value.strftime("%Y-%m-%d")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect the raw results-page archive')
+    parser.add_argument('directory', help='Archive directory (the scraper\'s snapshot_dir)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help='Page counts and sizes')
+    list_parser = subparsers.add_parser('list', help='List archived pages')
+    list_parser.add_argument('--airport', help='Airport code, e.g. BRS')
+    list_parser.add_argument('--departure-date', help='YYYY-MM-DD')
+    list_parser.add_argument('--run-id', help='Scraper run')
+    list_parser.add_argument('--since', help='Scraped at or after (YYYY-MM-DD[ HH:MM:SS])')
+    list_parser.add_argument('--limit', type=int, default=50)
+    show_parser = subparsers.add_parser('show', help='Print the HTML of a page')
+    show_parser.add_argument('hash', help='Content hash from list')
+    evict_parser = subparsers.add_parser('evict', help='Shrink the archive to a size')
+    evict_parser.add_argument('--quota-mb', type=float, required=True)
+    args = parser.parse_args()
+
+    archive = SnapshotArchive(args.directory)
+    try:
+        if args.command == 'stats':
+            stats = archive.stats()
+            ratio = stats['html_bytes'] / stats['stored_bytes'] if stats['stored_bytes'] else 0
+            print(f"📦 {stats['snapshots']:,} snapshots of {stats['unique_pages']:,} unique pages")
+            print(f"   {stats['html_bytes'] / 1024 / 1024:.1f} MB of HTML stored in "
+                  f"{stats['stored_bytes'] / 1024 / 1024:.1f} MB ({ratio:.1f}x, {stats['encoding']} for new pages)")
+        elif args.command == 'list':
+            for entry in archive.find(airport=args.airport, departure_date=args.departure_date,
+                                      run_id=args.run_id, since=args.since, limit=args.limit):
+                print(f"{entry['hash'][:16]}  {entry['scraped_at']}  {entry['airport'] or '-':4} "
+                      f"{entry['departure_date'] or '-'} {entry['duration'] or '-':>3}d  "
+                      f"{entry['size'] / 1024:7.1f} KiB  {entry['run_id'] or ''}")
+        elif args.command == 'show':
+            digest = archive.resolve(args.hash)
+            if not digest:
+                print(f"❌ No single archived page matches {args.hash}", file=sys.stderr)
+                sys.exit(1)
+            sys.stdout.write(archive.load(digest))
+        elif args.command == 'evict':
+            evicted = archive.evict(int(args.quota_mb * 1024 * 1024))
+            print(f"🧹 Evicted {evicted} pages")
+    finally:
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
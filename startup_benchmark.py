@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the EasyJet Deal Scraper entry points
+Imports each entry point in a fresh interpreter with python -X importtime,
+reports the wall time, the slowest imports and any heavy dependency that
+was loaded even though nothing was scraped yet:
+
+    python startup_benchmark.py
+    python startup_benchmark.py --check          # exit 1 if a heavy package loads at startup
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Entry point -> command line arguments that start it without doing real work
+ENTRY_POINTS = {
+    'run_scraper': ['run_scraper.py', '--list-airports'],
+    'web_gui': ['-c', 'import web_gui'],
+    'gui_scraper': ['-c', 'import gui_scraper'],
+    'portable_launcher': ['-c', 'import portable_launcher']
+}
+
+# Packages that should only load once a scrape or a download needs them
+HEAVY_PACKAGES = ('selenium', 'webdriver_manager', 'pandas', 'numpy', 'requests', 'bs4', 'lxml',
+                  'pyarrow', 'zstandard')
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Rows of 'import time: self | cumulative | name' output, in import order"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        name = fields[2].rstrip()
+        imports.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip())) // 2,
+            'self_us': int(fields[0]),
+            'cumulative_us': int(fields[1])
+        })
+    return imports
+
+
+def run_entry_point(args: List[str], importtime: bool = False):
+    """Run one entry point in a new interpreter; returns (seconds, completed process)"""
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + args
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=REPO_DIR, capture_output=True, text=True, timeout=120)
+    return time.perf_counter() - start, result
+
+
+def measure_entry_point(name: str, repeat: int = 5, top: int = 10) -> Dict:
+    """Median wall time over repeat runs, plus the import breakdown of one run"""
+    args = ENTRY_POINTS[name]
+    seconds, result = run_entry_point(args, importtime=True)
+    if result.returncode != 0:
+        error = (result.stderr.strip().splitlines() or ['failed'])[-1]
+        return {'status': 'failed', 'error': error}
+
+    imports = parse_importtime(result.stderr)
+    timings = [run_entry_point(args)[0] for _ in range(repeat)]
+    packages = {entry['module'].split('.')[0] for entry in imports}
+    return {
+        'status': 'ok',
+        'median_s': statistics.median(timings),
+        'min_s': min(timings),
+        'runs': len(timings),
+        'import_s': sum(entry['cumulative_us'] for entry in imports if entry['depth'] == 0) / 1e6,
+        'modules': len(imports),
+        'heavy_packages': sorted(package for package in HEAVY_PACKAGES if package in packages),
+        'slowest_imports': [
+            {'module': entry['module'], 'cumulative_ms': entry['cumulative_us'] / 1000}
+            for entry in sorted((e for e in imports if e['depth'] == 0),
+                                key=lambda e: e['cumulative_us'], reverse=True)[:top]
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure entry point startup times with -X importtime')
+    parser.add_argument('--entry-points', nargs='+', choices=list(ENTRY_POINTS), default=list(ENTRY_POINTS),
+                       help='Entry points to measure')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per entry point (the median is reported)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest top-level imports to list')
+    parser.add_argument('--output', default=None, help='Also write the results as JSON')
+    parser.add_argument('--check', action='store_true',
+                       help='Exit with an error if any entry point fails to start or loads a heavy '
+                            'package at startup')
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.entry_points:
+        print(f"🚀 {name}")
+        result = measure_entry_point(name, args.repeat, args.top)
+        results[name] = result
+        if result['status'] != 'ok':
+            print(f"   ⏭️  could not start: {result['error']}")
+            continue
+        print(f"   ⏱️  {result['median_s'] * 1000:.0f} ms median startup, "
+              f"{result['import_s'] * 1000:.0f} ms importing {result['modules']} modules")
+        for entry in result['slowest_imports']:
+            print(f"      {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+        if result['heavy_packages']:
+            print(f"   ⚠️  heavy packages loaded at startup: {', '.join(result['heavy_packages'])}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.check:
+        # An entry point that doesn't start at all can't be shown to start lightly
+        failed = [name for name, result in results.items() if result['status'] != 'ok']
+        offenders = [name for name, result in results.items() if result.get('heavy_packages')]
+        if failed:
+            print(f"\n❌ Could not start: {', '.join(failed)}")
+        if offenders:
+            print(f"\n❌ Heavy packages imported at startup by: {', '.join(offenders)}")
+        if failed or offenders:
+            sys.exit(1)
+        print("\n✅ No heavy packages imported at startup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Synthetic deal and results-page generator for EasyJet Deal Scraper
+Produces realistic holiday deals and matching holiday-card HTML pages as
+streams, so datasets of millions of rows (or several GB) can be written
+without holding them in memory:
+
+    python synthetic_data.py deals --count 1000000 --output big_deals.csv
+    python synthetic_data.py deals --target-mb 4096 --output huge_deals.csv.gz
+    python synthetic_data.py pages --pages 500 --cards 40 --output-dir fixtures/pages
+"""
+
+import argparse
+import csv
+import gzip
+import html
+import io
+import math
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, Optional
+
+from config import AIRPORT_CODES, CSV_HEADERS, EASYJET_BASE_URL
+
+# (destination, country, typical price per person per night in £)
+DESTINATIONS = [
+    ('Palma, Majorca', 'Spain', 62), ('Alcudia, Majorca', 'Spain', 58), ('Ibiza', 'Spain', 75),
+    ('Tenerife', 'Spain', 60), ('Lanzarote', 'Spain', 57), ('Gran Canaria', 'Spain', 59),
+    ('Malaga, Costa del Sol', 'Spain', 55), ('Barcelona', 'Spain', 80), ('Menorca', 'Spain', 66),
+    ('Faro, Algarve', 'Portugal', 56), ('Lisbon', 'Portugal', 70), ('Madeira', 'Portugal', 64),
+    ('Rome', 'Italy', 85), ('Naples, Amalfi Coast', 'Italy', 90), ('Sicily', 'Italy', 68),
+    ('Sardinia', 'Italy', 74), ('Lake Garda', 'Italy', 72), ('Santorini', 'Greece', 105),
+    ('Crete', 'Greece', 61), ('Rhodes', 'Greece', 58), ('Corfu', 'Greece', 60),
+    ('Kos', 'Greece', 55), ('Zante', 'Greece', 52), ('Dubrovnik', 'Croatia', 88),
+    ('Split', 'Croatia', 76), ('Antalya', 'Turkey', 48), ('Dalaman', 'Turkey', 46),
+    ('Bodrum', 'Turkey', 54), ('Paphos', 'Cyprus', 58), ('Larnaca', 'Cyprus', 56),
+    ('Marrakech', 'Morocco', 50), ('Agadir', 'Morocco', 47), ('Hurghada', 'Egypt', 45),
+    ('Sharm el Sheikh', 'Egypt', 47), ('Prague', 'Czech Republic', 52), ('Budapest', 'Hungary', 50),
+    ('Amsterdam', 'Netherlands', 95), ('Paris', 'France', 98), ('Nice', 'France', 92),
+    ('Reykjavik', 'Iceland', 120)
+]
+HOTEL_PREFIXES = ['Hotel', 'Grand', 'Royal', 'Iberostar', 'Sol', 'Melia', 'Riu', 'Aparthotel',
+                  'Sunwing', 'Blue Sea', 'Atlantica', 'Mitsis', 'Louis', 'Barcelo', 'H10']
+HOTEL_SUFFIXES = ['Palace', 'Resort', 'Beach', 'Marina', 'Suites', 'Gardens', 'Bay', 'Plaza',
+                  'Village', 'Spa', 'Park', 'Vista', 'Sands', 'Boutique', 'Club']
+# Board type -> price multiplier and how common it is
+BOARD_TYPES = {
+    'Room Only': (1.0, 0.15), 'Self Catering': (0.95, 0.10), 'Bed & Breakfast': (1.12, 0.25),
+    'Half Board': (1.3, 0.20), 'Full Board': (1.45, 0.05), 'All Inclusive': (1.7, 0.25)
+}
+ROOM_TYPES = {
+    'Double Room': 1.0, 'Twin Room': 1.0, 'Double Room Sea View': 1.15, 'Family Room': 1.25,
+    'Junior Suite': 1.4, 'Studio': 0.9, 'Apartment': 1.1, 'Superior Double': 1.2
+}
+# Regional airports cost slightly more than the London airports
+AIRPORT_PRICE_FACTOR = {'LGW': 0.97, 'LTN': 0.96, 'STN': 0.96}
+
+
+def season_factor(day: datetime) -> float:
+    """Price multiplier peaking in late July/August and around Christmas"""
+    summer = math.exp(-((day.timetuple().tm_yday - 215) / 35) ** 2)
+    christmas = 0.35 if (day.month == 12 and day.day >= 18) or (day.month == 1 and day.day <= 3) else 0.0
+    return 0.85 + 0.65 * summer + christmas
+
+
+class DealGenerator:
+    """Deterministic stream of deals with the same fields the scraper writes"""
+
+    def __init__(self, seed: int = 0, start_date: Optional[datetime] = None, days_ahead: int = 365,
+                 airports: Optional[Iterable[str]] = None, base_url: str = EASYJET_BASE_URL):
+        self.rng = random.Random(seed)
+        self.base_url = base_url
+        self.start_date = start_date or datetime(datetime.now().year, 1, 1)
+        self.days_ahead = days_ahead
+        self.airports = list(airports or AIRPORT_CODES)
+        self.board_types = list(BOARD_TYPES)
+        self.board_weights = [weight for _, weight in BOARD_TYPES.values()]
+        self.room_types = list(ROOM_TYPES)
+        self.hotels = {}
+        self.counter = 0
+
+    def hotel_for(self, destination: str) -> str:
+        """One of a fixed set of hotels per destination, so hotels repeat like real results"""
+        hotels = self.hotels.get(destination)
+        if hotels is None:
+            rng = random.Random(destination)
+            place = destination.split(',')[0]
+            hotels = [f"{rng.choice(HOTEL_PREFIXES)} {place} {rng.choice(HOTEL_SUFFIXES)}" for _ in range(25)]
+            self.hotels[destination] = hotels
+        return self.rng.choice(hotels)
+
+    def deal(self) -> Dict:
+        rng = self.rng
+        self.counter += 1
+        airport = rng.choice(self.airports)
+        destination, country, nightly = rng.choice(DESTINATIONS)
+        duration = rng.choice((7, 7, 7, 10, 14, 14, 8, 9, 11, 12, 13))
+        departure = self.start_date + timedelta(days=rng.randrange(self.days_ahead))
+        board_type = rng.choices(self.board_types, self.board_weights)[0]
+        room_type = rng.choice(self.room_types)
+
+        per_person = (nightly * duration * season_factor(departure) * BOARD_TYPES[board_type][0]
+                      * ROOM_TYPES[room_type] * AIRPORT_PRICE_FACTOR.get(AIRPORT_CODES.get(airport), 1.03)
+                      * rng.lognormvariate(0, 0.18) + 60)  # + flights and transfers
+        total = int(round(per_person * 2))
+
+        return {
+            'departure_airport': airport,
+            'destination': f"{destination}, {country}",
+            'departure_date': departure.strftime("%Y-%m-%d"),
+            'return_date': (departure + timedelta(days=duration)).strftime("%Y-%m-%d"),
+            'duration_days': duration,
+            'hotel_name': self.hotel_for(destination),
+            'board_type': board_type,
+            'room_type': room_type,
+            'total_price': f"£{total:,}",
+            'price_per_person': f"£{total / 2:.2f}",
+            'deal_url': f"{self.base_url}/holidays/deal/{rng.getrandbits(32):08x}-{self.counter}",
+            'scraped_date': (self.start_date - timedelta(seconds=rng.randrange(86400))).strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        while True:
+            yield self.deal()
+
+
+def iter_deals(count: int, seed: int = 0, **kwargs) -> Iterator[Dict]:
+    """count synthetic deals"""
+    generator = iter(DealGenerator(seed, **kwargs))
+    for _ in range(count):
+        yield next(generator)
+
+
+def render_card(deal: Dict) -> str:
+    """A holiday-card element with the markup extract_deal_info reads"""
+    return f"""
+    <div class="holiday-card">
+      <a href="{html.escape(deal['deal_url'])}">
+        <h3 class="hotel-name">{html.escape(deal['hotel_name'])}</h3>
+      </a>
+      <p class="destination">{html.escape(deal['destination'])}</p>
+      <span class="board-type">{html.escape(deal['board_type'])}</span>
+      <span class="room-type">{html.escape(deal['room_type'])}</span>
+      <span class="price">{html.escape(deal['total_price'])}</span>
+    </div>"""
+
+
+def render_calendar(rng: random.Random, start: datetime, days: int = 31) -> str:
+    """Month calendar days with data-date and a lowest price, as read in calendar mode"""
+    cells = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        price = ''
+        if rng.random() >= 0.1:  # Some days have no availability
+            price = f'<span class="calendar-price">£{int(900 * season_factor(day) * rng.lognormvariate(0, 0.2)):,}</span>'
+        cells.append(f'<div class="calendar-day" data-date="{day.strftime("%Y-%m-%d")}">{price}</div>')
+    return '\n'.join(cells)
+
+
+def render_results_page(deals: Iterable[Dict], calendar_rng: Optional[random.Random] = None,
+                        calendar_start: Optional[datetime] = None, next_url: Optional[str] = None) -> str:
+    """Holidays search page: cookie banner, search form, sort button, calendar, result cards
+    and, given next_url, a link to the next page of results"""
+    calendar_rng = calendar_rng or random.Random(0)
+    calendar_start = calendar_start or datetime.now() + timedelta(days=1)
+    card_html = ''.join(render_card(deal) for deal in deals)
+    if next_url:
+        card_html += f'\n    <nav class="pagination"><a rel="next" class="next" href="{html.escape(next_url)}">Next</a></nav>'
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>easyJet holidays (synthetic)</title></head>
+<body>
+  <div id="cookie-banner"><button id="ensCloseBanner">Accept cookies</button></div>
+  <form id="holiday-search">
+    <input id="departure-airport" name="departure-airport" type="text">
+    <input id="departure-date" name="departure-date" type="text">
+    <input id="return-date" name="return-date" type="text">
+  </form>
+  <div class="calendar">
+{render_calendar(calendar_rng, calendar_start)}
+  </div>
+  <button type="button" data-sort="price">Sort by Price</button>
+  <div class="results">{card_html}
+  </div>
+</body>
+</html>"""
+
+
+def open_output(path: str, mode: str = 'wt'):
+    """Open a file for writing, gzip-compressed when it ends in .gz"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8', newline='', compresslevel=5)
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def write_deals_csv(path: str, count: Optional[int] = None, target_bytes: Optional[int] = None,
+                    seed: int = 0, chunk_rows: int = 10000, summary: bool = True, **kwargs) -> int:
+    """Stream deals to a CSV until count rows or target_bytes of CSV text; returns rows written
+
+    Rows are formatted in chunks through an in-memory buffer, so memory use
+    stays constant however large the file gets.
+    """
+    from results_summary import SummaryBuilder
+
+    if count is None and target_bytes is None:
+        raise ValueError("Give a row count or a target size")
+
+    builder = SummaryBuilder() if summary and not path.endswith('.gz') else None
+    generator = iter(DealGenerator(seed, **kwargs))
+    rows = written_bytes = 0
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_HEADERS)
+    writer.writeheader()
+
+    with open_output(path) as out:
+        while (count is None or rows < count) and (target_bytes is None or written_bytes < target_bytes):
+            batch = chunk_rows if count is None else min(chunk_rows, count - rows)
+            for _ in range(batch):
+                deal = next(generator)
+                writer.writerow(deal)
+                if builder:
+                    builder.add(deal)
+            rows += batch
+            data = buffer.getvalue()
+            out.write(data)
+            written_bytes += len(data.encode('utf-8'))
+            buffer.seek(0)
+            buffer.truncate()
+
+    if builder:
+        builder.save(path)
+    return rows
+
+
+def write_pages(output_dir: str, pages: int, cards: int = 20, seed: int = 0, **kwargs) -> int:
+    """Write pages of holiday cards as page_000001.html...; returns the number of cards written"""
+    os.makedirs(output_dir, exist_ok=True)
+    generator = iter(DealGenerator(seed, **kwargs))
+    calendar_rng = random.Random(seed)
+    for page in range(1, pages + 1):
+        deals = [next(generator) for _ in range(cards)]
+        with open(os.path.join(output_dir, f"page_{page:06d}.html"), 'w', encoding='utf-8') as f:
+            f.write(render_results_page(deals, calendar_rng))
+    return pages * cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic deals and results pages')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    deals_parser = subparsers.add_parser('deals', help='Write a results CSV of synthetic deals')
+    deals_parser.add_argument('--output', default='synthetic_deals.csv', help='CSV path (.gz to compress)')
+    deals_parser.add_argument('--count', type=int, default=None, help='Number of deals')
+    deals_parser.add_argument('--target-mb', type=float, default=None,
+                              help='Keep writing until this many MB of CSV (uncompressed) are produced')
+    deals_parser.add_argument('--no-summary', action='store_true', help="Don't write the .summary.json sidecar")
+
+    pages_parser = subparsers.add_parser('pages', help='Write HTML results pages with holiday cards')
+    pages_parser.add_argument('--output-dir', default='synthetic_pages', help='Directory for the pages')
+    pages_parser.add_argument('--pages', type=int, default=100, help='Number of pages')
+    pages_parser.add_argument('--cards', type=int, default=20, help='Holiday cards per page')
+
+    for sub in (deals_parser, pages_parser):
+        sub.add_argument('--seed', type=int, default=0, help='Random seed (same seed, same data)')
+        sub.add_argument('--airports', nargs='+', default=None, help='Departure airports (default: all)')
+        sub.add_argument('--days-ahead', type=int, default=365, help='Spread of departure dates')
+
+    args = parser.parse_args()
+    options = {'airports': args.airports, 'days_ahead': args.days_ahead}
+
+    if args.command == 'deals':
+        count = args.count if args.count is not None or args.target_mb else 100000
+        target = int(args.target_mb * 1024 * 1024) if args.target_mb else None
+        print(f"🧪 Writing synthetic deals to {args.output}...")
+        rows = write_deals_csv(args.output, count, target, args.seed, summary=not args.no_summary, **options)
+        print(f"✅ {rows:,} deals, {os.path.getsize(args.output) / 1024 / 1024:.1f} MB on disk")
+    else:
+        print(f"🧪 Writing {args.pages} pages of {args.cards} cards to {args.output_dir}...")
+        cards = write_pages(args.output_dir, args.pages, args.cards, args.seed, **options)
+        print(f"✅ {cards:,} cards written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Tests for the coarse-to-fine date sweep
+"""
+
+import os
+from datetime import datetime, timedelta
+
+from date_sweep import CoarseToFineSweep, compare_with_exhaustive, load_price_calendar
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'price_calendar.json')
+
+
+def sweep_over(prices, budget):
+    """Sweep a {(departure_date, duration): price} calendar, returning it and the windows it searched"""
+    searched = []
+    search_dates = [(departure_date, departure_date + timedelta(days=duration), duration)
+                    for departure_date, duration in sorted(prices)]
+
+    def search_fn(departure_date, return_date, duration):
+        searched.append((departure_date, duration))
+        return [{'total_price': prices[(departure_date, duration)]}]
+
+    sweep = CoarseToFineSweep(search_fn, search_dates, budget)
+    sweep.run()
+    return sweep, searched
+
+
+def test_fixture_sweep_spends_budget_and_finds_cheapest_window():
+    calendar = load_price_calendar(FIXTURE)
+    for budget in (10, 40, 80):
+        result = compare_with_exhaustive(calendar, budget)
+        assert result['sweep_requests'] == budget
+        assert result['sweep_price'] >= result['exhaustive_price']
+
+    result = compare_with_exhaustive(calendar, 80)
+    assert result['price_gap_pct'] == 0
+    assert result['sweep_window'] == result['exhaustive_window']
+
+
+def test_fixture_sweep_with_full_budget_searches_every_window_once():
+    calendar = load_price_calendar(FIXTURE)
+    sweep, searched = sweep_over(calendar, len(calendar))
+    assert sweep.requests_used == len(calendar)
+    assert sorted(searched) == sorted(calendar)
+
+
+def test_gap_whose_middle_was_searched_as_a_neighbour_is_still_refined():
+    """A cheap 7-day trip makes the sweep search the same date for 8 days, which is the
+    middle of a later 8-day gap; the windows either side of it must still be searched"""
+    start = datetime(2026, 6, 1)
+    departure_dates = [start + timedelta(days=i) for i in range(9)]
+    prices = {(departure_date, 8): 500 for departure_date in departure_dates}
+    prices[(departure_dates[6], 7)] = 100
+
+    sweep, searched = sweep_over(prices, len(prices))
+    assert sweep.requests_used == len(prices)
+    assert sorted(searched) == sorted(prices)
+    assert sweep.best_window() == (departure_dates[6], 7)
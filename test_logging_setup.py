@@ -0,0 +1,76 @@
+"""
+Tests for log file rotation, JSON log lines and log level parsing
+"""
+
+import gzip
+import json
+import logging
+
+import pytest
+
+from logging_setup import (CompressedRotatingFileHandler, JsonFormatter, configure_logging, log_level,
+                           parse_levels, shutdown_logging)
+
+
+def make_record(message, **extra):
+    record = logging.LogRecord('easyjet_scraper', logging.INFO, __file__, 1, message, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_rotated_files_are_gzipped(tmp_path):
+    log_file = tmp_path / 'scraper.log'
+    handler = CompressedRotatingFileHandler(str(log_file), max_bytes=200, backup_count=2)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        for i in range(30):
+            handler.emit(make_record(f"line {i:02d} " + 'x' * 40))
+    finally:
+        handler.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['scraper.log', 'scraper.log.1.gz', 'scraper.log.2.gz']
+    with gzip.open(tmp_path / 'scraper.log.1.gz', 'rt', encoding='utf-8') as f:
+        rotated = f.read().splitlines()
+    current = log_file.read_text(encoding='utf-8').splitlines()
+    # The newest rotated file holds the lines just before the current file's
+    assert int(rotated[-1].split()[1]) + 1 == int(current[0].split()[1])
+    assert current[-1].startswith('line 29')
+
+
+def test_uncompressed_rotation_keeps_plain_backups(tmp_path):
+    handler = CompressedRotatingFileHandler(str(tmp_path / 'scraper.log'), max_bytes=100, backup_count=1,
+                                            compress=False)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        for i in range(10):
+            handler.emit(make_record('y' * 40))
+    finally:
+        handler.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['scraper.log', 'scraper.log.1']
+
+
+def test_json_lines_carry_extras():
+    entry = json.loads(JsonFormatter().format(make_record('Searching', instance=3, airports='BRS')))
+    assert entry['message'] == 'Searching'
+    assert entry['level'] == 'INFO' and entry['logger'] == 'easyjet_scraper'
+    assert (entry['instance'], entry['airports']) == (3, 'BRS')
+
+
+def test_log_levels_are_validated():
+    assert log_level('debug') == 'DEBUG'
+    assert parse_levels(['selenium=warning', 'search_planner=DEBUG']) == {
+        'selenium': 'WARNING', 'search_planner': 'DEBUG'}
+    with pytest.raises(ValueError):
+        log_level('foo')
+    with pytest.raises(ValueError):
+        parse_levels(['selenium=loud'])
+    with pytest.raises(ValueError):
+        parse_levels(['selenium'])
+
+
+def test_configure_logging_accepts_levels_none():
+    try:
+        assert configure_logging({'levels': None, 'log_file': None, 'console': False}, force=True)
+    finally:
+        shutdown_logging()
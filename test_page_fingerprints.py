@@ -0,0 +1,149 @@
+"""
+Tests for page fingerprints and reusing unchanged results pages
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from config import DEFAULT_CONFIG
+from lazy_imports import is_available
+from page_fingerprints import PageFingerprints, fingerprint, window_key
+from snapshot_archive import SnapshotArchive
+from synthetic_data import DealGenerator, render_card, render_results_page
+
+SETTINGS = {'max_deals_per_search': 50, 'min_price': 100, 'price_threshold': 2000, 'sort_by_price': True}
+
+
+def future_window():
+    departure = datetime.now() + timedelta(days=30)
+    return departure, departure + timedelta(days=7)
+
+
+def sample_deals(count=3):
+    generator = iter(DealGenerator('fingerprints', base_url=''))
+    return [next(generator) for _ in range(count)]
+
+
+def test_fingerprint_ignores_whitespace():
+    assert fingerprint('<div>a</div>\n  <div>b</div>') == fingerprint('<div>a</div> <div>b</div>')
+    assert fingerprint('<div>a</div>') != fingerprint('<div>b</div>')
+
+
+def test_lookup_reuses_remembered_deals_with_new_scraped_date(tmp_path):
+    departure, return_date = future_window()
+    key = window_key('BRS', departure, return_date, 7)
+    deals = [dict(deal, scraped_date='2000-01-01 00:00:00') for deal in sample_deals()]
+
+    store = PageFingerprints(str(tmp_path / 'deals.fingerprints.json'), SETTINGS)
+    store.remember(key, 'abc', deals)
+    store.save()
+
+    reloaded = PageFingerprints(str(tmp_path / 'deals.fingerprints.json'), SETTINGS)
+    reused = reloaded.lookup(key, 'abc')
+    assert [deal['hotel_name'] for deal in reused] == [deal['hotel_name'] for deal in deals]
+    assert all(deal['scraped_date'] != '2000-01-01 00:00:00' for deal in reused)
+    assert reloaded.lookup(key, 'changed') is None
+    assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+
+def test_settings_mismatch_discards_stored_windows(tmp_path):
+    departure, return_date = future_window()
+    key = window_key('BRS', departure, return_date, 7)
+    filename = str(tmp_path / 'deals.fingerprints.json')
+    store = PageFingerprints(filename, SETTINGS)
+    store.remember(key, 'abc', sample_deals())
+    store.save()
+
+    assert PageFingerprints(filename, dict(SETTINGS, price_threshold=900)).lookup(key, 'abc') is None
+
+
+def test_save_drops_past_departures(tmp_path):
+    filename = str(tmp_path / 'deals.fingerprints.json')
+    past = datetime.now() - timedelta(days=10)
+    departure, return_date = future_window()
+    store = PageFingerprints(filename, SETTINGS)
+    store.remember(window_key('BRS', past, past + timedelta(days=7), 7), 'old', [])
+    store.remember(window_key('BRS', departure, return_date, 7), 'new', [])
+    store.save()
+
+    with open(filename, encoding='utf-8') as f:
+        windows = json.load(f)['windows']
+    assert [window['fingerprint'] for window in windows.values()] == ['new']
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    filename = tmp_path / 'deals.fingerprints.json'
+    filename.write_text('{not json', encoding='utf-8')
+    assert PageFingerprints(str(filename), SETTINGS).windows == {}
+
+
+class FakeElement:
+    def clear(self):
+        pass
+
+    def send_keys(self, *keys):
+        pass
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for search_specific_dates on an unchanged page"""
+
+    def __init__(self, page_html, cards_html):
+        self.page_source = page_html
+        self.cards_html = cards_html
+        self.current_url = 'http://localhost/en/holidays'
+
+    def find_elements(self, by, value):
+        return [FakeElement()] if value == '#departure-airport' else []
+
+    def execute_script(self, script, *args):
+        assert 'outerHTML' in script
+        return self.cards_html
+
+
+def test_unchanged_window_is_still_archived_for_reparse(tmp_path):
+    """A run that reuses a window's deals must still archive its page, so --reparse rebuilds every window"""
+    from easyjet_scraper import EasyJetScraper
+
+    deals = sample_deals()
+    cards_html = '\n'.join(render_card(deal) for deal in deals)
+    page_html = render_results_page(deals)
+    departure, return_date = future_window()
+
+    config = dict(DEFAULT_CONFIG, timings_file=None, output_file=str(tmp_path / 'deals.csv'),
+                  snapshot_dir=str(tmp_path / 'snapshots'), logging={'log_file': None, 'console': False})
+    scraper = EasyJetScraper(config)
+    scraper.sleep = lambda seconds: None
+    scraper.wait_for = lambda condition, timeout, element='element': True
+    scraper.driver = FakeDriver(page_html, cards_html)
+    scraper.setup_snapshot_archive()
+    scraper.setup_page_fingerprints()
+    key = window_key('BRS', departure, return_date, 7)
+    scraper.page_fingerprints.remember(key, fingerprint(cards_html), deals)
+
+    scraper.run_id = 'second-run'
+    reused = scraper.search_specific_dates('BRS', departure, return_date, 7)
+    scraper.close_snapshot_archive()
+    assert len(reused) == len(deals)
+
+    archive = SnapshotArchive(str(tmp_path / 'snapshots'))
+    try:
+        assert archive.latest_run_id() == 'second-run'
+        pages = list(archive.iter_pages(run_id='second-run'))
+    finally:
+        archive.close()
+    assert len(pages) == 1
+    entry, archived_html = pages[0]
+    assert entry['airport'] == 'BRS' and entry['departure_date'] == departure.strftime('%Y-%m-%d')
+    assert archived_html == page_html
+
+    if not is_available('lxml'):
+        return
+    from html_parser import parse_results_page
+    result = parse_results_page(archived_html, {
+        'departure_airport': 'Bristol', 'departure_date': entry['departure_date'],
+        'return_date': entry['return_date'], 'duration': 7, 'scraped_date': entry['scraped_at'],
+        'page_url': entry['url'], 'max_deals': 50, 'min_price': 0, 'max_price': 100000,
+        'sort_by_price': True
+    })
+    assert result['cards'] == len(deals)
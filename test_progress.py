@@ -0,0 +1,41 @@
+"""
+Tests for progress events, including deals parsed after their search finished
+"""
+
+from progress import ProgressTracker
+
+
+def tracked_events(tracker):
+    events = []
+    tracker.subscribe(events.append)
+    return events
+
+
+def test_task_reports_its_deals():
+    tracker = ProgressTracker(timings_file=None)
+    events = tracked_events(tracker)
+    tracker.plan(1)
+    with tracker.task(kind='search', airport_code='BRS') as task:
+        task['deals'] = 4
+
+    completed = [event for event in events if event['type'] == 'task_completed']
+    assert [event['deals'] for event in completed] == [4]
+    assert completed[0]['progress']['deals_found'] == 4
+
+
+def test_deferred_deals_are_credited_to_their_task():
+    tracker = ProgressTracker(timings_file=None)
+    events = tracked_events(tracker)
+    tracker.plan(1)
+    with tracker.task(kind='search', airport_code='BRS', departure_date='2026-06-01') as task:
+        fields = tracker.defer_current()
+        task['deals'] = 0
+
+    tracker.add_deals(3, task=fields)
+    completed = [event for event in events if event['type'] == 'task_completed']
+    added = [event for event in events if event['type'] == 'deals_added']
+    assert completed[0]['deals'] is None
+    assert added[0]['count'] == 3
+    assert added[0]['task'] == {'kind': 'search', 'airport_code': 'BRS', 'departure_date': '2026-06-01'}
+    assert added[0]['progress']['deals_found'] == 3
+    assert tracker.defer_current() is None
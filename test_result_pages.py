@@ -0,0 +1,152 @@
+"""
+Tests for reading results a batch at a time across scroll loads
+"""
+
+from datetime import datetime, timedelta
+
+from config import DEFAULT_CONFIG
+from html_parser import PriceCeiling
+from page_fingerprints import fingerprint, window_key
+
+
+def test_price_ceiling_stops_above_the_ceiling():
+    ceiling = PriceCeiling(500)
+    assert [ceiling.reached(price) for price in (200, 300, 500)] == [False, False, False]
+    assert ceiling.reached(501)
+
+
+def test_price_ceiling_ignores_missing_prices():
+    ceiling = PriceCeiling(500)
+    assert not ceiling.reached(None)
+    assert ceiling.reached(600)
+
+
+def test_price_ceiling_turns_off_when_prices_are_not_ascending():
+    ceiling = PriceCeiling(500)
+    assert not ceiling.reached(400)
+    assert not ceiling.reached(300)
+    assert not ceiling.ascending
+    assert not ceiling.reached(900)
+
+
+class FakeCard:
+    def __init__(self, index):
+        self.index = index
+
+
+class ScrollingDriver:
+    """Results page that appends the next batch of cards each time it is scrolled to the bottom"""
+
+    def __init__(self, scraper, first, *appended):
+        self.scraper = scraper
+        self.cards = [FakeCard(i) for i in range(first)]
+        self.appended = list(appended)
+        self.scrolls = 0
+        self.sort_clicks = 0
+        self.fingerprinted_after_sort = None
+
+    def find_elements(self, by, value):
+        if value == 'button[data-sort="price"]':
+            return [SortButton(self)]
+        return []
+
+    def execute_script(self, script, *args):
+        if script == self.scraper.new_cards_script:
+            return [0, len(self.cards), self.cards[args[0]:]]
+        if script == self.scraper.card_count_script:
+            return len(self.cards)
+        if script == self.scraper.cards_script:
+            self.fingerprinted_after_sort = self.sort_clicks > 0
+            return ''.join(f'<div class="holiday-card">{card.index}</div>' for card in self.cards)
+        assert 'scrollTo' in script
+        self.scrolls += 1
+        if self.appended:
+            count = self.appended.pop(0)
+            self.cards += [FakeCard(len(self.cards) + i) for i in range(count)]
+
+
+class SortButton:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def click(self):
+        self.driver.sort_clicks += 1
+
+
+def make_scraper(tmp_path, **overrides):
+    from easyjet_scraper import EasyJetScraper
+
+    config = dict(DEFAULT_CONFIG, timings_file=None, output_file=str(tmp_path / 'deals.csv'),
+                  logging={'log_file': None, 'console': False}, max_result_pages=10, **overrides)
+    scraper = EasyJetScraper(config)
+    scraper.sleep = lambda seconds: None
+    scraper.waits = []
+
+    def wait_for(condition, timeout, element='element'):
+        scraper.waits.append(timeout)
+        if not condition(scraper.driver):
+            raise TimeoutError(element)
+
+    scraper.wait_for = wait_for
+    return scraper
+
+
+def batch_sizes(scraper, driver):
+    scraper.driver = driver
+    return [len(cards) for cards in scraper.result_batches()]
+
+
+def test_scrolling_stops_when_a_load_is_short(tmp_path):
+    scraper = make_scraper(tmp_path)
+    driver = ScrollingDriver(scraper, 20, 20, 5, 20)
+    assert batch_sizes(scraper, driver) == [20, 20, 5]
+    assert driver.scrolls == 2
+
+
+def test_short_first_render_is_not_scrolled(tmp_path):
+    scraper = make_scraper(tmp_path)
+    driver = ScrollingDriver(scraper, 8, 20)
+    assert batch_sizes(scraper, driver) == [8]
+    assert driver.scrolls == 0 and scraper.waits == []
+
+
+def test_scroll_is_decided_per_search(tmp_path):
+    scraper = make_scraper(tmp_path)
+    assert batch_sizes(scraper, ScrollingDriver(scraper, 20)) == [20]
+    assert scraper.waits == [DEFAULT_CONFIG['scroll_timeout']]
+
+    # Scrolling loaded nothing in the previous search, but is still tried in this one
+    driver = ScrollingDriver(scraper, 20, 20)
+    assert batch_sizes(scraper, driver) == [20, 20]
+    assert driver.scrolls == 2
+
+
+def fake_read_cards(cards, offset, deals, ceiling, *window):
+    deals.extend({'hotel_name': f'Hotel {card.index}', 'total_price': str(300 + card.index)} for card in cards)
+    return False
+
+
+def search(scraper, driver):
+    scraper.driver = driver
+    scraper.read_cards = fake_read_cards
+    scraper.setup_page_fingerprints()
+    departure = datetime.now() + timedelta(days=30)
+    deals = scraper.parse_search_results('BRS', departure, departure + timedelta(days=7), 7)
+    return deals, window_key('BRS', departure, departure + timedelta(days=7), 7)
+
+
+def test_fingerprint_is_taken_after_sorting(tmp_path):
+    scraper = make_scraper(tmp_path)
+    driver = ScrollingDriver(scraper, 8)
+    deals, key = search(scraper, driver)
+    assert driver.fingerprinted_after_sort
+    assert len(deals) == 8
+    assert scraper.page_fingerprints.lookup(key, fingerprint(driver.execute_script(scraper.cards_script)))
+
+
+def test_results_read_over_several_loads_are_not_reused(tmp_path):
+    scraper = make_scraper(tmp_path)
+    driver = ScrollingDriver(scraper, 20, 5)
+    deals, key = search(scraper, driver)
+    assert len(deals) == 25
+    assert key not in scraper.page_fingerprints.windows
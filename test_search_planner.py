@@ -0,0 +1,75 @@
+"""
+Tests for search planning: history loading, ordering and budgets
+"""
+
+from datetime import datetime
+
+from config import CSV_HEADERS, DEFAULT_CONFIG
+from search_planner import SearchPlanner, enumerate_search_dates
+
+TODAY = datetime(2026, 5, 15)
+
+
+def planner_config(tmp_path, **overrides):
+    return dict(DEFAULT_CONFIG, departure_airports=['Bristol', 'Manchester'], search_months_ahead=2,
+                min_duration=7, max_duration=8, output_file=str(tmp_path / 'deals.csv'),
+                timings_file=str(tmp_path / 'timings.json'), **overrides)
+
+
+def write_history(path, rows):
+    lines = [','.join(CSV_HEADERS)]
+    lines += [','.join(str(row.get(column, '')) for column in CSV_HEADERS) for row in rows]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def test_enumerate_search_dates_covers_every_day_and_duration(tmp_path):
+    search_dates = enumerate_search_dates(planner_config(tmp_path), today=TODAY)
+    assert len(search_dates) == 60 * 2
+    departure_date, return_date, duration = search_dates[0]
+    assert departure_date == datetime(2026, 5, 16) and (return_date - departure_date).days == duration == 7
+
+
+def test_load_history_skips_bad_rows_only(tmp_path):
+    history_file = tmp_path / 'deals.csv'
+    write_history(history_file, [
+        {'departure_airport': 'Bristol', 'departure_date': '2026-06-10', 'duration_days': 7, 'total_price': '450'},
+        {'departure_airport': 'Bristol', 'departure_date': '2026-06-20', 'duration_days': 7, 'total_price': '£399'},
+        {'departure_airport': 'Bristol', 'departure_date': '2026-06-21', 'duration_days': 'seven'},
+    ])
+    with open(history_file, 'a', encoding='utf-8') as f:
+        f.write('Bristol\n')  # Truncated row: departure_date and the rest are None
+
+    history = SearchPlanner(planner_config(tmp_path)).load_history()
+    assert history == {('Bristol', '2026-06', 7): {'deals': 2, 'min_price': 399.0}}
+
+
+def test_plan_ranks_historically_cheap_windows_first(tmp_path):
+    write_history(tmp_path / 'deals.csv', [
+        {'departure_airport': 'Bristol', 'departure_date': '2026-06-12', 'duration_days': 8, 'total_price': '300'}
+        for _ in range(5)
+    ])
+    config = planner_config(tmp_path, max_searches=6)
+    plan = SearchPlanner(config).plan(enumerate_search_dates(config, today=TODAY))
+
+    assert [(task[0].strftime('%Y-%m'), task[2]) for task in plan['Bristol']] == [('2026-06', 8)] * 3
+    # Without history, Manchester's windows are spread over both months and durations
+    assert len({(task[0].strftime('%Y-%m'), task[2]) for task in plan['Manchester']}) > 1
+
+
+def test_plan_shares_budget_round_robin_without_overlaps(tmp_path):
+    config = planner_config(tmp_path, max_searches=7)
+    plan = SearchPlanner(config).plan(enumerate_search_dates(config, today=TODAY))
+
+    assert [len(plan[airport]) for airport in ('Bristol', 'Manchester')] == [4, 3]
+    for tasks in plan.values():
+        for i, (departure_date, _, duration) in enumerate(tasks):
+            for other_departure, _, other_duration in tasks[i + 1:]:
+                assert other_duration != duration or abs((other_departure - departure_date).days) >= 3
+
+
+def test_request_budget_takes_the_tighter_limit(tmp_path):
+    config = planner_config(tmp_path, max_searches=100, time_budget_minutes=10, seconds_per_search=28,
+                            delay_between_requests=2)
+    assert SearchPlanner(config).request_budget(2) == 20
+    assert SearchPlanner(planner_config(tmp_path)).request_budget(2) == 2 * DEFAULT_CONFIG['default_searches_per_airport']
+    assert SearchPlanner(planner_config(tmp_path, default_searches_per_airport=None)).request_budget(2) is None
@@ -0,0 +1,94 @@
+"""
+Tests for selector profiles and the CSS to XPath translation used with lxml
+"""
+
+import copy
+
+import pytest
+
+from config import SELECTOR_PROFILE
+from lazy_imports import is_available
+from selector_profile import SelectorProfile, SelectorStats, css_to_xpath, xpath_literal
+
+HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+
+
+def test_simple_selectors():
+    assert css_to_xpath('.holiday-card') == 'descendant-or-self::*[' + HAS_CLASS.format('holiday-card') + ']'
+    assert css_to_xpath('#ensCloseBanner') == "descendant-or-self::*[@id='ensCloseBanner']"
+    assert css_to_xpath('a[href]') == 'descendant-or-self::a[@href]'
+    assert css_to_xpath('button[data-sort="price"]') == "descendant-or-self::button[@data-sort='price']"
+    assert css_to_xpath("div.card.featured") == ('descendant-or-self::div[' + HAS_CLASS.format('card') + '][' +
+                                                 HAS_CLASS.format('featured') + ']')
+
+
+def test_attribute_operators():
+    assert css_to_xpath('a[href^="/en"]') == "descendant-or-self::a[starts-with(@href, '/en')]"
+    assert css_to_xpath('a[href*=deal]') == "descendant-or-self::a[contains(@href, 'deal')]"
+    assert css_to_xpath("a[href$='.pdf']") == ("descendant-or-self::a[substring(@href, string-length(@href) - "
+                                               "string-length('.pdf') + 1) = '.pdf']")
+
+
+def test_combinators_and_relative_selectors():
+    assert css_to_xpath('ul > li') == 'descendant-or-self::ul/li'
+    assert css_to_xpath('.pagination  .next') == ('descendant-or-self::*[' + HAS_CLASS.format('pagination') +
+                                                  ']/descendant::*[' + HAS_CLASS.format('next') + ']')
+    # Relative selectors (card fields) never match the card itself
+    assert css_to_xpath('.price', relative=True) == 'descendant::*[' + HAS_CLASS.format('price') + ']'
+
+
+@pytest.mark.parametrize('selector', ['a:hover', 'a, b', 'div::before', 'a[href~=x]', '', 'div.a b.c > '])
+def test_unsupported_selectors_raise(selector):
+    with pytest.raises(ValueError):
+        css_to_xpath(selector)
+
+
+def test_xpath_literal_quoting():
+    assert xpath_literal('plain') == "'plain'"
+    assert xpath_literal("it's") == '"it\'s"'
+    assert xpath_literal('say "it\'s"') == "concat('say \"it', \"'\", 's\"')"
+
+
+def test_profile_validation():
+    profile = copy.deepcopy(SELECTOR_PROFILE)
+    del profile['card']
+    del profile['fields']['total_price']
+    with pytest.raises(ValueError, match='card.*fields.total_price'):
+        SelectorProfile(profile)
+
+    profile = copy.deepcopy(SELECTOR_PROFILE)
+    profile['fields']['hotel_name'] = ['xpath://h3']
+    with pytest.raises(ValueError, match='relative'):
+        SelectorProfile(profile)
+
+
+def test_stats_report_fallbacks_and_misses():
+    profile = SelectorProfile(dict(SELECTOR_PROFILE, sort_button=['.sort', '.sort-alt']))
+    stats = SelectorStats()
+    stats.record(profile.group('card'), 0, 10)
+    stats.record(profile.group('sort_button'), 0, 2)
+    stats.record(profile.group('sort_button'), 1, 1)
+    stats.record(profile.group('sort_button'), None, 1)
+    stats.record(profile.group('hotel_name'), None, 3)
+
+    assert stats.report(profile) == [
+        ('sort_button: .sort 50%, .sort-alt 25%, missing 25%', False),
+        ('hotel_name: missing 100%', True)
+    ]
+
+
+def test_translated_selectors_match_with_lxml():
+    if not is_available('lxml'):
+        return
+    from lxml import html as lxml_html
+
+    document = lxml_html.document_fromstring(
+        '<div class="results"><div class="holiday-card featured">'
+        '<a href="/en/deal/1.pdf"><span class="price">£450</span></a></div>'
+        '<div class="holiday-card"><a href="/fr/deal/2">x</a></div></div>')
+    assert len(document.xpath(css_to_xpath('.results > .holiday-card'))) == 2
+    assert len(document.xpath(css_to_xpath('div.holiday-card.featured a[href^="/en"]'))) == 1
+    assert len(document.xpath(css_to_xpath('a[href$=".pdf"]'))) == 1
+    card = document.xpath(css_to_xpath('.holiday-card'))[0]
+    assert [e.text for e in card.xpath(css_to_xpath('.price', relative=True))] == ['£450']
+    assert card.xpath(css_to_xpath('.holiday-card', relative=True)) == []
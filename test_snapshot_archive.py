@@ -0,0 +1,76 @@
+"""
+Tests for the snapshot archive's disk quota
+"""
+
+import base64
+import random
+
+import snapshot_archive
+from snapshot_archive import SnapshotArchive
+
+
+def random_page(seed, size=4000):
+    """Page HTML that barely compresses, so stored sizes are predictable"""
+    text = base64.b64encode(random.Random(seed).randbytes(size)).decode('ascii')
+    return f'<html><body>{text}</body></html>'
+
+
+def test_quota_evicts_least_recently_used_pages(tmp_path):
+    archive = SnapshotArchive(str(tmp_path), quota_bytes=None, encoding='gzip')
+    try:
+        first = archive.store(random_page(1), 'BRS')
+        page_size = archive.stored_bytes()
+        archive.quota_bytes = int(page_size * 2.5)
+        second = archive.store(random_page(2), 'BRS')
+        archive.load(first)  # first is now more recently used than second
+        third = archive.store(random_page(3), 'BRS')
+
+        assert [entry['hash'] for entry in archive.find()] == [first, third]
+        assert archive.stored_bytes() == archive.stats()['stored_bytes'] <= archive.quota_bytes
+        assert archive.load(third) == random_page(3)
+        assert second not in [entry['hash'] for entry in archive.find()]
+    finally:
+        archive.close()
+
+
+def test_just_stored_page_is_never_evicted(tmp_path, monkeypatch):
+    archive = SnapshotArchive(str(tmp_path), encoding='gzip')
+    try:
+        archive.store(random_page(1), 'BRS')
+        archive.quota_bytes = int(archive.stored_bytes() * 1.5)
+        # The clock stepped back, so the new page looks older than the one already stored
+        monkeypatch.setattr(snapshot_archive.time, 'time', lambda: 0.0)
+        digest = archive.store(random_page(2), 'BRS')
+
+        assert [entry['hash'] for entry in archive.find()] == [digest]
+        assert archive.load(digest) == random_page(2)
+    finally:
+        archive.close()
+
+
+def test_page_bigger_than_quota_is_skipped(tmp_path):
+    archive = SnapshotArchive(str(tmp_path), quota_bytes=2000, encoding='gzip')
+    try:
+        kept = archive.store(random_page(1, 500), 'BRS')
+        assert archive.store(random_page(2, 8000), 'BRS') is None
+        assert [entry['hash'] for entry in archive.find()] == [kept]
+        assert archive.stored_bytes() == archive.stats()['stored_bytes']
+    finally:
+        archive.close()
+
+
+def test_running_total_survives_reopening(tmp_path):
+    archive = SnapshotArchive(str(tmp_path), encoding='gzip')
+    archive.store(random_page(1), 'BRS')
+    archive.store(random_page(1), 'BRS')  # Same page, stored once
+    archive.store(random_page(2), 'LGW')
+    total = archive.stored_bytes()
+    archive.close()
+
+    archive = SnapshotArchive(str(tmp_path), encoding='gzip')
+    try:
+        assert archive.stored_bytes() == total == archive.stats()['stored_bytes']
+        assert archive.evict(0) == 2
+        assert archive.stored_bytes() == 0
+    finally:
+        archive.close()
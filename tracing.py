@@ -0,0 +1,141 @@
+"""
+Span tracing for EasyJet Deal Scraper
+Records timed spans with attributes and exports them in the Chrome
+trace-event format (open in chrome://tracing or https://ui.perfetto.dev)
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, Optional
+
+
+def format_attribute(value):
+    """JSON-friendly span attribute (dates as YYYY-MM-DD)"""
+    if isinstance(value, (int, float, bool, type(None))):
+        return value
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d") if value.time() == datetime.min.time() else value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def traced(name: str, *arg_names: str):
+    """Decorate a method of an object with a ``tracer`` attribute to run it in a span
+
+    The named arguments of the call are recorded as span attributes.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = self.tracer
+            if not tracer.enabled:
+                return method(self, *args, **kwargs)
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            with tracer.span(name, **{arg: arguments[arg] for arg in arg_names if arg in arguments}):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Tracer:
+    """Collects complete ('X') trace events; does nothing unless enabled"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.events = []
+        self.thread_names = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.started_at = datetime.now()
+
+    def reset(self):
+        """Discard recorded spans and restart the clock for a new run"""
+        with self.lock:
+            self.events = []
+            self.thread_names = {}
+        self.origin = time.perf_counter()
+        self.started_at = datetime.now()
+
+    def now_us(self) -> float:
+        return (time.perf_counter() - self.origin) * 1e6
+
+    @contextmanager
+    def span(self, name: str, category: str = 'scraper', **attributes):
+        """Time a block; add attributes to the yielded dict to attach them to the span"""
+        args = dict(attributes)
+        if not self.enabled:
+            yield args
+            return
+
+        stack = self.local.__dict__.setdefault('stack', [])
+        stack.append(args)
+        start = self.now_us()
+        try:
+            yield args
+        except BaseException as e:
+            args['error'] = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            stack.pop()
+            self.record(name, category, start, self.now_us() - start, args)
+
+    def annotate(self, **attributes):
+        """Attach attributes to the innermost open span on this thread"""
+        stack = getattr(self.local, 'stack', None)
+        if self.enabled and stack:
+            stack[-1].update(attributes)
+
+    def record(self, name: str, category: str, start_us: float, duration_us: float, args: Dict):
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round(start_us, 1),
+            'dur': round(duration_us, 1),
+            'pid': self.pid,
+            'tid': thread.ident,
+            'args': {key: format_attribute(value) for key, value in args.items()}
+        }
+        with self.lock:
+            self.events.append(event)
+            self.thread_names.setdefault(thread.ident, thread.name)
+
+    def to_dict(self) -> Dict:
+        """Trace document with thread-name metadata events"""
+        with self.lock:
+            events = list(self.events)
+            thread_names = dict(self.thread_names)
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                     'args': {'name': 'EasyJet Deal Scraper'}}]
+        metadata.extend({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+                        for tid, name in thread_names.items())
+        return {
+            'traceEvents': metadata + events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'started_at': self.started_at.strftime("%Y-%m-%d %H:%M:%S")}
+        }
+
+    def save(self, trace_dir: str, run_name: Optional[str] = None) -> Optional[str]:
+        """Write the trace to trace_dir/<run_name>.json and return its path"""
+        if not self.enabled:
+            return None
+        os.makedirs(trace_dir, exist_ok=True)
+        run_name = run_name or f"trace_{self.started_at.strftime('%Y%m%d_%H%M%S')}"
+        path = os.path.join(trace_dir, f"{run_name}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        return path
@@ -4,76 +4,133 @@ Web-based GUI for EasyJet Holiday Deal Scraper
 Flask web interface for configuring and running the scraper
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, Response, stream_with_context
+import argparse
 import threading
 import os
-import pandas as pd
 from datetime import datetime
 import json
+import logging
 import time
 
-from easyjet_scraper import EasyJetScraper
-from config import DEFAULT_CONFIG, AIRPORT_CODES
+from easyjet_scraper import EasyJetScraper, create_chrome_driver
+from job_manager import (JobManager, DriverPool, JobQueueFull, QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED,
+                         FINISHED_STATES)
+from results_store import ResultsStore, query_deals
+from results_summary import load_summary, format_price
+from result_downloads import (DOWNLOAD_FORMATS, available_formats, negotiate_encoding, compressed_copy,
+                              compress_chunks, stream_formatted, stream_etag, download_name)
+import metrics
+from logging_setup import configure_logging, instance_logger, log_level
+from config import DEFAULT_CONFIG, AIRPORT_CODES, JOB_MANAGER_CONFIG, WEB_SERVER_CONFIG, WEB_ASSETS
 
 app = Flask(__name__)
 app.secret_key = 'easyjet_scraper_secret_key'
 
-# Global variables for scraper state
-scraper_status = {
-    'running': False,
-    'progress': 'Ready',
-    'logs': [],
-    'last_result': None
-}
+# Open /stream connections each hold a server thread; past this limit clients poll /status
+stream_slots = threading.BoundedSemaphore(WEB_SERVER_CONFIG['max_streams'])
 
 class WebScraperLogger:
-    """Custom logger that captures messages for web display"""
-    def __init__(self):
-        self.messages = []
+    """Custom logger that captures messages for web display in a job's log"""
+    def __init__(self, job):
+        self.job = job
+        self.logger = instance_logger('web_gui.job', job=job.id)
     
     def info(self, message):
         self.add_message('INFO', message)
-        print(f"INFO: {message}")
     
     def error(self, message):
         self.add_message('ERROR', message)
-        print(f"ERROR: {message}")
     
     def warning(self, message):
         self.add_message('WARNING', message)
-        print(f"WARNING: {message}")
     
     def debug(self, message):
         self.add_message('DEBUG', message)
-        print(f"DEBUG: {message}")
     
     def add_message(self, level, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = {
-            'timestamp': timestamp,
-            'level': level,
-            'message': message
-        }
-        self.messages.append(log_entry)
-        scraper_status['logs'].append(log_entry)
-        
-        # Keep only last 100 messages
-        if len(scraper_status['logs']) > 100:
-            scraper_status['logs'] = scraper_status['logs'][-100:]
+        # The job log feeds the page; the queued logger writes scraper.log and the console
+        self.job.add_log(level, message)
+        self.logger.log(getattr(logging, level), f"[{self.job.id}] {message}")
+
+def run_scraper_job(job):
+    """Run one scrape job on a job manager worker thread"""
+    config = job.config
+    job.update(progress='Initializing scraper...')
+    
+    # Create scraper with the job's cancellation token and the shared drivers
+    scraper = EasyJetScraper(config, job.cancel_token, driver_pool)
+    
+    # Replace logger with web logger
+    web_logger = WebScraperLogger(job)
+    scraper.logger = web_logger
+    
+    # Publish structured progress (counts, percent, ETA) for the status endpoints
+    def web_progress(event):
+        job.update(progress_info=event['progress'], deals=event['progress']['deals_found'])
+    
+    scraper.progress.subscribe(web_progress)
+    
+    # Log configuration
+    web_logger.info(f"=== Starting EasyJet Deal Scraper (job {job.id}) ===")
+    web_logger.info(f"Airports: {', '.join(config['departure_airports'])}")
+    web_logger.info(f"Duration: {config['min_duration']}-{config['max_duration']} days")
+    web_logger.info(f"Price range: £{config['min_price']}-£{config['price_threshold']}")
+    web_logger.info(f"Max deals: {config['max_deals_per_search']}")
+    web_logger.info(f"Sort by price: {config['sort_by_price']}")
+    web_logger.info(f"Output: {config['output_file']}")
+    
+    job.update(progress='Running scraper...')
+    
+    # Run scraper
+    scraper.run()
+    
+    if job.cancel_token.cancelled:
+        job.update(progress='Stopped by user')
+        if os.path.exists(config['output_file']) and scraper.deals:
+            job.update(last_result=config['output_file'])
+            web_logger.info(f"⏹️ Scraping stopped. Partial results saved to: {config['output_file']}")
+    else:
+        job.update(progress='Completed successfully!', last_result=config['output_file'])
+        web_logger.info(f"✅ Scraping completed! Results saved to: {config['output_file']}")
+
+# Shared by every job: a bounded set of Chrome instances and worker threads
+driver_pool = DriverPool(JOB_MANAGER_CONFIG['driver_pool_size'],
+                         lambda: create_chrome_driver(instance_logger('web_gui.driver_pool')))
+job_manager = JobManager(run_scraper_job,
+                         max_workers=JOB_MANAGER_CONFIG['max_concurrent_jobs'],
+                         max_queued=JOB_MANAGER_CONFIG['max_queued_jobs'],
+                         history_size=JOB_MANAGER_CONFIG['job_history'])
+# Parsed results files, reloaded only when the file on disk changes
+results_store = ResultsStore()
+
+# Web GUI state exported on /metrics next to the scraper's own metrics
+JOBS_GAUGE = metrics.REGISTRY.gauge('web_scrape_jobs', 'Known scrape jobs by state', ['state'])
+DRIVER_POOL_GAUGE = metrics.REGISTRY.gauge('web_driver_pool_drivers', 'Pooled Chrome drivers by state', ['state'])
+
+def find_job(job_id=None):
+    """The job with the given id, or the most recent job if no id is given"""
+    if job_id:
+        return job_manager.get(job_id)
+    return job_manager.latest()
+
+def idle_status():
+    """Status returned before any job has been submitted"""
+    return {'job_id': None, 'state': None, 'running': False, 'progress': 'Ready',
+            'progress_info': None, 'last_result': job_manager.latest_result(),
+            'deals': 0, 'logs': [], 'cursor': 0}
 
 @app.route('/')
 def index():
     """Main page with scraper interface"""
     return render_template('index.html', 
                          airports=AIRPORT_CODES,
-                         default_config=DEFAULT_CONFIG)
+                         default_config=DEFAULT_CONFIG,
+                         finished_states=FINISHED_STATES)
 
 @app.route('/start_scraper', methods=['POST'])
 def start_scraper():
-    """Start the scraping process"""
-    if scraper_status['running']:
-        return jsonify({'error': 'Scraper is already running'}), 400
-    
+    """Queue a new scrape job"""
     try:
         # Get configuration from form
         config = DEFAULT_CONFIG.copy()
@@ -102,547 +159,296 @@ def start_scraper():
         if config['min_price'] >= config['price_threshold']:
             return jsonify({'error': 'Max price must be greater than min price'}), 400
         
-        # Clear previous logs
-        scraper_status['logs'] = []
-        scraper_status['running'] = True
-        scraper_status['progress'] = 'Starting...'
+        # Concurrent jobs must not write to the same results file
+        if config['output_file'] in job_manager.active_output_files():
+            base, ext = os.path.splitext(config['output_file'])
+            config['output_file'] = f"{base}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}{ext or '.csv'}"
         
-        # Start scraper in background thread
-        thread = threading.Thread(target=run_scraper_background, args=(config,))
-        thread.daemon = True
-        thread.start()
+        job = job_manager.submit(config)
         
-        return jsonify({'success': True, 'message': 'Scraper started successfully'})
+        return jsonify({'success': True, 'job_id': job.id,
+                        'message': f'Scraper job {job.id} queued'})
         
+    except JobQueueFull as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         return jsonify({'error': f'Failed to start scraper: {str(e)}'}), 500
 
-def run_scraper_background(config):
-    """Run scraper in background thread"""
-    try:
-        scraper_status['progress'] = 'Initializing scraper...'
-        
-        # Create scraper with custom logger
-        scraper = EasyJetScraper(config)
-        
-        # Replace logger with web logger
-        web_logger = WebScraperLogger()
-        scraper.logger = web_logger
-        
-        # Log configuration
-        web_logger.info("=== Starting EasyJet Deal Scraper ===")
-        web_logger.info(f"Airports: {', '.join(config['departure_airports'])}")
-        web_logger.info(f"Duration: {config['min_duration']}-{config['max_duration']} days")
-        web_logger.info(f"Price range: £{config['min_price']}-£{config['price_threshold']}")
-        web_logger.info(f"Max deals: {config['max_deals_per_search']}")
-        web_logger.info(f"Sort by price: {config['sort_by_price']}")
-        web_logger.info(f"Output: {config['output_file']}")
-        
-        scraper_status['progress'] = 'Running scraper...'
-        
-        # Run scraper
-        scraper.run()
-        
-        scraper_status['progress'] = 'Completed successfully!'
-        scraper_status['last_result'] = config['output_file']
-        web_logger.info(f"✅ Scraping completed! Results saved to: {config['output_file']}")
-        
-    except Exception as e:
-        scraper_status['progress'] = f'Error: {str(e)}'
-        web_logger = WebScraperLogger()
-        web_logger.error(f"Scraping failed: {str(e)}")
-    
-    finally:
-        scraper_status['running'] = False
-
 @app.route('/status')
 def get_status():
-    """Get current scraper status"""
-    return jsonify(scraper_status)
+    """Get a job's status (?job=ID, default latest); with ?since=N only newer log entries are returned"""
+    job = find_job(request.args.get('job'))
+    if job is None:
+        if request.args.get('job'):
+            return jsonify({'error': 'Job not found'}), 404
+        return jsonify(idle_status())
+    return jsonify(job.to_dict(since=request.args.get('since', type=int)))
+
+@app.route('/stream')
+def stream_status():
+    """Server-Sent Events stream of a job's new log entries and status changes"""
+    job = find_job(request.args.get('job'))
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    # EventSource reconnects to the same URL, so the Last-Event-ID it sends is newer than ?since=
+    since = request.headers.get('Last-Event-ID', type=int)
+    if since is None:
+        since = request.args.get('since', 0, type=int)
+    
+    if not stream_slots.acquire(blocking=False):
+        # EventSource gives up on an error status (unlike a closed stream), and the page polls /status
+        return jsonify({'error': 'Too many open streams, poll /status instead'}), 503, {'Retry-After': '30'}
+    
+    def generate():
+        cursor = since
+        sent = {}
+        deadline = time.monotonic() + WEB_SERVER_CONFIG['stream_seconds']
+        # When the stream ends at the deadline, the browser reconnects after this many ms
+        yield "retry: 1000\n\n"
+        while time.monotonic() < deadline:
+            logs, delta = job.wait_for_change(cursor, sent)
+            
+            for log in logs:
+                yield f"id: {log['id']}\nevent: log\ndata: {json.dumps(log)}\n\n"
+                cursor = log['id']
+            if delta:
+                sent.update(delta)
+                yield f"event: status\ndata: {json.dumps(delta)}\n\n"
+            if not logs and not delta:
+                if job.state in FINISHED_STATES:
+                    # Nothing more will happen, so tell the page not to reconnect
+                    yield "event: done\ndata: {}\n\n"
+                    return
+                yield ": keepalive\n\n"
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    response.call_on_close(stream_slots.release)
+    return response
 
 @app.route('/stop_scraper', methods=['POST'])
 def stop_scraper():
-    """Stop the scraping process"""
-    scraper_status['running'] = False
-    scraper_status['progress'] = 'Stopped by user'
-    return jsonify({'success': True, 'message': 'Scraper stopped'})
+    """Stop a job (job_id form field, default latest)"""
+    job = find_job(request.form.get('job_id') or request.args.get('job'))
+    if job is None or (not job.status['running'] and job.state != QUEUED):
+        return jsonify({'error': 'Scraper is not running'}), 400
+    
+    # The worker clears 'running' once the browser is closed
+    job_manager.cancel(job.id)
+    return jsonify({'success': True, 'job_id': job.id, 'message': 'Scraper stopping'})
+
+@app.route('/jobs')
+def list_jobs():
+    """List all known jobs, newest first"""
+    return jsonify({'jobs': [job.to_dict(include_logs=False) for job in job_manager.list_jobs()]})
+
+@app.route('/jobs/<job_id>')
+def inspect_job(job_id):
+    """Status, logs (?since=N) and result file of one job"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict(since=request.args.get('since', type=int)))
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a queued or running job"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict(include_logs=False)})
+
+@app.route('/metrics')
+def get_metrics():
+    """Scraper and job metrics in the Prometheus text format"""
+    states = {state: 0 for state in (QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED)}
+    for job in job_manager.list_jobs():
+        states[job.state] = states.get(job.state, 0) + 1
+    for state, count in states.items():
+        JOBS_GAUGE.set(count, state=state)
+    DRIVER_POOL_GAUGE.set(driver_pool.in_use, state='in_use')
+    DRIVER_POOL_GAUGE.set(len(driver_pool.idle), state='idle')
+    return Response(metrics.REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+def requested_result_file():
+    """Result file for ?job=ID, or the latest result of any job"""
+    job_id = request.args.get('job')
+    if job_id:
+        job = job_manager.get(job_id)
+        return job.status['last_result'] if job else None
+    return job_manager.latest_result()
 
 @app.route('/download_results')
 def download_results():
-    """Download the results CSV file"""
-    if scraper_status['last_result'] and os.path.exists(scraper_status['last_result']):
-        return send_file(scraper_status['last_result'], as_attachment=True)
-    else:
+    """Download results as CSV, JSON Lines or Parquet (?format=), compressed if the client accepts it"""
+    result_file = requested_result_file()
+    if not result_file or not os.path.exists(result_file):
         return jsonify({'error': 'No results file available'}), 404
+    
+    format_name = request.args.get('format', 'csv').lower()
+    if format_name not in available_formats():
+        return jsonify({'error': f"Unsupported format '{format_name}'",
+                        'formats': available_formats()}), 400
+    
+    mimetype = DOWNLOAD_FORMATS[format_name][0]
+    # Parquet pages are already compressed
+    encoding = 'identity' if format_name == 'parquet' else negotiate_encoding(request.headers.get('Accept-Encoding'))
+    
+    if format_name == 'csv':
+        # A file on disk gets ETag/If-None-Match and Range handling from send_file
+        path = result_file if encoding == 'identity' else compressed_copy(result_file, encoding)
+        response = send_file(path, mimetype=mimetype, as_attachment=True,
+                             download_name=download_name(result_file, format_name),
+                             conditional=True, etag=True, max_age=0)
+    else:
+        etag = stream_etag(result_file, format_name, encoding)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            chunks = compress_chunks(stream_formatted(result_file, format_name), encoding)
+            response = Response(stream_with_context(chunks), mimetype=mimetype)
+            response.headers['Content-Disposition'] = \
+                f'attachment; filename="{download_name(result_file, format_name)}"'
+        # Converted streams have no fixed length, so ranges aren't offered
+        response.headers['Accept-Ranges'] = 'none'
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+    
+    if encoding != 'identity' and response.status_code != 304:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 @app.route('/view_results')
 def view_results():
-    """View results in a table"""
-    if not scraper_status['last_result'] or not os.path.exists(scraper_status['last_result']):
+    """View results in a server-side paginated table"""
+    result_file = requested_result_file()
+    if not result_file or not os.path.exists(result_file):
         return render_template('no_results.html')
     
     try:
-        df = pd.read_csv(scraper_status['last_result'])
-        
-        # Convert to HTML table
-        results_html = df.to_html(classes='table table-striped table-hover', 
-                                 table_id='results-table', 
-                                 escape=False, 
-                                 index=False)
-        
-        # Calculate summary stats
-        total_deals = len(df)
-        
-        # Extract numeric prices for stats
-        prices = df['total_price'].str.replace('£', '').str.replace(',', '').astype(float)
-        min_price = prices.min()
-        max_price = prices.max()
-        avg_price = prices.mean()
-        
-        destinations = df['destination'].nunique()
-        
+        # Precomputed by the scraper; only rebuilt if the CSV changed since
+        stats = load_summary(result_file)
         summary = {
-            'total_deals': total_deals,
-            'min_price': f"£{min_price:.0f}",
-            'max_price': f"£{max_price:.0f}",
-            'avg_price': f"£{avg_price:.0f}",
-            'destinations': destinations,
-            'filename': scraper_status['last_result']
+            'total_deals': stats['deals'],
+            'min_price': format_price(stats['min_price']),
+            'max_price': format_price(stats['max_price']),
+            'avg_price': format_price(stats['avg_price']),
+            'destinations': stats['destination_count'],
+            'filename': result_file
         }
-        
-        return render_template('results.html', 
-                             results_table=results_html,
-                             summary=summary)
+        cheapest = sorted(stats['destinations'].items(),
+                          key=lambda item: (item[1]['min_price'] is None, item[1]['min_price'] or 0))
+        return render_template('results.html',
+                             summary=summary,
+                             job_id=request.args.get('job', ''),
+                             cheapest_destinations=[(name, format_price(s['min_price']), s['deals'])
+                                                    for name, s in cheapest[:10]],
+                             airport_breakdown=[(name, format_price(s['min_price']), s['deals'])
+                                                for name, s in stats['airports'].items()],
+                             airports=list(stats['airports']),
+                             board_types=list(stats['board_types']),
+                             download_formats=available_formats())
         
     except Exception as e:
         return render_template('error.html', error=f"Error loading results: {str(e)}")
 
-# Create templates directory and files
-def create_templates():
-    """Create HTML templates for the web interface"""
-    os.makedirs('templates', exist_ok=True)
-    
-    # Main index template
-    index_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>EasyJet Holiday Deal Scraper</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <style>
-        .log-container { height: 300px; overflow-y: auto; background: #f8f9fa; border: 1px solid #dee2e6; padding: 10px; }
-        .log-entry { margin-bottom: 5px; font-family: monospace; font-size: 0.9em; }
-        .log-info { color: #0066cc; }
-        .log-error { color: #dc3545; }
-        .log-warning { color: #fd7e14; }
-        .log-success { color: #198754; }
-        .airport-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px; }
-    </style>
-</head>
-<body>
-    <div class="container mt-4">
-        <div class="row">
-            <div class="col-12">
-                <h1 class="text-center mb-4">🛫 EasyJet Holiday Deal Scraper</h1>
-                
-                <form id="scraperForm">
-                    <!-- Airport Selection -->
-                    <div class="card mb-4">
-                        <div class="card-header">
-                            <h5>Departure Airports</h5>
-                        </div>
-                        <div class="card-body">
-                            <div class="airport-grid">
-                                {% for airport, code in airports.items() %}
-                                <div class="form-check">
-                                    <input class="form-check-input" type="checkbox" name="airports" value="{{ airport }}" 
-                                           id="airport_{{ loop.index }}" {% if airport == 'Bristol' %}checked{% endif %}>
-                                    <label class="form-check-label" for="airport_{{ loop.index }}">
-                                        {{ airport }} ({{ code }})
-                                    </label>
-                                </div>
-                                {% endfor %}
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Configuration -->
-                    <div class="card mb-4">
-                        <div class="card-header">
-                            <h5>Search Configuration</h5>
-                        </div>
-                        <div class="card-body">
-                            <div class="row">
-                                <div class="col-md-3">
-                                    <label class="form-label">Min Duration (days)</label>
-                                    <input type="number" class="form-control" name="min_duration" value="7" min="1" max="30">
-                                </div>
-                                <div class="col-md-3">
-                                    <label class="form-label">Max Duration (days)</label>
-                                    <input type="number" class="form-control" name="max_duration" value="14" min="1" max="30">
-                                </div>
-                                <div class="col-md-3">
-                                    <label class="form-label">Min Price (£)</label>
-                                    <input type="number" class="form-control" name="min_price" value="100" min="50" max="5000">
-                                </div>
-                                <div class="col-md-3">
-                                    <label class="form-label">Max Price (£)</label>
-                                    <input type="number" class="form-control" name="max_price" value="2000" min="100" max="10000">
-                                </div>
-                            </div>
-                            <div class="row mt-3">
-                                <div class="col-md-4">
-                                    <label class="form-label">Max Deals per Search</label>
-                                    <input type="number" class="form-control" name="max_deals" value="50" min="10" max="200">
-                                </div>
-                                <div class="col-md-4">
-                                    <label class="form-label">Months Ahead</label>
-                                    <input type="number" class="form-control" name="months_ahead" value="6" min="1" max="12">
-                                </div>
-                                <div class="col-md-4">
-                                    <label class="form-label">Output File</label>
-                                    <input type="text" class="form-control" name="output_file" value="easyjet_deals.csv">
-                                </div>
-                            </div>
-                            <div class="row mt-3">
-                                <div class="col-md-6">
-                                    <div class="form-check">
-                                        <input class="form-check-input" type="checkbox" name="sort_by_price" checked>
-                                        <label class="form-check-label">Sort by lowest price first</label>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Control Buttons -->
-                    <div class="text-center mb-4">
-                        <button type="submit" class="btn btn-primary btn-lg me-3" id="startBtn">
-                            🚀 Start Scraping
-                        </button>
-                        <button type="button" class="btn btn-danger me-3" id="stopBtn" disabled>
-                            ⏹️ Stop
-                        </button>
-                        <a href="/view_results" class="btn btn-success me-3">
-                            📊 View Results
-                        </a>
-                        <button type="button" class="btn btn-secondary" id="clearLogBtn">
-                            🗑️ Clear Log
-                        </button>
-                    </div>
-                </form>
-                
-                <!-- Status -->
-                <div class="card mb-4">
-                    <div class="card-header d-flex justify-content-between align-items-center">
-                        <h5>Status</h5>
-                        <span id="statusBadge" class="badge bg-secondary">Ready</span>
-                    </div>
-                    <div class="card-body">
-                        <div class="progress mb-3">
-                            <div class="progress-bar" id="progressBar" role="progressbar" style="width: 0%"></div>
-                        </div>
-                        <p id="statusText">Ready to start scraping</p>
-                    </div>
-                </div>
-                
-                <!-- Log Output -->
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Log Output</h5>
-                    </div>
-                    <div class="card-body">
-                        <div id="logContainer" class="log-container"></div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        let statusInterval;
-        
-        document.getElementById('scraperForm').addEventListener('submit', function(e) {
-            e.preventDefault();
-            startScraper();
-        });
-        
-        document.getElementById('stopBtn').addEventListener('click', stopScraper);
-        document.getElementById('clearLogBtn').addEventListener('click', clearLog);
-        
-        function startScraper() {
-            const formData = new FormData(document.getElementById('scraperForm'));
-            
-            fetch('/start_scraper', {
-                method: 'POST',
-                body: formData
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    document.getElementById('startBtn').disabled = true;
-                    document.getElementById('stopBtn').disabled = false;
-                    startStatusUpdates();
-                } else {
-                    alert('Error: ' + data.error);
-                }
-            })
-            .catch(error => {
-                alert('Error starting scraper: ' + error);
-            });
-        }
-        
-        function stopScraper() {
-            fetch('/stop_scraper', { method: 'POST' })
-            .then(response => response.json())
-            .then(data => {
-                document.getElementById('startBtn').disabled = false;
-                document.getElementById('stopBtn').disabled = true;
-                stopStatusUpdates();
-            });
-        }
-        
-        function startStatusUpdates() {
-            statusInterval = setInterval(updateStatus, 1000);
-        }
-        
-        function stopStatusUpdates() {
-            if (statusInterval) {
-                clearInterval(statusInterval);
-            }
-        }
-        
-        function updateStatus() {
-            fetch('/status')
-            .then(response => response.json())
-            .then(data => {
-                // Update status text
-                document.getElementById('statusText').textContent = data.progress;
-                
-                // Update status badge
-                const badge = document.getElementById('statusBadge');
-                if (data.running) {
-                    badge.className = 'badge bg-primary';
-                    badge.textContent = 'Running';
-                    document.getElementById('progressBar').style.width = '100%';
-                    document.getElementById('progressBar').className = 'progress-bar progress-bar-striped progress-bar-animated';
-                } else {
-                    badge.className = 'badge bg-secondary';
-                    badge.textContent = 'Ready';
-                    document.getElementById('progressBar').style.width = '0%';
-                    document.getElementById('progressBar').className = 'progress-bar';
-                    document.getElementById('startBtn').disabled = false;
-                    document.getElementById('stopBtn').disabled = true;
-                    stopStatusUpdates();
-                }
-                
-                // Update logs
-                const logContainer = document.getElementById('logContainer');
-                logContainer.innerHTML = '';
-                data.logs.forEach(log => {
-                    const logEntry = document.createElement('div');
-                    logEntry.className = `log-entry log-${log.level.toLowerCase()}`;
-                    logEntry.textContent = `[${log.timestamp}] ${log.level}: ${log.message}`;
-                    logContainer.appendChild(logEntry);
-                });
-                
-                // Auto-scroll to bottom
-                logContainer.scrollTop = logContainer.scrollHeight;
-            });
-        }
-        
-        function clearLog() {
-            document.getElementById('logContainer').innerHTML = '';
-        }
-        
-        // Start status updates on page load
-        updateStatus();
-    </script>
-</body>
-</html>
-    '''
-    
-    # Results template
-    results_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Scraper Results - EasyJet Deal Scraper</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdn.datatables.net/1.11.5/css/dataTables.bootstrap5.min.css" rel="stylesheet">
-</head>
-<body>
-    <div class="container mt-4">
-        <div class="row">
-            <div class="col-12">
-                <h1 class="text-center mb-4">📊 Scraping Results</h1>
-                
-                <!-- Summary Cards -->
-                <div class="row mb-4">
-                    <div class="col-md-2">
-                        <div class="card text-center">
-                            <div class="card-body">
-                                <h5 class="card-title">{{ summary.total_deals }}</h5>
-                                <p class="card-text">Total Deals</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card text-center">
-                            <div class="card-body">
-                                <h5 class="card-title">{{ summary.min_price }}</h5>
-                                <p class="card-text">Lowest Price</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card text-center">
-                            <div class="card-body">
-                                <h5 class="card-title">{{ summary.max_price }}</h5>
-                                <p class="card-text">Highest Price</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card text-center">
-                            <div class="card-body">
-                                <h5 class="card-title">{{ summary.avg_price }}</h5>
-                                <p class="card-text">Average Price</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card text-center">
-                            <div class="card-body">
-                                <h5 class="card-title">{{ summary.destinations }}</h5>
-                                <p class="card-text">Destinations</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card text-center">
-                            <div class="card-body">
-                                <a href="/download_results" class="btn btn-success btn-sm">📥 Download CSV</a>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Navigation -->
-                <div class="mb-3">
-                    <a href="/" class="btn btn-primary">← Back to Scraper</a>
-                    <a href="/download_results" class="btn btn-success">📥 Download CSV</a>
-                </div>
-                
-                <!-- Results Table -->
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Holiday Deals ({{ summary.filename }})</h5>
-                    </div>
-                    <div class="card-body">
-                        <div class="table-responsive">
-                            {{ results_table|safe }}
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script src="https://cdn.datatables.net/1.11.5/js/jquery.dataTables.min.js"></script>
-    <script src="https://cdn.datatables.net/1.11.5/js/dataTables.bootstrap5.min.js"></script>
-    <script>
-        $(document).ready(function() {
-            $('#results-table').DataTable({
-                "pageLength": 25,
-                "order": [[ 8, "asc" ]], // Sort by total_price column
-                "columnDefs": [
-                    { "width": "15%", "targets": 1 }, // destination
-                    { "width": "10%", "targets": 8 }, // total_price
-                    { "width": "10%", "targets": 9 }  // price_per_person
-                ]
-            });
-        });
-    </script>
-</body>
-</html>
-    '''
-    
-    # No results template
-    no_results_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>No Results - EasyJet Deal Scraper</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-</head>
-<body>
-    <div class="container mt-4">
-        <div class="row justify-content-center">
-            <div class="col-md-6 text-center">
-                <h1>📭 No Results Available</h1>
-                <p class="lead">No scraping results found. Please run the scraper first.</p>
-                <a href="/" class="btn btn-primary">← Back to Scraper</a>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-    '''
+def float_arg(name):
+    """Optional numeric query parameter"""
+    value = request.args.get(name, '').replace('£', '').replace(',', '').strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+@app.route('/api/deals')
+def api_deals():
+    """Paginated, sorted and filtered deals from a results file"""
+    result_file = requested_result_file()
+    if not result_file or not os.path.exists(result_file):
+        return jsonify({'error': 'No results file available'}), 404
     
-    # Error template
-    error_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Error - EasyJet Deal Scraper</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-</head>
-<body>
-    <div class="container mt-4">
-        <div class="row justify-content-center">
-            <div class="col-md-6 text-center">
-                <h1>❌ Error</h1>
-                <div class="alert alert-danger">{{ error }}</div>
-                <a href="/" class="btn btn-primary">← Back to Scraper</a>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-    '''
+    try:
+        dataset = results_store.get(result_file)
+    except Exception as e:
+        return jsonify({'error': f"Error loading results: {str(e)}"}), 500
     
-    # Write templates to files
-    with open('templates/index.html', 'w') as f:
-        f.write(index_html)
+    filters = {
+        'airport': request.args.get('airport'),
+        'destination': request.args.get('destination'),
+        'board_type': request.args.get('board_type'),
+        'date_from': request.args.get('date_from'),
+        'date_to': request.args.get('date_to'),
+        'min_price': float_arg('min_price'),
+        'max_price': float_arg('max_price'),
+        'search': request.args.get('q')
+    }
+    page = query_deals(dataset, filters,
+                       sort=request.args.get('sort', 'total_price'),
+                       descending=request.args.get('order', 'asc').lower() == 'desc',
+                       offset=request.args.get('offset', 0, type=int),
+                       limit=request.args.get('limit', 25, type=int))
+    return jsonify(page)
+
+def asset_url(name):
+    """Local copy of a front-end library if fetch_static_assets.py has downloaded it, else its CDN URL"""
+    if os.path.exists(os.path.join(app.static_folder, 'vendor', name)):
+        return url_for('static', filename=f'vendor/{name}')
+    return WEB_ASSETS[name]
+
+app.jinja_env.globals['asset_url'] = asset_url
+
+def serve_production(host, port, threads):
+    """Serve with waitress's fixed thread pool, or Werkzeug's threaded server if waitress is missing"""
+    try:
+        from waitress import serve
+    except ImportError:
+        from werkzeug.serving import make_server
+        print("⚠️  waitress is not installed (pip install waitress); using Werkzeug's threaded server")
+        make_server(host, port, app, threaded=True).serve_forever()
+        return
     
-    with open('templates/results.html', 'w') as f:
-        f.write(results_html)
+    serve(app, host=host, port=port, threads=threads,
+          connection_limit=WEB_SERVER_CONFIG['connection_limit'],
+          channel_timeout=WEB_SERVER_CONFIG['channel_timeout'],
+          ident='easyjet-deal-scraper')
+
+def main():
+    """Start the web GUI on Flask's development server or, with --production, a WSGI server"""
+    parser = argparse.ArgumentParser(description='EasyJet Deal Scraper Web GUI')
+    parser.add_argument('--production', action='store_true',
+                       help='Serve with a multi-threaded WSGI server (waitress) instead of the Flask dev server')
+    parser.add_argument('--host', default=WEB_SERVER_CONFIG['host'], help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=WEB_SERVER_CONFIG['port'], help='Port to listen on')
+    parser.add_argument('--threads', type=int, default=WEB_SERVER_CONFIG['threads'],
+                       help='Worker threads in production mode')
+    parser.add_argument('--log-level', type=log_level, default=None,
+                       help='Log level for scraper.log and the console (e.g. DEBUG)')
+    args = parser.parse_args()
     
-    with open('templates/no_results.html', 'w') as f:
-        f.write(no_results_html)
+    configure_logging({'level': args.log_level} if args.log_level else None)
     
-    with open('templates/error.html', 'w') as f:
-        f.write(error_html)
-
-if __name__ == '__main__':
-    # Create templates
-    create_templates()
+    # Templates are shipped in templates/ next to this file
+    templates_dir = os.path.join(app.root_path, app.template_folder)
+    if not os.path.exists(os.path.join(templates_dir, 'index.html')):
+        print(f"❌ Templates not found in {templates_dir}")
+        return
     
     print("🚀 Starting EasyJet Deal Scraper Web GUI...")
-    print("📱 Open your browser and go to: http://localhost:8000")
+    print(f"📱 Open your browser and go to: http://localhost:{args.port}")
     print("⏹️  Press Ctrl+C to stop the server")
     
-    # Run Flask app
-    app.run(host='0.0.0.0', port=8000, debug=False)
+    if args.production:
+        global stream_slots
+        max_streams = max(1, min(WEB_SERVER_CONFIG['max_streams'], args.threads // 2))
+        stream_slots = threading.BoundedSemaphore(max_streams)
+        print(f"🏭 Production mode: {args.threads} worker threads, at most {max_streams} live log streams")
+        serve_production(args.host, args.port, args.threads)
+    else:
+        app.run(host=args.host, port=args.port, debug=False, threaded=True)
+
+if __name__ == '__main__':
+    main()